@@ -5,4 +5,5 @@
 
 主要模块:
 - bubble_sort: 冒泡排序算法模块
+- sort_pipeline: 排序流水线模块（有界前瞻缓冲区）
 """
\ No newline at end of file
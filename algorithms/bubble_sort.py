@@ -8,6 +8,10 @@
 - BubbleSort类: 冒泡排序算法实现
 - 支持逐步执行和状态跟踪
 - 提供回调函数接口用于动画集成
+- 排序步骤由流水线在前瞻缓冲区中提前生产，每次step()消费一步
+- 安静模式只更新顺序和统计，不调用回调也不移动图形（用于快速播放）
+- 关闭图形移动后交换只更新顺序，鸭子的位置完全由交换动画负责
+  （排序步骤提前于动画执行时，鸭子不会在动画开始前跳到新位置）
 
 主要类:
 - BubbleSort: 冒泡排序算法类
@@ -16,29 +20,41 @@
 from typing import List, Optional, Tuple, Callable
 import time
 from src.logger import get_logger, log_sort_step
+from algorithms.sort_pipeline import SortPipeline, SortStep, StepKind, bubble_sort_steps
 
 
 class BubbleSort:
     """冒泡排序算法类，封装排序逻辑和状态管理"""
     
-    def __init__(self, ducks: List):
+    def __init__(self, ducks: List, lookahead: int = SortPipeline.DEFAULT_LOOKAHEAD):
         """
         初始化冒泡排序算法
         
         Args:
-            ducks: 鸭子对象列表，每个鸭子必须有value属性
+            ducks: 鸭子对象列表，每个鸭子必须有value属性（可以是不带画布的DuckModel）
+            lookahead: 排序流水线最多提前生产的步数
         """
         self.logger = get_logger()
         self.logger.info(f"初始化冒泡排序算法，鸭子数量: {len(ducks)}")
         
         self.ducks = ducks
         self.n = len(ducks)
+        # 与鸭子列表顺序一致的数值缓存，比较时不再逐个读取鸭子的属性
+        self.values = [duck.value for duck in ducks]
+        
+        # 排序流水线：在数值副本上提前生产排序步骤
+        self.lookahead = lookahead
+        self.pipeline = self._create_pipeline()
         
         # 排序状态
         self.i = 0  # 外层循环索引
         self.j = 0  # 内层循环索引
         self.completed = False  # 排序是否完成
         self.paused = False  # 是否暂停
+        # 安静模式：不调用回调，交换时只更新列表顺序、数值和统计，不移动鸭子的图形
+        self.quiet = False
+        # 交换时是否立即把鸭子的图形移动到新位置（由动画负责移动时关闭）
+        self.move_graphics = True
         
         # 状态跟踪
         self.current_comparison = (-1, -1)  # 当前比较的两个鸭子索引
@@ -56,8 +72,7 @@ class BubbleSort:
         self.history = []  # 记录每一步的操作
         
         # 记录初始状态
-        initial_values = [duck.value for duck in ducks]
-        self.logger.info(f"初始鸭子值序列: {initial_values}")
+        self.logger.info(f"初始鸭子值序列: {self.values}")
         
     def step(self) -> bool:
         """
@@ -78,49 +93,73 @@ class BubbleSort:
         self.current_comparison = (-1, -1)
         self.current_swap = (-1, -1)
         
-        # 执行冒泡排序的一步
-        if self.i < self.n - 1:
-            if self.j < self.n - self.i - 1:
-                # 比较相邻的两个鸭子
-                self.current_comparison = (self.j, self.j + 1)
-                self.comparisons_count += 1
-                
-                # 调用比较回调（捕获异常）
-                if self.on_compare:
-                    try:
-                        self.on_compare(self.j, self.j + 1)
-                    except Exception:
-                        # 忽略回调异常，继续执行
-                        pass
-                
-                # 记录历史
-                self.history.append({
-                    'type': 'compare',
-                    'indices': (self.j, self.j + 1),
-                    'values': (self.ducks[self.j].value, self.ducks[self.j + 1].value)
-                })
-                
-                # 如果前一个鸭子比后一个鸭子大，则交换
-                if self.ducks[self.j].value > self.ducks[self.j + 1].value:
-                    self._swap_ducks(self.j, self.j + 1)
-                
-                self.j += 1
-                return True
-            else:
-                # 内层循环完成，标记最后一个元素为已排序
-                self.sorted_indices.append(self.n - self.i - 1)
-                self.i += 1
-                self.j = 0
-                
-                # 如果所有元素都已排序
-                if self.i >= self.n - 1:
-                    self._complete_sort()
-                    return False  # 🔧 修复：排序完成后应返回False
-                
-                return True
-        else:
+        # 从流水线取出下一步（已在数值副本上提前算好）
+        step = self.pipeline.take()
+        if step is None:
             self._complete_sort()
             return False
+        
+        if step.kind == StepKind.COMPARE:
+            index1, index2 = step.index1, step.index2
+            values = self.values
+            # 比较相邻的两个鸭子
+            self.current_comparison = (index1, index2)
+            self.comparisons_count += 1
+            
+            # 调用比较回调（捕获异常）
+            if self.on_compare and not self.quiet:
+                try:
+                    self.on_compare(index1, index2)
+                except Exception:
+                    # 忽略回调异常，继续执行
+                    pass
+            
+            # 记录历史
+            self.history.append({
+                'type': 'compare',
+                'indices': (index1, index2),
+                'values': (values[index1], values[index2])
+            })
+            
+            # 如果前一个鸭子比后一个鸭子大，则交换
+            if step.swap:
+                if self.quiet:
+                    self._swap_quietly(index1, index2)
+                else:
+                    self._swap_ducks(index1, index2)
+            
+            self.j += 1
+            return True
+        
+        # 内层循环完成，标记最后一个元素为已排序
+        self.sorted_indices.append(step.index1)
+        self.i += 1
+        self.j = 0
+        
+        # 如果所有元素都已排序
+        if self.i >= self.n - 1:
+            self._complete_sort()
+            return False  # 🔧 修复：排序完成后应返回False
+        
+        return True
+    
+    def _create_pipeline(self) -> SortPipeline:
+        """按当前的数值序列创建排序流水线"""
+        return SortPipeline(bubble_sort_steps(self.values), self.lookahead)
+    
+    def peek_step(self, offset: int = 0) -> Optional[SortStep]:
+        """
+        预先查看之后的排序步骤而不执行
+        
+        Args:
+            offset: 相对于下一步的偏移
+            
+        Returns:
+            Optional[SortStep]: 对应的排序步骤，没有更多步骤时为None
+        """
+        if self.completed:
+            return None
+        return self.pipeline.peek(offset)
     
     def _swap_ducks(self, index1: int, index2: int) -> None:
         """
@@ -161,8 +200,14 @@ class BubbleSort:
                 # 忽略回调异常，继续执行
                 pass
 
-        # 执行列表中的位置交换
+        # 执行列表中的位置交换（数值缓存同步交换）
         self.ducks[index1], self.ducks[index2] = duck2, duck1
+        self.values[index1], self.values[index2] = self.values[index2], self.values[index1]
+
+        if not self.move_graphics:
+            # 鸭子的位置由交换动画负责，这里只验证列表顺序
+            self._validate_consistency(index1, index2, duck1, duck2)
+            return
 
         # 更新鸭子的图形位置（确保鸭子移动到正确位置）
         if hasattr(duck1, 'move_to') and hasattr(duck2, 'move_to'):
@@ -182,6 +227,27 @@ class BubbleSort:
         # 额外的一致性验证
         self._validate_consistency(index1, index2, duck1, duck2)
 
+    def _swap_quietly(self, index1: int, index2: int) -> None:
+        """
+        安静模式下交换两个鸭子：只交换列表顺序和数值缓存并更新统计，
+        鸭子的图形位置由调用方统一提交
+
+        Args:
+            index1: 第一个鸭子的索引
+            index2: 第二个鸭子的索引
+        """
+        self.current_swap = (index1, index2)
+        self.swaps_count += 1
+        ducks = self.ducks
+        values = self.values
+        self.history.append({
+            'type': 'swap',
+            'indices': (index1, index2),
+            'values': (values[index1], values[index2])
+        })
+        ducks[index1], ducks[index2] = ducks[index2], ducks[index1]
+        values[index1], values[index2] = values[index2], values[index1]
+
     def _validate_consistency(self, index1: int, index2: int, original_duck1, original_duck2):
         """
         验证交换后数据的一致性
@@ -202,8 +268,8 @@ class BubbleSort:
         if actual_duck2.value != original_duck1.value:
             self.logger.error(f"列表交换错误: 位置{index2}的鸭子值应该是{original_duck1.value}，但实际是{actual_duck2.value}")
 
-        # 验证鸭子对象的图形位置是否与列表中的位置一致
-        if hasattr(actual_duck1, 'x') and hasattr(actual_duck2, 'x'):
+        # 验证鸭子对象的图形位置是否与列表中的位置一致（由动画移动图形时位置稍后才更新）
+        if self.move_graphics and hasattr(actual_duck1, 'x') and hasattr(actual_duck2, 'x'):
             # 检查实际位置是否与预期一致
             expected_pos1_x = original_duck2.x  # 由于交换，duck1现在应该是原来duck2的位置
             expected_pos2_x = original_duck1.x  # 由于交换，duck2现在应该是原来duck1的位置
@@ -220,12 +286,11 @@ class BubbleSort:
         self.sorted_indices = list(range(self.n))  # 所有元素都已排序
         
         # 记录完成日志
-        final_values = [duck.value for duck in self.ducks]
-        self.logger.info(f"排序完成！最终序列: {final_values}")
+        self.logger.info(f"排序完成！最终序列: {self.values}")
         self.logger.info(f"总比较次数: {self.comparisons_count}, 总交换次数: {self.swaps_count}")
         
-        # 调用完成回调（捕获异常）
-        if self.on_complete:
+        # 调用完成回调（捕获异常，安静模式下由调用方处理完成）
+        if self.on_complete and not self.quiet:
             try:
                 self.on_complete()
             except Exception as e:
@@ -251,9 +316,14 @@ class BubbleSort:
         self.comparisons_count = 0
         self.swaps_count = 0
         self.history = []
+        self.pipeline = self._create_pipeline()
         
         # 重置所有鸭子的状态
         for duck in self.ducks:
+            if hasattr(duck, 'set_state'):
+                # 一次清除所有状态，只更新一次外观
+                duck.set_state(highlighted=False, comparing=False, sorted=False)
+                continue
             if hasattr(duck, 'set_sorted'):
                 duck.set_sorted(False)
             if hasattr(duck, 'set_comparing'):
@@ -261,6 +331,19 @@ class BubbleSort:
             if hasattr(duck, 'highlight'):
                 duck.highlight(False)
     
+    def rebind(self, ducks: List) -> None:
+        """
+        绑定新的鸭子列表并重置排序状态（保留已设置的回调函数）
+        
+        Args:
+            ducks: 鸭子对象列表，每个鸭子必须有value属性
+        """
+        self.ducks = ducks
+        self.n = len(ducks)
+        self.values = [duck.value for duck in ducks]
+        self.reset()
+        self.logger.info(f"重新绑定鸭子，新的鸭子值序列: {self.values}")
+    
     def is_completed(self) -> bool:
         """检查排序是否完成"""
         return self.completed
@@ -343,11 +426,12 @@ class BubbleSort:
     
     def get_duck_values(self) -> List[int]:
         """获取当前鸭子值的列表"""
-        return [duck.value for duck in self.ducks]
+        return list(self.values)
     
     def is_sorted(self) -> bool:
         """检查鸭子列表是否已排序"""
-        for i in range(len(self.ducks) - 1):
-            if self.ducks[i].value > self.ducks[i + 1].value:
+        values = self.values
+        for i in range(len(values) - 1):
+            if values[i] > values[i + 1]:
                 return False
         return True
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 排序流水线模块
+
+该模块把排序算法拆成生产者和消费者两段：生产者在数值的私有副本上
+运行冒泡排序，把每一步（比较及是否交换、一轮结束）作为事件写入有界
+的前瞻缓冲区；消费者（BubbleSort和动画）按自己的节奏逐个取出事件并
+应用。缓冲区满时生产者停止（背压），缓冲区降到一半时一次补满，生产者
+的开销与逐步消费解耦。消费者可以预先查看后面的事件，用于规划和合并。
+
+主要功能:
+- StepKind: 排序事件类型枚举
+- SortStep: 排序事件类
+- bubble_sort_steps: 在数值副本上运行冒泡排序并逐步产生事件
+- SortPipeline: 排序流水线类，有界的前瞻缓冲区
+
+主要类:
+- StepKind: 排序事件类型枚举
+- SortStep: 排序事件类
+- SortPipeline: 排序流水线类
+
+主要函数:
+- bubble_sort_steps: 冒泡排序事件生成函数
+"""
+
+from collections import deque
+from enum import Enum
+from typing import Deque, Iterator, List, Optional
+
+
+class StepKind(Enum):
+    """排序事件类型枚举"""
+    COMPARE = "compare"    # 比较相邻的两个元素（可能随后交换）
+    PASS_END = "pass_end"  # 一轮结束，末尾的元素已排好
+
+
+class SortStep:
+    """排序事件类，对应BubbleSort.step()的一次调用"""
+
+    __slots__ = ('kind', 'index1', 'index2', 'swap')
+
+    def __init__(self, kind: StepKind, index1: int = -1, index2: int = -1, swap: bool = False):
+        """
+        初始化排序事件
+
+        Args:
+            kind: 事件类型
+            index1: 比较的第一个索引；一轮结束时为已排好的元素索引
+            index2: 比较的第二个索引（一轮结束时为-1）
+            swap: 比较之后是否交换
+        """
+        self.kind = kind
+        self.index1 = index1
+        self.index2 = index2
+        self.swap = swap
+
+    def __repr__(self) -> str:
+        return "SortStep({}, {}, {}, swap={})".format(self.kind.value, self.index1, self.index2, self.swap)
+
+
+def bubble_sort_steps(values: List) -> Iterator[SortStep]:
+    """
+    在数值的私有副本上运行冒泡排序，逐步产生排序事件
+
+    Args:
+        values: 待排序的数值列表（不会被修改）
+
+    Yields:
+        SortStep: 排序事件
+    """
+    values = list(values)
+    n = len(values)
+    for i in range(n - 1):
+        for j in range(n - i - 1):
+            swap = values[j] > values[j + 1]
+            if swap:
+                values[j], values[j + 1] = values[j + 1], values[j]
+            yield SortStep(StepKind.COMPARE, j, j + 1, swap)
+        yield SortStep(StepKind.PASS_END, n - i - 1)
+
+
+class SortPipeline:
+    """排序流水线类，生产者和消费者之间有界的前瞻缓冲区"""
+
+    # 默认最多提前生产的步数
+    DEFAULT_LOOKAHEAD = 64
+
+    def __init__(self, steps: Iterator[SortStep], lookahead: int = DEFAULT_LOOKAHEAD):
+        """
+        初始化排序流水线
+
+        Args:
+            steps: 排序事件的生产者（如bubble_sort_steps返回的迭代器）
+            lookahead: 缓冲区容量，即生产者最多领先消费者的步数
+        """
+        self._steps = steps
+        self.lookahead = max(1, lookahead)
+        self._buffer: Deque[SortStep] = deque()
+        self._exhausted = False  # 生产者是否已经产生了全部事件
+        self.produced_count = 0
+        self.consumed_count = 0
+
+    def fill(self) -> int:
+        """
+        让生产者把缓冲区补满（缓冲区已满时不生产，即背压）
+
+        Returns:
+            int: 本次生产的事件数量
+        """
+        produced = 0
+        buffer = self._buffer
+        while not self._exhausted and len(buffer) < self.lookahead:
+            step = next(self._steps, None)
+            if step is None:
+                self._exhausted = True
+                break
+            buffer.append(step)
+            produced += 1
+        self.produced_count += produced
+        return produced
+
+    def take(self) -> Optional[SortStep]:
+        """
+        取出下一个事件（缓冲区降到一半时先一次补满）
+
+        Returns:
+            Optional[SortStep]: 下一个事件，排序已全部完成时为None
+        """
+        if len(self._buffer) <= self.lookahead // 2:
+            self.fill()
+        if not self._buffer:
+            return None
+        self.consumed_count += 1
+        return self._buffer.popleft()
+
+    def peek(self, offset: int = 0) -> Optional[SortStep]:
+        """
+        预先查看之后的事件而不取出
+
+        Args:
+            offset: 相对于下一个事件的偏移（必须小于缓冲区容量）
+
+        Returns:
+            Optional[SortStep]: 对应的事件，超出剩余事件数量时为None
+        """
+        if offset >= len(self._buffer):
+            self.fill()
+        if 0 <= offset < len(self._buffer):
+            return self._buffer[offset]
+        return None
+
+    def get_buffered_count(self) -> int:
+        """获取缓冲区中已生产但尚未消费的事件数量"""
+        return len(self._buffer)
+
+    def is_exhausted(self) -> bool:
+        """检查是否所有事件都已被消费"""
+        return self._exhausted and not self._buffer
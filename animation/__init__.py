@@ -6,5 +6,10 @@
 主要模块:
 - animation_engine: 动画引擎模块
 - animators: 动画器模块
+- display_list: 显示列表模块
+- easing: 缓动与路径查找表模块
+- engine_metrics: 引擎性能统计模块
+- group_motion: 群体运动动画模块
 - sort_animation_integration: 排序动画集成模块
+- trajectories: 交换轨迹模块
 """
\ No newline at end of file
@@ -9,11 +9,20 @@
 - AnimationType: 动画类型枚举
 - Animation: 动画基类
 - AnimationEngine: 动画引擎类，管理动画队列和播放控制
+- RealClock / VirtualClock: 可注入的时钟，支持无界面、快于实时的确定性回放
+- BacklogPolicy: 积压策略，在队列过深或显示滞后时合并动画以限制延迟
+- AnimationPool: 动画对象池，回收已完成的动画，配合参数化更新函数避免每步创建闭包
+- 性能统计: 记录帧时间、掉帧、队列深度和回调耗时（见engine_metrics模块）
+- 显示列表: 动画只写入目标位置和状态，每帧末统一提交到画布（见display_list模块）
 
 主要类:
 - AnimationState: 动画状态枚举
 - AnimationType: 动画类型枚举
-- Animation: 动画基类
+- RealClock: 真实时钟
+- VirtualClock: 虚拟时钟
+- BacklogPolicy: 动画积压策略
+- Animation: 动画基类（使用__slots__）
+- AnimationPool: 动画对象池
 - AnimationEngine: 动画引擎类
 """
 
@@ -22,6 +31,10 @@ from typing import List, Dict, Callable, Optional, Any
 from enum import Enum
 import threading
 import tkinter as tk
+from .engine_metrics import EngineMetrics
+from .display_list import DisplayList
+from .easing import EasingSpec, get_easing
+from src.canvas_geometry import get_canvas_geometry
 
 
 class AnimationState(Enum):
@@ -39,30 +52,123 @@ class AnimationType(Enum):
     HIGHLIGHT = "highlight" # 高亮动画
     COMPARE = "compare"     # 比较动画
     COMPLETE = "complete"   # 完成动画
+    TURBO = "turbo"         # 快速播放（每帧直接应用一批排序步骤）
     CUSTOM = "custom"       # 自定义动画
 
 
+class RealClock:
+    """真实时钟，基于系统时间"""
+
+    def time(self) -> float:
+        """获取当前时间（秒）"""
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        """休眠指定时间"""
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """虚拟时钟，时间只在显式推进时流逝，用于确定性的逐帧回放和测试"""
+
+    def __init__(self, start_time: float = 0.0):
+        """
+        初始化虚拟时钟
+
+        Args:
+            start_time: 起始时间（秒）
+        """
+        self.current_time = start_time
+
+    def time(self) -> float:
+        """获取当前虚拟时间（秒）"""
+        return self.current_time
+
+    def sleep(self, seconds: float) -> None:
+        """休眠即推进虚拟时间，不会真正阻塞"""
+        self.advance(seconds)
+
+    def advance(self, seconds: float) -> None:
+        """
+        推进虚拟时间
+
+        Args:
+            seconds: 推进的时间（秒）
+        """
+        self.current_time += max(0.0, seconds)
+
+
+# 默认共享的真实时钟
+_REAL_CLOCK = RealClock()
+
+
 class Animation:
-    """动画基类，定义动画的基本属性和方法"""
+    """
+    动画基类，定义动画的基本属性和方法
+
+    动画的每帧行为可以通过两种方式提供：
+    - on_update/on_complete: 任意回调（通常是闭包）
+    - update_func/complete_func: 模块级函数，以动画自身为第一个参数，
+      所需数据放在target和params中。这种方式不需要为每个动画创建闭包，
+      配合AnimationPool可以回收复用动画对象
+
+    对象池中的动画只有一个所有者：加入引擎后归引擎所有，播放完成、被合并、
+    被清空或引擎停止时由引擎回收并重置，随后可能被另一个动画复用。
+    调用方把动画加入引擎后不应继续持有或读取它；重复加入同一个动画、
+    或加入已被回收的动画会抛出ValueError。
+    """
+
+    __slots__ = (
+        'type', 'duration', 'clock', 'start_time', 'is_completed',
+        'on_complete', 'on_update', 'update_func', 'complete_func',
+        'collapsible', 'target', 'start_pos', 'end_pos', 'params',
+        'display_list', 'pooled', 'in_pool', 'queued'
+    )
     
-    def __init__(self, animation_type: AnimationType, duration: float = 1.0):
+    def __init__(self, animation_type: AnimationType, duration: float = 1.0, clock=None):
         """
         初始化动画
         
         Args:
             animation_type: 动画类型
             duration: 动画持续时间（秒）
+            clock: 时钟对象（默认使用真实时钟，加入引擎时会替换为引擎的时钟）
+        """
+        self.pooled = False  # 是否由对象池管理（完成后会被回收复用）
+        self.in_pool = False  # 是否已被回收到对象池中（等待复用）
+        self.queued = False   # 是否已加入引擎（归引擎所有）
+        self.reset(animation_type, duration, clock)
+
+    def reset(self, animation_type: AnimationType, duration: float = 1.0, clock=None) -> None:
+        """
+        重置动画的所有状态（对象池复用时调用）
+
+        Args:
+            animation_type: 动画类型
+            duration: 动画持续时间（秒）
+            clock: 时钟对象
         """
         self.type = animation_type
         self.duration = duration
+        self.clock = clock if clock is not None else _REAL_CLOCK
         self.start_time = 0
         self.is_completed = False
         self.on_complete: Optional[Callable] = None
         self.on_update: Optional[Callable[[float], None]] = None  # 进度更新回调
+        self.update_func: Optional[Callable[['Animation', float], None]] = None  # 参数化进度更新函数
+        self.complete_func: Optional[Callable[['Animation'], None]] = None  # 参数化完成函数
+        
+        # 积压合并相关属性
+        self.collapsible = animation_type in (AnimationType.COMPARE, AnimationType.HIGHLIGHT)  # 积压时可直接跳到结束状态
+        self.target: Any = None     # 动画的目标对象
+        self.start_pos: Optional[tuple] = None  # 移动动画的起始位置
+        self.end_pos: Optional[tuple] = None    # 移动动画的结束位置
+        self.params: Any = None     # 参数化更新函数使用的数据
+        self.display_list = None    # 加入引擎时设置为引擎的显示列表
         
     def start(self) -> None:
         """开始动画"""
-        self.start_time = time.time()
+        self.start_time = self.clock.time()
         self.is_completed = False
         
     def update(self) -> bool:
@@ -75,19 +181,17 @@ class Animation:
         if self.is_completed:
             return True
             
-        current_time = time.time()
+        current_time = self.clock.time()
         elapsed = current_time - self.start_time
         progress = min(elapsed / self.duration, 1.0)
         
         # 调用进度更新回调
-        if self.on_update:
-            self.on_update(progress)
+        self._apply_progress(progress)
         
         # 检查动画是否完成
         if progress >= 1.0:
             self.is_completed = True
-            if self.on_complete:
-                self.on_complete()
+            self._run_complete()
             return True
             
         return False
@@ -96,20 +200,227 @@ class Animation:
         """设置动画持续时间"""
         self.duration = max(0.1, duration)  # 最小0.1秒
 
+    def finish(self) -> None:
+        """立即跳到动画结束状态（不经过中间帧）"""
+        if self.is_completed:
+            return
+        self._apply_progress(1.0)
+        self.is_completed = True
+        self._run_complete()
+
+    def move_target(self, target: Any, x: float, y: float) -> None:
+        """
+        移动目标对象：加入引擎后写入显示列表，否则直接移动
+
+        Args:
+            target: 目标对象
+            x: 目标x坐标
+            y: 目标y坐标
+        """
+        if self.display_list is not None:
+            self.display_list.move(target, x, y)
+        else:
+            target.move_to(x, y)
+
+    def set_target_state(self,
+                         target: Any,
+                         highlighted: Optional[bool] = None,
+                         comparing: Optional[bool] = None,
+                         sorted: Optional[bool] = None) -> None:
+        """
+        设置目标对象的状态：加入引擎后写入显示列表，否则直接设置（None表示不修改）
+
+        Args:
+            target: 目标对象
+            highlighted: 是否高亮
+            comparing: 是否正在比较
+            sorted: 是否已排序
+        """
+        if self.display_list is not None:
+            self.display_list.set_state(target, highlighted=highlighted, comparing=comparing, sorted=sorted)
+            return
+        if hasattr(target, 'set_state'):
+            target.set_state(highlighted=highlighted, comparing=comparing, sorted=sorted)
+            return
+        if highlighted is not None and target.is_highlighted != highlighted:
+            target.highlight(highlighted)
+        if comparing is not None and target.is_comparing != comparing:
+            target.set_comparing(comparing)
+        if sorted is not None and target.is_sorted != sorted:
+            target.set_sorted(sorted)
+
+    def _apply_progress(self, progress: float) -> None:
+        """调用进度更新函数或回调"""
+        if self.update_func is not None:
+            self.update_func(self, progress)
+        elif self.on_update:
+            self.on_update(progress)
+
+    def _run_complete(self) -> None:
+        """调用完成函数或回调"""
+        if self.complete_func is not None:
+            self.complete_func(self)
+        elif self.on_complete:
+            self.on_complete()
+
+
+class AnimationPool:
+    """动画对象池，回收已完成的动画对象以减少每步排序的内存分配"""
+
+    def __init__(self, max_size: int = 64):
+        """
+        初始化动画对象池
+
+        Args:
+            max_size: 池中最多保留的空闲动画数量
+        """
+        self.max_size = max_size
+        self._free: List[Animation] = []
+        self._lock = threading.Lock()
+        self.created_count = 0  # 新建的动画数量
+        self.reused_count = 0   # 复用的动画数量
+
+    def acquire(self,
+                animation_type: AnimationType,
+                duration: float = 1.0,
+                update_func: Optional[Callable[[Animation, float], None]] = None,
+                complete_func: Optional[Callable[[Animation], None]] = None,
+                target: Any = None,
+                params: Any = None) -> Animation:
+        """
+        获取一个动画对象（优先复用空闲对象）
+
+        Args:
+            animation_type: 动画类型
+            duration: 动画持续时间（秒）
+            update_func: 参数化进度更新函数 f(animation, progress)
+            complete_func: 参数化完成函数 f(animation)
+            target: 动画的目标对象
+            params: 更新函数使用的数据
+
+        Returns:
+            Animation: 已初始化的动画对象
+        """
+        with self._lock:
+            animation = self._free.pop() if self._free else None
+        if animation is None:
+            animation = Animation(animation_type, duration)
+            animation.pooled = True
+            self.created_count += 1
+        else:
+            animation.reset(animation_type, duration)
+            animation.in_pool = False
+            self.reused_count += 1
+        animation.update_func = update_func
+        animation.complete_func = complete_func
+        animation.target = target
+        animation.params = params
+        return animation
+
+    def release(self, animation: Animation) -> None:
+        """
+        回收动画对象（只回收由对象池创建的动画，重复回收会被忽略）
+
+        Args:
+            animation: 要回收的动画
+        """
+        animation.queued = False
+        if not animation.pooled or animation.in_pool:
+            return
+        # 释放对目标对象和回调的引用
+        animation.reset(animation.type, animation.duration)
+        animation.in_pool = True
+        with self._lock:
+            if len(self._free) < self.max_size:
+                self._free.append(animation)
+
+    def get_free_count(self) -> int:
+        """获取池中空闲动画数量"""
+        return len(self._free)
+
+
+def _update_move(animation: Animation, progress: float) -> None:
+    """移动动画的进度更新函数：按缓动曲线从起始位置插值到结束位置"""
+    start_x, start_y = animation.start_pos
+    end_x, end_y = animation.end_pos
+    if animation.params is not None:
+        progress = animation.params(progress)
+    animation.move_target(animation.target,
+                          start_x + (end_x - start_x) * progress,
+                          start_y + (end_y - start_y) * progress)
+
+
+def _update_highlight(animation: Animation, progress: float) -> None:
+    """高亮动画的进度更新函数：播放时高亮目标（写入显示列表，在帧末提交）"""
+    animation.set_target_state(animation.target, highlighted=True)
+
+
+def _complete_highlight(animation: Animation) -> None:
+    """高亮动画的完成函数：取消高亮"""
+    animation.set_target_state(animation.target, highlighted=False)
+
+
+def _update_compare(animation: Animation, progress: float) -> None:
+    """比较动画的进度更新函数：播放时设置两个目标的比较状态，母鸭高亮指向（写入显示列表）"""
+    for target in animation.params:
+        if hasattr(target, 'set_comparing'):
+            animation.set_target_state(target, comparing=True)
+    if hasattr(animation.target, 'highlight'):
+        animation.set_target_state(animation.target, highlighted=True)
+
+
+def _complete_compare(animation: Animation) -> None:
+    """比较动画的完成函数：清除两个目标的比较状态和母鸭的高亮"""
+    for target in animation.params:
+        if hasattr(target, 'set_comparing'):
+            animation.set_target_state(target, comparing=False)
+    if hasattr(animation.target, 'highlight'):
+        animation.set_target_state(animation.target, highlighted=False)
+
+
+class BacklogPolicy:
+    """
+    动画积压策略
+
+    当排序步骤产生得比动画播放得快时，队列会越积越长，画面会越来越落后于
+    算法状态。超过阈值后，引擎按以下顺序处理队列：
+    1. 将可合并的比较/高亮动画直接跳到结束状态
+    2. 将同一目标的连续移动动画合并为一次移动到最终位置
+    3. 如仍超过最大滞后时间，按比例压缩剩余动画的持续时间
+    """
+
+    def __init__(self, max_queue_depth: int = 20, max_lag: float = 3.0, min_duration: float = 0.02):
+        """
+        初始化积压策略
+
+        Args:
+            max_queue_depth: 触发合并的队列深度阈值
+            max_lag: 显示落后于算法的最大时间（秒）
+            min_duration: 压缩后单个动画的最短持续时间（秒）
+        """
+        self.max_queue_depth = max_queue_depth
+        self.max_lag = max_lag
+        self.min_duration = min_duration
+
 
 class AnimationEngine:
     """动画引擎类，管理所有动画效果和动画队列"""
     
-    def __init__(self, canvas: tk.Canvas):
+    def __init__(self, canvas: tk.Canvas, clock=None, frame_interval: float = 1.0 / 60):
         """
         初始化动画引擎
         
         Args:
             canvas: Tkinter画布对象
+            clock: 时钟对象（默认使用真实时钟，传入VirtualClock可进行无界面逐帧回放）
+            frame_interval: 帧间隔（秒）
         """
         self.canvas = canvas
+        self.clock = clock if clock is not None else _REAL_CLOCK
+        self.frame_interval = frame_interval
         self.state = AnimationState.IDLE
         self.animation_queue: List[Animation] = []
+        self.queue_lock = threading.RLock()  # 保护动画队列（其他线程添加动画，动画线程取出和合并）
         self.current_animation: Optional[Animation] = None
         self.speed_multiplier = 1.0  # 速度倍数
         self.is_running = False
@@ -122,6 +433,22 @@ class AnimationEngine:
         self.on_animation_start: Optional[Callable[[Animation], None]] = None
         self.on_animation_complete: Optional[Callable[[Animation], None]] = None
         self.on_queue_empty: Optional[Callable[[], None]] = None
+        self.on_frame_end: Optional[Callable[[], None]] = None  # 每帧提交显示列表之后调用
+        
+        # 积压策略（None表示不合并）
+        self.backlog_policy: Optional[BacklogPolicy] = None
+        
+        # 性能统计
+        self.metrics = EngineMetrics(frame_interval)
+        
+        # 共享的画布几何服务，动画器的边界计算使用缓存的画布尺寸
+        self.geometry = get_canvas_geometry(canvas)
+        
+        # 显示列表，每帧末统一提交位置和状态变化
+        self.display_list = DisplayList()
+        
+        # 动画对象池，回收已完成的动画
+        self.animation_pool = AnimationPool()
         
     def add_animation(self, animation: Animation) -> None:
         """
@@ -130,9 +457,13 @@ class AnimationEngine:
         Args:
             animation: 要添加的动画对象
         """
+        self._take_ownership(animation)
         # 调整动画持续时间以匹配速度设置
         animation.set_duration(animation.duration / self.speed_multiplier)
-        self.animation_queue.append(animation)
+        animation.clock = self.clock
+        animation.display_list = self.display_list
+        with self.queue_lock:
+            self.animation_queue.append(animation)
         
     def add_animation_front(self, animation: Animation) -> None:
         """
@@ -141,13 +472,149 @@ class AnimationEngine:
         Args:
             animation: 要添加的动画对象
         """
+        self._take_ownership(animation)
         # 调整动画持续时间以匹配速度设置
         animation.set_duration(animation.duration / self.speed_multiplier)
-        self.animation_queue.insert(0, animation)
+        animation.clock = self.clock
+        animation.display_list = self.display_list
+        with self.queue_lock:
+            self.animation_queue.insert(0, animation)
+
+    def _take_ownership(self, animation: Animation) -> None:
+        """
+        将动画的所有权转交给引擎
+
+        Args:
+            animation: 要加入引擎的动画
+
+        Raises:
+            ValueError: 动画已在引擎中，或对象池动画已被回收
+        """
+        if animation.queued:
+            raise ValueError("动画已加入引擎，不能重复加入")
+        if animation.in_pool:
+            raise ValueError("动画已被对象池回收，调用方不应继续持有")
+        animation.queued = True
         
     def clear_queue(self) -> None:
         """清空动画队列"""
-        self.animation_queue.clear()
+        with self.queue_lock:
+            discarded = list(self.animation_queue)
+            self.animation_queue.clear()
+        for anim in discarded:
+            self.animation_pool.release(anim)
+
+    def acquire_animation(self,
+                          animation_type: AnimationType,
+                          duration: float = 1.0,
+                          update_func: Optional[Callable[[Animation, float], None]] = None,
+                          complete_func: Optional[Callable[[Animation], None]] = None,
+                          target: Any = None,
+                          params: Any = None) -> Animation:
+        """
+        从对象池获取动画（加入引擎后归引擎所有，完成后由引擎自动回收，调用方不应继续持有）
+
+        Args:
+            animation_type: 动画类型
+            duration: 动画持续时间（秒）
+            update_func: 参数化进度更新函数 f(animation, progress)
+            complete_func: 参数化完成函数 f(animation)
+            target: 动画的目标对象
+            params: 更新函数使用的数据
+
+        Returns:
+            Animation: 已初始化的动画对象
+        """
+        return self.animation_pool.acquire(animation_type, duration, update_func, complete_func, target, params)
+
+    def set_backlog_policy(self, policy: Optional[BacklogPolicy]) -> None:
+        """
+        设置动画积压策略（在动画线程处理下一帧时生效）
+
+        Args:
+            policy: 积压策略，None表示关闭合并
+        """
+        self.backlog_policy = policy
+
+    def get_lag(self) -> float:
+        """
+        获取显示落后于算法的时间
+
+        Returns:
+            float: 当前动画剩余时间与队列中所有动画时长之和（秒）
+        """
+        with self.queue_lock:
+            lag = sum(anim.duration for anim in self.animation_queue)
+        current_anim = self.current_animation
+        if current_anim is not None and not current_anim.is_completed:
+            elapsed = self.clock.time() - current_anim.start_time
+            lag += max(0.0, current_anim.duration - elapsed)
+        return lag
+
+    def _enforce_backlog_policy(self) -> None:
+        """
+        在队列过深或滞后过大时合并、压缩队列中的动画
+
+        只在动画线程处理帧时调用：队列在锁内重写，被跳过的动画在锁外结束，
+        显示列表也只由动画线程提交。
+        """
+        policy = self.backlog_policy
+        if policy is None:
+            return
+
+        skipped: List[Animation] = []
+        with self.queue_lock:
+            if len(self.animation_queue) <= policy.max_queue_depth and self.get_lag() <= policy.max_lag:
+                return
+            before = len(self.animation_queue)
+
+            # 1. 可合并的比较/高亮动画直接跳到结束状态
+            # 2. 同一目标的连续移动动画合并为一次移动（只合并都按起止位置插值的移动）
+            merged: List[Animation] = []
+            for anim in self.animation_queue:
+                if anim.collapsible:
+                    skipped.append(anim)
+                    continue
+                previous = merged[-1] if merged else None
+                if (previous is not None and anim.type == AnimationType.MOVE and previous.type == AnimationType.MOVE
+                        and anim.update_func is _update_move and previous.update_func is _update_move
+                        and anim.target is not None and anim.target is previous.target
+                        and previous.on_complete is None and anim.on_complete is None
+                        and previous.complete_func is None and anim.complete_func is None):
+                    previous.end_pos = anim.end_pos
+                    previous.duration = max(previous.duration, anim.duration)
+                    self.animation_pool.release(anim)
+                    continue
+                merged.append(anim)
+            self.animation_queue[:] = merged
+
+            # 3. 仍然滞后过大时按比例压缩剩余动画
+            lag = self.get_lag()
+            queued = sum(anim.duration for anim in self.animation_queue)
+            if lag > policy.max_lag and queued > 0:
+                budget = max(0.0, policy.max_lag - (lag - queued))
+                factor = budget / queued
+                for anim in self.animation_queue:
+                    anim.duration = max(policy.min_duration, anim.duration * factor)
+            after = len(self.animation_queue)
+
+        for anim in skipped:
+            self._finish_skipped(anim)
+        self._flush_display_list()
+
+        from src.logger import get_logger
+        get_logger().debug(f"动画积压合并: 队列 {before} -> {after}, 滞后 {lag:.2f}s -> {self.get_lag():.2f}s")
+
+    def _finish_skipped(self, animation: Animation) -> None:
+        """让被合并掉的动画直接结束，并照常触发完成回调"""
+        from src.logger import get_logger
+        try:
+            animation.finish()
+            if self.on_animation_complete:
+                self.on_animation_complete(animation)
+        except Exception as e:
+            get_logger().error(f"合并动画时发生错误: {str(e)}")
+        self.animation_pool.release(animation)
         
     def play(self) -> None:
         """开始播放动画"""
@@ -170,6 +637,15 @@ class AnimationEngine:
         if self.state == AnimationState.PLAYING and self.animation_thread and self.animation_thread.is_alive():
             logger.debug("动画已在播放中，无需重新启动")
             return
+        
+        # 动画线程仍在运行（队列为空后的空闲等待中）：只恢复播放状态。线程在锁内
+        # 决定退出并清除is_running，这里在锁内检查，不会错过正在退出的线程
+        with self.queue_lock:
+            if (self.is_running and not self.stop_event.is_set() and self.animation_thread
+                    and self.animation_thread.is_alive() and self.state == AnimationState.IDLE):
+                logger.debug("动画线程仍在运行，恢复播放状态")
+                self.state = AnimationState.PLAYING
+                return
             
         # 🔧 关键修复：如果已有动画线程但线程已结束，直接重启，不要调用stop()
         # 因为stop()会清空队列，导致刚添加的动画丢失
@@ -211,8 +687,13 @@ class AnimationEngine:
         if self.animation_thread and self.animation_thread.is_alive():
             self.animation_thread.join(timeout=0.5)
             
+        current_anim = self.current_animation
         self.current_animation = None
+        # 动画线程仍未退出时可能还在使用当前动画，不回收
+        if current_anim is not None and not (self.animation_thread and self.animation_thread.is_alive()):
+            self.animation_pool.release(current_anim)
         self.clear_queue()
+        self.display_list.clear()
         
     def set_speed(self, speed_multiplier: float) -> None:
         """
@@ -253,69 +734,12 @@ class AnimationEngine:
             # 处理暂停状态
             if self.state == AnimationState.PAUSED:
                 logger.debug("动画已暂停，等待恢复")
-                time.sleep(0.1)
+                self.clock.sleep(0.1)
                 continue
                 
-            # 获取下一个动画
-            if not self.current_animation and self.animation_queue:
-                logger.debug(f"从队列获取新动画，队列长度: {len(self.animation_queue)}")
-                self.current_animation = self.animation_queue.pop(0)
-                self.current_animation.start()
-                logger.debug(f"开始播放动画: {self.current_animation.type}")
-                
-                # 调用动画开始回调
-                if self.on_animation_start:
-                    try:
-                        self.on_animation_start(self.current_animation)
-                        logger.debug("动画开始回调执行成功")
-                    except Exception as e:
-                        logger.error(f"动画开始回调执行失败: {str(e)}")
-            
-            # 更新当前动画
-            if self.current_animation:
-                logger.debug(f"更新动画: {self.current_animation.type}")
-                
-                # 🔧 修复：确保 current_animation 不为 None
-                current_anim = self.current_animation
-                if current_anim is not None:
-                    try:
-                        is_completed = current_anim.update()
-                        
-                        if is_completed:
-                            logger.debug(f"动画完成: {current_anim.type}")
-                            # 调用动画完成回调
-                            if self.on_animation_complete:
-                                try:
-                                    self.on_animation_complete(current_anim)
-                                    logger.debug("动画完成回调执行成功")
-                                except Exception as e:
-                                    logger.error(f"动画完成回调执行失败: {str(e)}")
-                            
-                            self.current_animation = None
-                            logger.debug("当前动画已清空")
-                            
-                            # 🔧 修复：只有在队列为空且没有外部请求停止时才设置IDLE状态
-                            if not self.animation_queue and self.is_running:
-                                logger.debug("动画队列为空且仍在运行，设置状态为IDLE")
-                                self.state = AnimationState.IDLE
-
-                                # 🔧 修复：立即调用队列空回调，而不是延迟调用
-                                # 这样可以确保在回调中可以正确地重新启动动画
-                                if self.on_queue_empty:
-                                    try:
-                                        logger.debug("执行队列空回调")
-                                        self.on_queue_empty()
-                                        logger.debug("队列空回调执行成功")
-                                    except Exception as e:
-                                        logger.error(f"队列空回调执行失败: {str(e)}")
-                            else:
-                                logger.debug(f"队列中还有 {len(self.animation_queue)} 个动画或动画已停止")
-                    except Exception as e:
-                        logger.error(f"更新动画时发生错误: {str(e)}")
-                        self.current_animation = None
-                else:
-                    logger.warning("current_animation 变为 None，跳过更新")
-                    self.current_animation = None
+            if self._process_frame():
+                # 有动画在播放，按帧间隔推进
+                self.clock.sleep(self.frame_interval)
             else:
                 # 没有当前动画时的处理
                 if not self.animation_queue:
@@ -324,20 +748,189 @@ class AnimationEngine:
                         # 🔧 关键修复：增加等待时间，给排序算法更多时间来添加新动画
                         logger.debug("等待新动画...")
                         # 使用更长的等待时间，确保异步调度有足够时间执行
-                        time.sleep(0.05)  # 增加到50ms
-                        if not self.animation_queue:  # 再次检查
-                            logger.debug("没有新动画，准备退出循环")
-                            break
+                        self.clock.sleep(0.05)  # 增加到50ms
+                        with self.queue_lock:
+                            if not self.animation_queue and self.state == AnimationState.IDLE:  # 再次检查
+                                # 在锁内清除运行标志，play()据此判断是否需要启动新线程
+                                logger.debug("没有新动画，准备退出循环")
+                                self.is_running = False
+                                break
                     else:
                         # 状态不是IDLE但队列为空，短暂休眠
                         logger.debug("队列为空，短暂休眠")
-                        time.sleep(0.05)  # 增加等待时间
+                        self.clock.sleep(0.05)  # 增加等待时间
                 else:
                     # 队列中有动画但没有当前动画，短暂休眠
                     logger.debug("队列中有动画但没有当前动画，短暂休眠")
-                    time.sleep(0.01)  # 稍微增加休眠时间
+                    self.clock.sleep(0.01)  # 稍微增加休眠时间
                 
         logger.debug(f"动画线程结束，总循环次数: {loop_count}")
+
+    def _process_frame(self) -> bool:
+        """
+        处理一帧：必要时从队列取出下一个动画，并更新当前动画
+
+        Returns:
+            bool: 本帧是否有动画被推进
+        """
+        from src.logger import get_logger
+        logger = get_logger()
+
+        # 积压策略只在动画线程中执行，与帧末提交显示列表在同一线程
+        self._enforce_backlog_policy()
+
+        # 没有待播放的动画时标记空闲，避免把等待时间计入帧时间
+        if not self.current_animation and not self.animation_queue:
+            self.metrics.mark_idle()
+            return False
+        self.metrics.record_frame(self.clock.time(), len(self.animation_queue))
+
+        # 获取下一个动画
+        if not self.current_animation:
+            with self.queue_lock:
+                next_animation = self.animation_queue.pop(0) if self.animation_queue else None
+            # 检查队列后、取出前队列可能已被其他线程清空（停止或重置），此时本帧不播放
+            if next_animation is not None:
+                logger.debug(f"从队列获取新动画，队列长度: {len(self.animation_queue)}")
+                self.current_animation = next_animation
+                self.current_animation.start()
+                logger.debug(f"开始播放动画: {self.current_animation.type}")
+                
+                # 调用动画开始回调
+                if self.on_animation_start:
+                    try:
+                        self._timed_call(f"on_animation_start:{self.current_animation.type.value}",
+                                         self.on_animation_start, self.current_animation)
+                        logger.debug("动画开始回调执行成功")
+                    except Exception as e:
+                        logger.error(f"动画开始回调执行失败: {str(e)}")
+
+        # 🔧 修复：确保 current_animation 不为 None
+        current_anim = self.current_animation
+        if current_anim is None:
+            self._flush_display_list()
+            return False
+
+        logger.debug(f"更新动画: {current_anim.type}")
+        try:
+            # 动画的on_update/on_complete耗时按动画类型统计
+            is_completed = self._timed_call(f"update:{current_anim.type.value}", current_anim.update)
+            
+            if is_completed:
+                logger.debug(f"动画完成: {current_anim.type}")
+                # 调用动画完成回调
+                if self.on_animation_complete:
+                    try:
+                        self._timed_call(f"on_animation_complete:{current_anim.type.value}",
+                                         self.on_animation_complete, current_anim)
+                        logger.debug("动画完成回调执行成功")
+                    except Exception as e:
+                        logger.error(f"动画完成回调执行失败: {str(e)}")
+                
+                self.current_animation = None
+                self.animation_pool.release(current_anim)
+                logger.debug("当前动画已清空")
+                
+                # 🔧 修复：只有在队列为空且没有外部请求停止时才设置IDLE状态
+                if not self.animation_queue and not self.stop_event.is_set():
+                    logger.debug("动画队列为空且仍在运行，设置状态为IDLE")
+                    self.state = AnimationState.IDLE
+
+                    # 🔧 修复：立即调用队列空回调，而不是延迟调用
+                    # 这样可以确保在回调中可以正确地重新启动动画
+                    if self.on_queue_empty:
+                        # 先提交本帧的变化，回调中新建的动画读取到的是最终位置
+                        self._flush_display_list()
+                        try:
+                            logger.debug("执行队列空回调")
+                            self._timed_call("on_queue_empty", self.on_queue_empty)
+                            logger.debug("队列空回调执行成功")
+                        except Exception as e:
+                            logger.error(f"队列空回调执行失败: {str(e)}")
+                else:
+                    logger.debug(f"队列中还有 {len(self.animation_queue)} 个动画或动画已停止")
+        except Exception as e:
+            logger.error(f"更新动画时发生错误: {str(e)}")
+            self.current_animation = None
+            self.animation_pool.release(current_anim)
+        
+        # 帧末统一提交本帧的所有位置和状态变化
+        self._flush_display_list()
+        if self.on_frame_end:
+            try:
+                self._timed_call("on_frame_end", self.on_frame_end)
+            except Exception as e:
+                logger.error(f"帧末回调执行失败: {str(e)}")
+        return True
+
+    def _flush_display_list(self) -> None:
+        """将显示列表中本帧的变化提交到画布"""
+        if self.display_list.is_empty():
+            return
+        try:
+            self._timed_call("display_list_flush", self.display_list.flush)
+        except Exception as e:
+            from src.logger import get_logger
+            get_logger().error(f"提交显示列表时发生错误: {str(e)}")
+
+    def _timed_call(self, name: str, func: Callable, *args) -> Any:
+        """调用函数并把耗时记录到性能统计中"""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.metrics.record_cost(name, time.perf_counter() - start)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        获取引擎性能统计快照
+
+        Returns:
+            Dict[str, Any]: 帧时间直方图、掉帧数、队列深度和各类回调耗时
+        """
+        return self.metrics.snapshot()
+
+    def reset_metrics(self) -> None:
+        """清空引擎性能统计"""
+        self.metrics.reset()
+
+    def step_frame(self, dt: Optional[float] = None) -> bool:
+        """
+        在调用线程中同步推进一帧（用于无界面回放和测试，无需启动动画线程）
+
+        如果引擎使用VirtualClock，会先将时钟推进dt秒。
+
+        Args:
+            dt: 帧时长（秒），默认使用frame_interval
+
+        Returns:
+            bool: 推进后引擎是否还有待播放的动画
+        """
+        if dt is None:
+            dt = self.frame_interval
+        if hasattr(self.clock, 'advance'):
+            self.clock.advance(dt)
+        if self.state != AnimationState.PAUSED:
+            self._process_frame()
+        return self.current_animation is not None or bool(self.animation_queue)
+
+    def run_until_idle(self, dt: Optional[float] = None, max_frames: int = 1000000) -> int:
+        """
+        逐帧推进直到动画队列播放完毕
+
+        Args:
+            dt: 每帧时长（秒），默认使用frame_interval
+            max_frames: 最大帧数，防止死循环
+
+        Returns:
+            int: 实际推进的帧数
+        """
+        frames = 0
+        while frames < max_frames and self.state != AnimationState.PAUSED:
+            frames += 1
+            if not self.step_frame(dt):
+                break
+        return frames
                 
     def set_callbacks(self,
                      on_animation_start: Optional[Callable[[Animation], None]] = None,
@@ -359,7 +952,8 @@ class AnimationEngine:
                             target: Any, 
                             start_pos: tuple, 
                             end_pos: tuple, 
-                            duration: float = 1.0) -> Animation:
+                            duration: float = 1.0,
+                            easing: EasingSpec = None) -> Animation:
         """
         创建移动动画
         
@@ -368,22 +962,17 @@ class AnimationEngine:
             start_pos: 起始位置 (x, y)
             end_pos: 结束位置 (x, y)
             duration: 动画持续时间
+            easing: 缓动曲线（名称或曲线函数），None表示线性
             
         Returns:
-            Animation: 创建的移动动画对象
+            Animation: 创建的移动动画对象（对象池动画，加入引擎后归引擎所有）
         """
-        animation = Animation(AnimationType.MOVE, duration)
-        
-        def update_progress(progress: float):
-            # 计算插值位置
-            x = start_pos[0] + (end_pos[0] - start_pos[0]) * progress
-            y = start_pos[1] + (end_pos[1] - start_pos[1]) * progress
-            
-            # 更新目标位置
-            if hasattr(target, 'move_to'):
-                target.move_to(x, y)
-                
-        animation.on_update = update_progress
+        animation = self.animation_pool.acquire(
+            AnimationType.MOVE, duration, update_func=_update_move, target=target,
+            params=get_easing(easing) if easing is not None else None
+        )
+        animation.start_pos = start_pos
+        animation.end_pos = end_pos
         return animation
         
     def create_highlight_animation(self, 
@@ -397,25 +986,16 @@ class AnimationEngine:
             duration: 动画持续时间
             
         Returns:
-            Animation: 创建的高亮动画对象
+            Animation: 创建的高亮动画对象（对象池动画，加入引擎后归引擎所有）
         """
-        animation = Animation(AnimationType.HIGHLIGHT, duration)
-        
-        def start_highlight():
-            if hasattr(target, 'highlight'):
-                target.highlight(True)
-                
-        def end_highlight():
-            if hasattr(target, 'highlight'):
-                target.highlight(False)
-                
-        animation.on_update = lambda progress: None
-        animation.on_complete = end_highlight
-        
-        # 立即开始高亮
-        start_highlight()
-        
-        return animation
+        if not hasattr(target, 'highlight'):
+            return self.animation_pool.acquire(AnimationType.HIGHLIGHT, duration)
+            
+        # 高亮在动画开始播放时写入显示列表，与其他状态变化一起在帧末提交
+        return self.animation_pool.acquire(
+            AnimationType.HIGHLIGHT, duration, update_func=_update_highlight,
+            complete_func=_complete_highlight, target=target
+        )
         
     def create_compare_animation(self, 
                                mother_duck: Any, 
@@ -432,61 +1012,28 @@ class AnimationEngine:
             duration: 动画持续时间
             
         Returns:
-            Animation: 创建的比较动画对象
+            Animation: 创建的比较动画对象（对象池动画，加入引擎后归引擎所有）
         """
-        animation = Animation(AnimationType.COMPARE, duration)
-        
-        def start_compare():
-            # 设置比较状态
-            if hasattr(target1, 'set_comparing'):
-                target1.set_comparing(True)
-            if hasattr(target2, 'set_comparing'):
-                target2.set_comparing(True)
-                
-            # 母鸭指向目标
-            if hasattr(mother_duck, 'point_to'):
-                mother_duck.point_to(target1.x, target1.y)
-                
-        def end_compare():
-            # 清除比较状态
-            if hasattr(target1, 'set_comparing'):
-                target1.set_comparing(False)
-            if hasattr(target2, 'set_comparing'):
-                target2.set_comparing(False)
-                
-        animation.on_update = lambda progress: None
-        animation.on_complete = end_compare
-        
-        # 立即开始比较
-        start_compare()
-        
-        return animation
+        # 比较状态和母鸭的指向高亮在动画开始播放时写入显示列表，在帧末提交
+        return self.animation_pool.acquire(
+            AnimationType.COMPARE, duration, update_func=_update_compare,
+            complete_func=_complete_compare, target=mother_duck, params=(target1, target2)
+        )
         
     def create_complete_animation(self, 
                                 targets: List[Any], 
                                 duration: float = 2.0) -> Animation:
         """
-        创建完成动画
+        创建完成动画：通过群体运动动画从左到右依次将所有目标标记为已排序，
+        状态写入显示列表按帧批量提交
         
         Args:
             targets: 目标对象列表
             duration: 动画持续时间
             
         Returns:
-            Animation: 创建的完成动画对象
+            Animation: 创建的完成动画对象（对象池动画，加入引擎后归引擎所有）
         """
-        animation = Animation(AnimationType.COMPLETE, duration)
-        
-        def start_complete():
-            # 设置所有目标为已排序状态
-            for target in targets:
-                if hasattr(target, 'set_sorted'):
-                    target.set_sorted(True)
-                    
-        animation.on_update = lambda progress: None
-        animation.on_complete = lambda: None
-        
-        # 立即开始完成动画
-        start_complete()
-        
-        return animation
\ No newline at end of file
+        # 群体运动模块依赖本模块，在调用时再导入
+        from .group_motion import GroupMotionAnimator
+        return GroupMotionAnimator(self).reveal_sorted(targets, duration)
\ No newline at end of file
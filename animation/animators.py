@@ -2,13 +2,16 @@
 小鸭子冒泡排序可视化动画项目 - 动画器模块
 
 该模块包含各种专门的动画器类，用于处理不同类型的动画效果。
-每个动画器负责特定类型的动画实现。
+每个动画器负责特定类型的动画实现，弹跳、摇晃、点头等周期动作
+使用easing模块中预先计算的共享查找表。所有动画都从引擎的对象池获取，
+加入引擎后归引擎所有，调用方不应继续持有返回的动画。
 
 主要功能:
 - DuckAnimator: 鸭子动画器，处理单个鸭子的动画效果
 - SwapAnimator: 交换动画器，处理两只鸭子交换位置的动画
 - HighlightAnimator: 高亮动画器，处理高亮效果
 - MotherDuckAnimator: 母鸭动画器，处理大母鸭的特殊动作
+- MotherTravelPlanner: 母鸭行程规划器，按距离分配行走时间
 - ComparisonAnimator: 比较动画器，处理比较过程的动画效果
 
 主要类:
@@ -16,6 +19,7 @@
 - SwapAnimator: 交换动画器
 - HighlightAnimator: 高亮动画器
 - MotherDuckAnimator: 母鸭动画器
+- MotherTravelPlanner: 母鸭行程规划器
 - ComparisonAnimator: 比较动画器
 """
 
@@ -23,10 +27,182 @@ import math
 import time
 from typing import List, Tuple, Optional, Callable
 from .animation_engine import Animation, AnimationType, AnimationEngine
+from .easing import EasingSpec, get_easing, oscillation, hops
+from .trajectories import get_swap_trajectory
 from src.graphics import Duck, BabyDuck, MotherDuck
+from src.layout import LayoutEngine
 from src.logger import get_logger
 
 
+# 动画器共用的周期曲线查找表
+_WAVE = oscillation(1)              # 一次完整摆动：弹跳、点头、脉冲
+_SHAKE = oscillation(2)             # 两次摆动：摇晃
+_WALK_SWAY = oscillation(4)         # 行走时的上下摇摆
+_CELEBRATE_HOPS = hops(2)           # 庆祝时的两次跳跃
+_CELEBRATE_WOBBLE = oscillation(3)  # 庆祝时的左右摇摆
+
+
+# 以下为参数化的动画更新函数，所需数据保存在动画的target和params中，
+# 配合动画对象池使用，避免每个动画都创建新的闭包
+
+def _update_swap(animation: Animation, progress: float) -> None:
+    """交换动画的进度更新函数：沿预先生成的弧形轨迹交换两只鸭子的位置"""
+    duck1, duck2, start1_x, start1_y, start2_x, start2_y, trajectory, easing, mother_leg = animation.params
+    if mother_leg is not None:
+        # 交换的尾段同时让母鸭走向下一次比较的位置
+        mother_duck, leg_start, from_x, from_y, to_x, to_y = mother_leg
+        if progress >= leg_start:
+            local = (progress - leg_start) / (1 - leg_start) if leg_start < 1 else 1.0
+            animation.move_target(mother_duck, from_x + (to_x - from_x) * local,
+                                  from_y + (to_y - from_y) * local)
+    if progress >= 1.0:
+        # 终点精确落在对方的起点
+        animation.move_target(duck1, start2_x, start2_y)
+        animation.move_target(duck2, start1_x, start1_y)
+        return
+    dx1, dy1, dx2, dy2 = trajectory.offsets_at(easing(progress))
+    animation.move_target(duck1, start1_x + dx1, start1_y + dy1)
+    animation.move_target(duck2, start2_x + dx2, start2_y + dy2)
+
+
+def _update_bounce(animation: Animation, progress: float) -> None:
+    """弹跳动画的进度更新函数：从起始高度向上跳起再落回"""
+    duck = animation.target
+    start_y, height = animation.params
+    animation.move_target(duck, duck.x, start_y - height * _WAVE(progress))
+
+
+def _update_shake(animation: Animation, progress: float) -> None:
+    """摇晃动画的进度更新函数：围绕起始位置左右摇晃"""
+    duck = animation.target
+    start_x, intensity = animation.params
+    animation.move_target(duck, start_x + intensity * _SHAKE(progress), duck.y)
+
+
+def _complete_shake(animation: Animation) -> None:
+    """摇晃动画的完成函数：回到起始位置"""
+    duck = animation.target
+    animation.move_target(duck, animation.params[0], duck.y)
+
+
+def _update_celebrate(animation: Animation, progress: float) -> None:
+    """庆祝动画的进度更新函数：组合跳跃和左右摇摆，不超出画布边界"""
+    mother_duck = animation.target
+    state = animation.params  # [起始x, 起始y, 边距, 画布几何服务]
+    if state[0] is None:
+        # 起始位置在动画开始时才确定，排队期间母鸭可能还在移动
+        state[0], state[1] = mother_duck.x, mother_duck.y
+    start_x, start_y, margin, geometry = state
+    new_x = start_x + 3 * _CELEBRATE_WOBBLE(progress)
+    new_y = start_y - 20 * _CELEBRATE_HOPS(progress)
+    animation.move_target(mother_duck, *geometry.clamp(new_x, new_y, margin))
+
+
+def _complete_celebrate(animation: Animation) -> None:
+    """庆祝动画的完成函数：回到起始位置（限制在边界内）"""
+    start_x, start_y, margin, geometry = animation.params
+    if start_x is not None:
+        animation.move_target(animation.target, *geometry.clamp(start_x, start_y, margin))
+
+
+def _update_point(animation: Animation, progress: float) -> None:
+    """指向动画的进度更新函数：后半段高亮母鸭（目前简化为高亮，可扩展为旋转）"""
+    if progress > 0.5:
+        animation.set_target_state(animation.target, highlighted=True)
+
+
+def _complete_point(animation: Animation) -> None:
+    """指向动画的完成函数：取消母鸭高亮"""
+    animation.set_target_state(animation.target, highlighted=False)
+
+
+def _update_nod(animation: Animation, progress: float) -> None:
+    """点头动画的进度更新函数：先向下点头再回到原位"""
+    mother_duck = animation.target
+    start_y = animation.params
+    nod_offset = 10 * _WAVE(progress)
+    animation.move_target(mother_duck, mother_duck.x, start_y + nod_offset)
+
+
+def _update_walk(animation: Animation, progress: float) -> None:
+    """行走动画的进度更新函数：线性移动并带有上下摇摆"""
+    start_x, start_y, target_x, target_y, min_x, max_x, min_y, max_y, easing = animation.params
+    eased = easing(progress)
+    current_x = start_x + (target_x - start_x) * eased
+    current_y = start_y + (target_y - start_y) * eased
+
+    # 添加行走时的摇摆效果（按时间摇摆，不受缓动影响）
+    current_y += 2 * _WALK_SWAY(progress)
+
+    # 确保当前位置也在边界内
+    current_x = max(min_x, min(max_x, current_x))
+    current_y = max(min_y, min(max_y, current_y))
+    animation.move_target(animation.target, current_x, current_y)
+
+
+def _update_pulse(animation: Animation, progress: float) -> None:
+    """脉冲动画的进度更新函数：以鸭子中心为原点缩放，不重绘鸭子"""
+    duck = animation.target
+    state = animation.params  # [几何快照, 当前缩放比例, 最大缩放因子]
+    if state[0] is None:
+        # 在动画真正开始时保存快照，结束时据此精确恢复
+        state[0] = duck.snapshot_geometry()
+    scale = max(0.05, 1 + (state[2] - 1) * _WAVE(progress))
+    if scale != state[1]:
+        duck.scale_about_center(scale / state[1])
+        state[1] = scale
+
+
+def _complete_pulse(animation: Animation) -> None:
+    """脉冲动画的完成函数：恢复鸭子缩放前的精确坐标"""
+    state = animation.params
+    if state[0] is not None:
+        animation.target.restore_geometry(state[0])
+
+
+# 融合比较动画的默认时间线（占总时长的比例）：行走 -> 指向 -> 高亮 -> 点头
+COMPARE_WALK_END = 0.3
+COMPARE_POINT_END = 0.5
+COMPARE_HIGHLIGHT_END = 0.7
+
+
+def _update_compare_timeline(animation: Animation, progress: float) -> None:
+    """融合比较动画的进度更新函数：按时间线驱动行走、指向、高亮和点头"""
+    mother_duck = animation.target
+    state = animation.params
+    (duck1, duck2, start_x, start_y, target_x, target_y,
+     min_x, max_x, min_y, max_y, walk_end, point_end, highlight_end) = state
+    if start_x is None:
+        start_x, start_y = state[2], state[3] = mother_duck.x, mother_duck.y
+
+    if progress < walk_end:
+        # 行走阶段：线性移动并带有上下摇摆
+        local = progress / walk_end
+        x = start_x + (target_x - start_x) * local
+        y = start_y + (target_y - start_y) * local + 2 * _WALK_SWAY(local)
+    elif progress < highlight_end:
+        x, y = target_x, target_y
+    else:
+        # 点头阶段
+        local = (progress - highlight_end) / (1 - highlight_end)
+        x, y = target_x, target_y + 10 * _WAVE(local)
+    animation.move_target(mother_duck, max(min_x, min(max_x, x)), max(min_y, min(max_y, y)))
+
+    # 指向阶段后半段高亮母鸭，高亮阶段高亮两只比较的鸭子
+    pointing = (walk_end + point_end) / 2 <= progress < point_end
+    highlighting = point_end <= progress < highlight_end
+    animation.set_target_state(mother_duck, highlighted=pointing)
+    animation.set_target_state(duck1, highlighted=highlighting)
+    animation.set_target_state(duck2, highlighted=highlighting)
+
+
+def _complete_compare_timeline(animation: Animation) -> None:
+    """融合比较动画的完成函数：取消所有高亮"""
+    duck1, duck2 = animation.params[0], animation.params[1]
+    for target in (animation.target, duck1, duck2):
+        animation.set_target_state(target, highlighted=False)
+
+
 class DuckAnimator:
     """鸭子动画器，处理单个鸭子的动画效果"""
     
@@ -41,7 +217,8 @@ class DuckAnimator:
         self.duck = duck
         self.engine = engine
         
-    def move_to(self, target_x: float, target_y: float, duration: float = 1.0) -> Animation:
+    def move_to(self, target_x: float, target_y: float, duration: float = 1.0,
+                easing: EasingSpec = None) -> Animation:
         """
         创建移动动画
         
@@ -49,6 +226,7 @@ class DuckAnimator:
             target_x: 目标x坐标
             target_y: 目标y坐标
             duration: 动画持续时间
+            easing: 缓动曲线（名称或曲线函数），None表示线性
             
         Returns:
             Animation: 创建的移动动画
@@ -57,7 +235,7 @@ class DuckAnimator:
         end_pos = (target_x, target_y)
         
         return self.engine.create_move_animation(
-            self.duck, start_pos, end_pos, duration
+            self.duck, start_pos, end_pos, duration, easing
         )
         
     def highlight(self, duration: float = 0.5) -> Animation:
@@ -83,16 +261,10 @@ class DuckAnimator:
         Returns:
             Animation: 创建的弹跳动画
         """
-        animation = Animation(AnimationType.CUSTOM, duration)
-        start_y = self.duck.y
-        
-        def update_progress(progress: float):
-            # 使用正弦函数创建弹跳效果
-            bounce_height = height * math.sin(progress * math.pi * 2)
-            self.duck.move_to(self.duck.x, start_y - bounce_height)
-            
-        animation.on_update = update_progress
-        return animation
+        return self.engine.acquire_animation(
+            AnimationType.CUSTOM, duration, update_func=_update_bounce,
+            target=self.duck, params=(self.duck.y, height)
+        )
         
     def shake(self, intensity: float = 5, duration: float = 0.3) -> Animation:
         """
@@ -105,20 +277,10 @@ class DuckAnimator:
         Returns:
             Animation: 创建的摇晃动画
         """
-        animation = Animation(AnimationType.CUSTOM, duration)
-        start_x = self.duck.x
-        
-        def update_progress(progress: float):
-            # 使用正弦函数创建摇晃效果
-            offset = intensity * math.sin(progress * math.pi * 4)  # 4次摇晃
-            self.duck.move_to(start_x + offset, self.duck.y)
-            
-        def reset_position():
-            self.duck.move_to(start_x, self.duck.y)
-            
-        animation.on_update = update_progress
-        animation.on_complete = reset_position
-        return animation
+        return self.engine.acquire_animation(
+            AnimationType.CUSTOM, duration, update_func=_update_shake,
+            complete_func=_complete_shake, target=self.duck, params=(self.duck.x, intensity)
+        )
 
 
 class SwapAnimator:
@@ -133,7 +295,10 @@ class SwapAnimator:
         """
         self.engine = engine
         
-    def swap_ducks(self, duck1, duck2, duration: float = 1.0) -> Animation:
+    def swap_ducks(self, duck1, duck2, duration: float = 1.0, easing: EasingSpec = 'linear',
+                   mother_leg: Optional[Tuple] = None,
+                   start1: Optional[Tuple[float, float]] = None,
+                   start2: Optional[Tuple[float, float]] = None) -> Animation:
         """
         创建两只鸭子交换位置的动画
         
@@ -141,69 +306,27 @@ class SwapAnimator:
             duck1: 第一只鸭子
             duck2: 第二只鸭子
             duration: 动画持续时间
+            easing: 缓动曲线（名称或曲线函数）
+            mother_leg: 在交换尾段同时进行的母鸭行走
+                        (母鸭, 开始进度, 起点x, 起点y, 终点x, 终点y)，None表示没有
+            start1: 播放到该动画时第一只鸭子所在的位置，None表示当前位置
+            start2: 播放到该动画时第二只鸭子所在的位置，None表示当前位置
             
         Returns:
             Animation: 创建的交换动画
         """
-        animation = Animation(AnimationType.SWAP, duration)
-        
-        # 保存起始位置
-        start1_x, start1_y = duck1.x, duck1.y
-        start2_x, start2_y = duck2.x, duck2.y
-        
-        # 计算中间点（用于弧形移动）
-        mid_x = (start1_x + start2_x) / 2
-        mid_y = min(start1_y, start2_y) - 50  # 增加向上弧形的高度，给更多空间避免重叠
-        
-        # 计算鸭子之间的安全距离，防止重叠
-        # 使用完整的鸭子大小而不是一半，确保完全避免重叠
-        safe_distance = (duck1.size + duck2.size) / 2 + 20  # 增加额外间距确保安全
-        
-        # 计算两个不同的中间点，防止鸭子在移动过程中重叠
-        # 使用更大的偏移量确保鸭子不会相遇
-        if abs(start1_x - start2_x) > abs(start1_y - start2_y):
-            # 水平距离大于垂直距离，使用垂直偏移
-            offset = safe_distance * 1.2  # 增加偏移量
-            mid1_x = mid_x
-            mid1_y = mid_y - offset/2  # 第一个中间点更高
-            mid2_x = mid_x
-            mid2_y = mid_y + offset/2  # 第二个中间点更低
-        else:
-            # 垂直距离大于水平距离，使用水平偏移
-            offset = safe_distance * 1.2  # 增加偏移量
-            mid1_x = mid_x - offset  # 第一个中间点更左
-            mid1_y = mid_y
-            mid2_x = mid_x + offset  # 第二个中间点更右
-            mid2_y = mid_y
-        
-        def update_progress(progress: float):
-            if progress < 0.5:
-                # 前半段：移动到各自的中间点
-                sub_progress = progress * 2
-                # 鸭子1移动到第一个中间点
-                x1 = start1_x + (mid1_x - start1_x) * sub_progress
-                y1 = start1_y + (mid1_y - start1_y) * sub_progress
-                duck1.move_to(x1, y1)
-                
-                # 鸭子2移动到第二个中间点
-                x2 = start2_x + (mid2_x - start2_x) * sub_progress
-                y2 = start2_y + (mid2_y - start2_y) * sub_progress
-                duck2.move_to(x2, y2)
-            else:
-                # 后半段：从中间点到目标位置
-                sub_progress = (progress - 0.5) * 2
-                # 鸭子1从第一个中间点到鸭子2的起始位置
-                x1 = mid1_x + (start2_x - mid1_x) * sub_progress
-                y1 = mid1_y + (start2_y - mid1_y) * sub_progress
-                duck1.move_to(x1, y1)
-                
-                # 鸭子2从第二个中间点到鸭子1的起始位置
-                x2 = mid2_x + (start1_x - mid2_x) * sub_progress
-                y2 = mid2_y + (start1_y - mid2_y) * sub_progress
-                duck2.move_to(x2, y2)
-                
-        animation.on_update = update_progress
-        return animation
+        # 保存起始位置（提前排队时由调用方给出播放时的位置）
+        start1_x, start1_y = start1 if start1 is not None else (duck1.x, duck1.y)
+        start2_x, start2_y = start2 if start2 is not None else (duck2.x, duck2.y)
+        
+        # 按距离和鸭子大小获取预先生成的弧形轨迹（生成时已检查不会重叠）
+        trajectory = get_swap_trajectory(start2_x - start1_x, duck1.size, duck2.size, start2_y - start1_y)
+        
+        return self.engine.acquire_animation(
+            AnimationType.SWAP, duration, update_func=_update_swap,
+            params=(duck1, duck2, start1_x, start1_y, start2_x, start2_y, trajectory,
+                    get_easing(easing), mother_leg)
+        )
 
 
 class HighlightAnimator:
@@ -230,26 +353,13 @@ class HighlightAnimator:
         Returns:
             Animation: 创建的脉冲动画
         """
-        animation = Animation(AnimationType.HIGHLIGHT, duration)
-        original_size = duck.size
-        
-        def update_progress(progress: float):
-            # 使用正弦函数创建脉冲效果
-            scale = 1 + (scale_factor - 1) * math.sin(progress * math.pi * 2)
-            new_size = original_size * scale
-            
-            # 更新鸭子大小（如果支持）
-            if hasattr(duck, 'size'):
-                duck.size = new_size
-                duck.draw()  # 重新绘制
-                
-        def reset_size():
-            duck.size = original_size
-            duck.draw()
-            
-        animation.on_update = update_progress
-        animation.on_complete = reset_size
-        return animation
+        if hasattr(duck, 'prepare_pulse'):
+            # 精灵图鸭子按大小档位换图，提前生成脉冲过程中用到的精灵图
+            duck.prepare_pulse(scale_factor)
+        return self.engine.acquire_animation(
+            AnimationType.HIGHLIGHT, duration, update_func=_update_pulse,
+            complete_func=_complete_pulse, target=duck, params=[None, 1.0, scale_factor]
+        )
         
     def sequential_highlight(self, ducks: List, duration: float = 0.5) -> List[Animation]:
         """
@@ -274,6 +384,9 @@ class HighlightAnimator:
 class MotherDuckAnimator:
     """母鸭动画器，处理大母鸭的特殊动作"""
     
+    # 行走和庆祝时与画布边缘保持的边距
+    WALK_MARGIN = 80
+    
     def __init__(self, mother_duck, engine: AnimationEngine):
         """
         初始化母鸭动画器
@@ -297,22 +410,10 @@ class MotherDuckAnimator:
         Returns:
             Animation: 创建的指向动画
         """
-        animation = Animation(AnimationType.CUSTOM, duration)
-        
-        def update_progress(progress: float):
-            # 计算指向角度
-            angle = math.atan2(target_y - self.mother_duck.y, target_x - self.mother_duck.x)
-            
-            # 这里可以添加旋转动画，目前简化为高亮
-            if progress > 0.5 and not self.mother_duck.is_highlighted:
-                self.mother_duck.highlight(True)
-                
-        def reset_point():
-            self.mother_duck.highlight(False)
-            
-        animation.on_update = update_progress
-        animation.on_complete = reset_point
-        return animation
+        return self.engine.acquire_animation(
+            AnimationType.CUSTOM, duration, update_func=_update_point,
+            complete_func=_complete_point, target=self.mother_duck
+        )
         
     def nod(self, duration: float = 0.5) -> Animation:
         """
@@ -324,24 +425,13 @@ class MotherDuckAnimator:
         Returns:
             Animation: 创建的点头动画
         """
-        animation = Animation(AnimationType.CUSTOM, duration)
-        start_y = self.mother_duck.y
-        
-        def update_progress(progress: float):
-            # 使用正弦函数创建点头效果
-            if progress < 0.5:
-                # 前半段：向下点头
-                nod_offset = 10 * math.sin(progress * math.pi * 2)
-                self.mother_duck.move_to(self.mother_duck.x, start_y + nod_offset)
-            else:
-                # 后半段：回到原位
-                nod_offset = 10 * math.sin(progress * math.pi * 2)
-                self.mother_duck.move_to(self.mother_duck.x, start_y + nod_offset)
-                
-        animation.on_update = update_progress
-        return animation
+        return self.engine.acquire_animation(
+            AnimationType.CUSTOM, duration, update_func=_update_nod,
+            target=self.mother_duck, params=self.mother_duck.y
+        )
         
-    def walk_to(self, target_x: float, target_y: float, duration: float = 2.0) -> Animation:
+    def walk_to(self, target_x: float, target_y: float, duration: float = 2.0,
+                easing: EasingSpec = 'linear') -> Animation:
         """
         创建行走动画
 
@@ -349,46 +439,24 @@ class MotherDuckAnimator:
             target_x: 目标x坐标
             target_y: 目标y坐标
             duration: 动画持续时间
+            easing: 缓动曲线（名称或曲线函数）
 
         Returns:
             Animation: 创建的行走动画
         """
-        animation = Animation(AnimationType.CUSTOM, duration)
         start_x, start_y = self.mother_duck.x, self.mother_duck.y
         
-        # 添加边界检查，确保目标位置在画布范围内
-        try:
-            canvas_width = self.engine.canvas.winfo_width()
-            canvas_height = self.engine.canvas.winfo_height()
-            if canvas_width == 1:  # 如果winfo_width返回1，则使用默认值
-                canvas_width = 1000
-                canvas_height = 400
-        except:
-            canvas_width = 1000  # 默认画布宽度
-            canvas_height = 400  # 默认画布高度
-        
-        # 确保目标位置在有效范围内（留出边距）
-        margin = 80  # 边距
-        safe_target_x = max(margin, min(canvas_width - margin, target_x))
-        safe_target_y = max(margin, min(canvas_height - margin, target_y))
-
-        def update_progress(progress: float):
-            # 计算当前位置
-            current_x = start_x + (safe_target_x - start_x) * progress
-            current_y = start_y + (safe_target_y - start_y) * progress
-
-            # 添加行走时的摇摆效果
-            wobble = 2 * math.sin(progress * math.pi * 8)  # 8次摇摆
-            current_y += wobble
-            
-            # 确保当前位置也在边界内
-            current_x = max(margin, min(canvas_width - margin, current_x))
-            current_y = max(margin, min(canvas_height - margin, current_y))
+        # 确保目标位置在画布范围内（留出边距）
+        margin = self.WALK_MARGIN
+        min_x, max_x, min_y, max_y = self.engine.geometry.get_bounds(margin)
+        safe_target_x = max(min_x, min(max_x, target_x))
+        safe_target_y = max(min_y, min(max_y, target_y))
 
-            self.mother_duck.move_to(current_x, current_y)
-
-        animation.on_update = update_progress
-        return animation
+        return self.engine.acquire_animation(
+            AnimationType.CUSTOM, duration, update_func=_update_walk, target=self.mother_duck,
+            params=(start_x, start_y, safe_target_x, safe_target_y, min_x, max_x, min_y, max_y,
+                    get_easing(easing))
+        )
         
     def celebrate(self, duration: float = 2.0) -> Animation:
         """
@@ -400,46 +468,79 @@ class MotherDuckAnimator:
         Returns:
             Animation: 创建的庆祝动画
         """
-        animation = Animation(AnimationType.CUSTOM, duration)
-        start_x, start_y = self.mother_duck.x, self.mother_duck.y
-        
-        # 添加边界检查
-        try:
-            canvas_width = self.engine.canvas.winfo_width()
-            canvas_height = self.engine.canvas.winfo_height()
-            if canvas_width == 1:
-                canvas_width = 1000
-                canvas_height = 400
-        except:
-            canvas_width = 1000
-            canvas_height = 400
-        
-        margin = 80  # 边距
-
-        def update_progress(progress: float):
-            # 组合多种动作：跳跃、旋转、摇摆
-            jump_height = 20 * abs(math.sin(progress * math.pi * 2))
-            rotation = progress * math.pi * 2  # 旋转一圈
-            wobble = 3 * math.sin(progress * math.pi * 6)
-
-            new_x = start_x + wobble
-            new_y = start_y - jump_height
-            
-            # 确保庆祝动作不会超出边界
-            new_x = max(margin, min(canvas_width - margin, new_x))
-            new_y = max(margin, min(canvas_height - margin, new_y))
-
-            self.mother_duck.move_to(new_x, new_y)
+        return self.engine.acquire_animation(
+            AnimationType.CUSTOM, duration, update_func=_update_celebrate,
+            complete_func=_complete_celebrate, target=self.mother_duck,
+            params=[None, None, self.WALK_MARGIN, self.engine.geometry]
+        )
 
-        def reset_position():
-            # 确保重置位置也在边界内
-            safe_x = max(margin, min(canvas_width - margin, start_x))
-            safe_y = max(margin, min(canvas_height - margin, start_y))
-            self.mother_duck.move_to(safe_x, safe_y)
 
-        animation.on_update = update_progress
-        animation.on_complete = reset_position
-        return animation
+class MotherTravelPlanner:
+    """母鸭行程规划器，按行走距离分配行走时间，并记录排队动画结束后母鸭的位置"""
+    
+    def __init__(self, mother_duck, full_walk_distance: float = 300.0, min_walk_ratio: float = 0.25):
+        """
+        初始化母鸭行程规划器
+        
+        Args:
+            mother_duck: 母鸭对象
+            full_walk_distance: 需要完整行走时间的距离（像素），更近的距离按比例缩短
+            min_walk_ratio: 非零距离行走的最短时间占完整行走时间的比例
+        """
+        self.mother_duck = mother_duck
+        self.full_walk_distance = full_walk_distance
+        self.min_walk_ratio = min_walk_ratio
+        self._planned_position: Optional[Tuple[float, float]] = None
+        
+    def reset(self) -> None:
+        """丢弃规划的位置（动画队列被清空或母鸭被其他动画移动后调用）"""
+        self._planned_position = None
+        
+    def get_planned_position(self) -> Tuple[float, float]:
+        """
+        获取已排队的动画全部播放完后母鸭所在的位置
+        
+        Returns:
+            Tuple[float, float]: 母鸭位置 (x, y)
+        """
+        if self._planned_position is None:
+            return self.mother_duck.x, self.mother_duck.y
+        return self._planned_position
+        
+    def get_walk_time(self, target_x: float, target_y: float, max_duration: float) -> float:
+        """
+        计算从规划位置走到目标位置需要的时间（不改变规划位置）
+        
+        Args:
+            target_x: 目标x坐标
+            target_y: 目标y坐标
+            max_duration: 完整行走时间
+            
+        Returns:
+            float: 行走时间，已经在目标位置时为0
+        """
+        from_x, from_y = self.get_planned_position()
+        distance = math.hypot(target_x - from_x, target_y - from_y)
+        if distance < 0.5:
+            return 0.0
+        ratio = max(self.min_walk_ratio, min(1.0, distance / self.full_walk_distance))
+        return max_duration * ratio
+        
+    def plan_walk(self, target_x: float, target_y: float, max_duration: float) -> float:
+        """
+        规划一次走到目标位置的行走
+        
+        Args:
+            target_x: 目标x坐标
+            target_y: 目标y坐标
+            max_duration: 完整行走时间
+            
+        Returns:
+            float: 行走时间，已经在目标位置时为0（跳过行走）
+        """
+        walk_time = self.get_walk_time(target_x, target_y, max_duration)
+        self._planned_position = (target_x, target_y)
+        return walk_time
 
 
 class ComparisonAnimator:
@@ -453,76 +554,111 @@ class ComparisonAnimator:
             engine: 动画引擎
         """
         self.engine = engine
+        # 母鸭行走线的y坐标（由当前场景布局给出），None表示按画布的当前高度计算
+        self.lane_y: Optional[float] = None
         
-    def compare_ducks(self, mother_duck, duck1, duck2, duration: float = 1.5) -> List[Animation]:
+    def get_lane_y(self) -> float:
+        """获取母鸭行走线的y坐标"""
+        if self.lane_y is not None:
+            return self.lane_y
+        return self.engine.geometry.height * LayoutEngine.MOTHER_LANE_RATIO
+        
+    def get_compare_position(self, mother_duck, duck1, duck2) -> Tuple[float, float]:
         """
-        创建比较动画序列
+        计算母鸭比较两只鸭子时的站位
 
         Args:
             mother_duck: 母鸭对象
             duck1: 第一只鸭子
             duck2: 第二只鸭子
-            duration: 总动画持续时间
 
         Returns:
-            List[Animation]: 创建的动画序列
+            Tuple[float, float]: 母鸭站位 (x, y)
         """
-        animations = []
+        return self.get_position_between(mother_duck, duck1.x, duck2.x)
+
+    def get_position_between(self, mother_duck, x1: float, x2: float) -> Tuple[float, float]:
+        """
+        计算母鸭比较位于x1和x2的两只鸭子时的站位
+
+        Args:
+            mother_duck: 母鸭对象
+            x1: 第一只鸭子的x坐标
+            x2: 第二只鸭子的x坐标
+
+        Returns:
+            Tuple[float, float]: 母鸭站位 (x, y)
+        """
+        # 使用更稳定的坐标计算，基于鸭子的实际位置，但加入边界检查
+        mid_x = (x1 + x2) / 2
+        # 母鸭始终在布局给出的行走线上，而不是基于当前鸭子位置的计算
+        mid_y = self.get_lane_y()
 
-        # 1. 母鸭移动到比较位置
-        # 使用更稳定的坐标计算，基于当前鸭子的实际位置，但加入边界检查
-        mid_x = (duck1.x + duck2.x) / 2
-        # 使用固定的母鸭高度，而不是基于当前鸭子位置的计算，以确保母鸭移动到正确的位置
-        mid_y = 100  # 固定的母鸭高度 - 这是母鸭在画布上的标准位置
-
-        # 添加边界检查，确保母鸭不会移动到画布外
-        # 从canvas获取实际宽度和高度
-        try:
-            canvas_width = self.engine.canvas.winfo_width()
-            canvas_height = self.engine.canvas.winfo_height()
-            if canvas_width == 1:  # 如果winfo_width返回1，则使用默认值
-                canvas_width = 1000
-                canvas_height = 400
-        except:
-            canvas_width = 1000  # 默认画布宽度
-            canvas_height = 400  # 默认画布高度
-
-        # 保持在画布边界内，但允许一定的边距
+        # 添加边界检查，确保母鸭不会移动到画布（可滚动时为场景）外
         # 母鸭的大小约为80像素，所以需要留出足够的边距
+        geometry = self.engine.geometry
         margin = mother_duck.size / 2 + 20  # 母鸭大小的一半加上额外边距
-        min_x = margin   # 左边界
-        max_x = canvas_width - margin  # 右边界
-        min_y = margin   # 上边界
-        max_y = canvas_height - margin  # 下边界
-        
-        # 确保目标位置在有效范围内
-        safe_mid_x = max(min_x, min(max_x, mid_x))
-        safe_mid_y = max(min_y, min(max_y, mid_y))
-        
-        # 额外的安全检查：如果两只鸭子距离很远，限制母鸭的移动范围
-        duck_distance = abs(duck1.x - duck2.x)
-        if duck_distance > 400:  # 如果鸭子间距超过400像素
-            # 限制母鸭在更安全的中心区域
-            center_x = canvas_width / 2
-            safe_range = 300  # 安全范围半径
-            safe_mid_x = max(center_x - safe_range, min(center_x + safe_range, safe_mid_x))
-
-        mother_animator = MotherDuckAnimator(mother_duck, self.engine)
-        walk_anim = mother_animator.walk_to(safe_mid_x, safe_mid_y, duration * 0.3)
-        animations.append(walk_anim)
-
-        # 2. 母鸭指向两只鸭子
-        point_anim1 = mother_animator.point_to(duck1.x, duck1.y, duration * 0.2)
-        animations.append(point_anim1)
-
-        # 3. 高亮比较的鸭子
-        highlight_anim1 = self.engine.create_highlight_animation(duck1, duration * 0.2)
-        highlight_anim2 = self.engine.create_highlight_animation(duck2, duration * 0.2)
-        animations.append(highlight_anim1)
-        animations.append(highlight_anim2)
-
-        # 4. 母鸭点头表示理解
-        nod_anim = mother_animator.nod(duration * 0.3)
-        animations.append(nod_anim)
-
-        return animations
\ No newline at end of file
+        safe_mid_x, safe_mid_y = geometry.clamp(mid_x, mid_y, margin)
+
+        # 与walk_to相同的行走边距
+        return geometry.clamp(safe_mid_x, safe_mid_y, MotherDuckAnimator.WALK_MARGIN)
+
+    def compare_timeline(self, mother_duck, duck1, duck2, duration: float = 1.5,
+                         planner: Optional[MotherTravelPlanner] = None,
+                         positions: Optional[Tuple[float, float]] = None) -> Animation:
+        """
+        创建融合的比较动画：一个动画对象按时间线依次驱动母鸭行走、指向、
+        两只鸭子高亮和母鸭点头
+
+        Args:
+            mother_duck: 母鸭对象
+            duck1: 第一只鸭子
+            duck2: 第二只鸭子
+            duration: 行走距离最远时的总动画持续时间
+            planner: 母鸭行程规划器，提供时按行走距离缩短或跳过行走阶段
+            positions: 播放到该动画时两只鸭子所在的x坐标，None表示当前位置
+
+        Returns:
+            Animation: 创建的比较动画
+        """
+        if positions is not None:
+            target_x, target_y = self.get_position_between(mother_duck, *positions)
+        else:
+            target_x, target_y = self.get_compare_position(mother_duck, duck1, duck2)
+        min_x, max_x, min_y, max_y = self.engine.geometry.get_bounds(MotherDuckAnimator.WALK_MARGIN)
+
+        # 行走之后的指向、高亮、点头阶段时长固定，行走阶段按距离规划
+        max_walk = duration * COMPARE_WALK_END
+        walk_time = planner.plan_walk(target_x, target_y, max_walk) if planner is not None else max_walk
+        total = walk_time + duration - max_walk
+        walk_end = walk_time / total
+        rest_scale = (1 - walk_end) / (1 - COMPARE_WALK_END)
+        point_end = walk_end + (COMPARE_POINT_END - COMPARE_WALK_END) * rest_scale
+        highlight_end = walk_end + (COMPARE_HIGHLIGHT_END - COMPARE_WALK_END) * rest_scale
+
+        animation = self.engine.acquire_animation(
+            AnimationType.COMPARE, total,
+            update_func=_update_compare_timeline, complete_func=_complete_compare_timeline,
+            target=mother_duck,
+            # 起始位置在动画开始时才确定，排队期间母鸭可能还在移动
+            params=[duck1, duck2, None, None, target_x, target_y, min_x, max_x, min_y, max_y,
+                    walk_end, point_end, highlight_end]
+        )
+        # 比较动画只是视觉提示，积压时可直接跳到结束状态
+        animation.collapsible = True
+        return animation
+
+    def compare_ducks(self, mother_duck, duck1, duck2, duration: float = 1.5) -> List[Animation]:
+        """
+        创建比较动画序列（返回只包含一个融合比较动画的列表）
+
+        Args:
+            mother_duck: 母鸭对象
+            duck1: 第一只鸭子
+            duck2: 第二只鸭子
+            duration: 总动画持续时间
+
+        Returns:
+            List[Animation]: 创建的动画序列
+        """
+        return [self.compare_timeline(mother_duck, duck1, duck2, duration)]
@@ -0,0 +1,131 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 显示列表模块
+
+该模块提供逐帧批量提交的显示列表。动画在一帧内只写入目标位置和状态，
+由动画引擎在帧末统一提交到画布，同一对象在一帧内的多次写入只会
+产生一次画布操作，位置和状态未变化的对象不会产生任何画布操作。
+目标支持set_state时，一帧内的多个状态变化合并为一次外观更新。
+
+主要功能:
+- DisplayList: 显示列表类，收集一帧内的位置和状态变化并统一提交
+
+主要类:
+- DisplayList: 显示列表类
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+
+class DisplayList:
+    """显示列表类，收集一帧内的位置和状态变化并统一提交"""
+
+    # 状态名称到对象属性和设置方法的映射
+    STATE_SETTERS = {
+        'highlighted': ('is_highlighted', 'highlight'),
+        'comparing': ('is_comparing', 'set_comparing'),
+        'sorted': ('is_sorted', 'set_sorted'),
+    }
+
+    def __init__(self):
+        """初始化显示列表"""
+        self._positions: Dict[int, Tuple[Any, float, float]] = {}  # id(对象) -> (对象, x, y)
+        self._states: Dict[int, Tuple[Any, Dict[str, bool]]] = {}  # id(对象) -> (对象, 状态)
+
+    def move(self, target: Any, x: float, y: float) -> None:
+        """
+        记录目标在本帧的最终位置
+
+        Args:
+            target: 目标对象（需要有move_to方法）
+            x: 目标x坐标
+            y: 目标y坐标
+        """
+        self._positions[id(target)] = (target, x, y)
+
+    def set_state(self,
+                  target: Any,
+                  highlighted: Optional[bool] = None,
+                  comparing: Optional[bool] = None,
+                  sorted: Optional[bool] = None) -> None:
+        """
+        记录目标在本帧的最终状态（None表示不修改）
+
+        Args:
+            target: 目标对象
+            highlighted: 是否高亮
+            comparing: 是否正在比较
+            sorted: 是否已排序
+        """
+        entry = self._states.get(id(target))
+        if entry is None:
+            entry = (target, {})
+            self._states[id(target)] = entry
+        states = entry[1]
+        for name, value in (('highlighted', highlighted), ('comparing', comparing), ('sorted', sorted)):
+            if value is not None:
+                states[name] = value
+
+    def get_position(self, target: Any) -> Tuple[float, float]:
+        """
+        获取目标的最新位置（包括本帧尚未提交的写入）
+
+        Args:
+            target: 目标对象
+
+        Returns:
+            Tuple[float, float]: 目标位置 (x, y)
+        """
+        entry = self._positions.get(id(target))
+        if entry is not None:
+            return entry[1], entry[2]
+        return target.x, target.y
+
+    def is_empty(self) -> bool:
+        """检查是否有待提交的变化"""
+        return not self._positions and not self._states
+
+    def clear(self) -> None:
+        """丢弃所有待提交的变化"""
+        self._positions.clear()
+        self._states.clear()
+
+    def flush(self) -> int:
+        """
+        将本帧的所有变化提交到画布
+
+        Returns:
+            int: 实际发生变化的对象数量
+        """
+        if self.is_empty():
+            return 0
+
+        positions, self._positions = self._positions, {}
+        states, self._states = self._states, {}
+        changed = 0
+
+        for target, x, y in positions.values():
+            if target.x != x or target.y != y:
+                target.move_to(x, y)
+                changed += 1
+
+        for target, values in states.values():
+            # 只保留与目标当前状态不同的部分
+            updates = {name: value for name, value in values.items()
+                       if getattr(target, self.STATE_SETTERS[name][0], None) != value}
+            if not updates:
+                continue
+            if hasattr(target, 'set_state'):
+                # 多个状态变化合并为一次外观更新
+                target.set_state(**updates)
+                changed += 1
+                continue
+            target_changed = False
+            for name, value in updates.items():
+                setter = self.STATE_SETTERS[name][1]
+                if hasattr(target, setter):
+                    getattr(target, setter)(value)
+                    target_changed = True
+            if target_changed:
+                changed += 1
+
+        return changed
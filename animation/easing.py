@@ -0,0 +1,170 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 缓动与路径查找表模块
+
+该模块提供动画器共用的缓动曲线和周期路径曲线。所有曲线在首次使用时
+按固定分辨率预先采样成查找表，之后每帧的计算只需要一次查表加一次
+线性插值，不再在每帧为每只鸭子重复调用math.sin。
+
+主要功能:
+- EasingTable: 查找表类，预先采样曲线并通过插值求值
+- get_easing: 按名称获取标准缓动曲线（linear、ease_in、ease_out、ease_in_out、bounce、arc）
+- oscillation: 获取指定周期数的正弦摆动曲线（用于弹跳、摇晃、点头、行走摇摆）
+- hops: 获取指定次数的跳跃曲线（正弦绝对值，用于庆祝跳跃）
+
+主要类:
+- EasingTable: 查找表类
+
+主要函数:
+- get_easing: 获取缓动曲线函数
+- oscillation: 获取摆动曲线函数
+- hops: 获取跳跃曲线函数
+"""
+
+import math
+from typing import Callable, Dict, List, Tuple, Union
+
+# 查找表的默认采样段数
+TABLE_RESOLUTION = 256
+
+
+class EasingTable:
+    """查找表类，预先采样曲线并通过插值求值"""
+
+    __slots__ = ('name', 'resolution', '_samples')
+
+    def __init__(self, name: str, func: Callable[[float], float], resolution: int = TABLE_RESOLUTION):
+        """
+        初始化查找表
+
+        Args:
+            name: 曲线名称
+            func: 定义在[0, 1]上的曲线函数
+            resolution: 采样段数
+        """
+        self.name = name
+        self.resolution = resolution
+        self._samples: List[float] = [func(i / resolution) for i in range(resolution + 1)]
+        # 多补一个采样点，使progress为1.0时也能统一插值
+        self._samples.append(self._samples[-1])
+
+    def __call__(self, progress: float) -> float:
+        """
+        计算曲线在指定进度处的值
+
+        Args:
+            progress: 动画进度（超出[0, 1]的值会被截断）
+
+        Returns:
+            float: 曲线值
+        """
+        if progress <= 0.0:
+            return self._samples[0]
+        if progress >= 1.0:
+            return self._samples[-1]
+        position = progress * self.resolution
+        index = int(position)
+        low = self._samples[index]
+        return low + (self._samples[index + 1] - low) * (position - index)
+
+    def __repr__(self) -> str:
+        return "EasingTable({!r})".format(self.name)
+
+
+def _bounce_out(t: float) -> float:
+    """标准的弹跳缓出曲线（落地后逐渐减弱的回弹）"""
+    if t < 1 / 2.75:
+        return 7.5625 * t * t
+    if t < 2 / 2.75:
+        t -= 1.5 / 2.75
+        return 7.5625 * t * t + 0.75
+    if t < 2.5 / 2.75:
+        t -= 2.25 / 2.75
+        return 7.5625 * t * t + 0.9375
+    t -= 2.625 / 2.75
+    return 7.5625 * t * t + 0.984375
+
+
+# 标准缓动曲线：进度从0映射到1
+_EASING_FUNCTIONS: Dict[str, Callable[[float], float]] = {
+    'linear': lambda t: t,
+    'ease_in': lambda t: t * t,
+    'ease_out': lambda t: 1 - (1 - t) * (1 - t),
+    'ease_in_out': lambda t: t * t * (3 - 2 * t),
+    'bounce': _bounce_out,
+    # 弧线：两端为0、中点为1，用于路径的抬升量
+    'arc': lambda t: math.sin(math.pi * t),
+}
+
+_easing_tables: Dict[str, EasingTable] = {}
+_periodic_tables: Dict[Tuple[str, float], EasingTable] = {}
+
+EasingSpec = Union[str, Callable[[float], float], None]
+
+
+def get_easing(easing: EasingSpec = 'linear') -> Callable[[float], float]:
+    """
+    获取缓动曲线函数
+
+    Args:
+        easing: 曲线名称、任意曲线函数或None（None表示线性）
+
+    Returns:
+        Callable[[float], float]: 曲线函数，名称对应的曲线返回共享的查找表
+
+    Raises:
+        ValueError: 未知的曲线名称
+    """
+    if easing is None:
+        easing = 'linear'
+    if callable(easing):
+        return easing
+    table = _easing_tables.get(easing)
+    if table is None:
+        if easing not in _EASING_FUNCTIONS:
+            raise ValueError("未知的缓动曲线: {}".format(easing))
+        table = EasingTable(easing, _EASING_FUNCTIONS[easing])
+        _easing_tables[easing] = table
+    return table
+
+
+def get_easing_names() -> List[str]:
+    """获取所有标准缓动曲线的名称"""
+    return list(_EASING_FUNCTIONS)
+
+
+def _periodic(kind: str, cycles: float, func: Callable[[float], float]) -> EasingTable:
+    """获取（必要时创建）共享的周期曲线查找表"""
+    key = (kind, cycles)
+    table = _periodic_tables.get(key)
+    if table is None:
+        # 周期越多采样越密，保证每个周期内的精度一致
+        resolution = max(TABLE_RESOLUTION, int(TABLE_RESOLUTION * cycles / 2))
+        table = EasingTable("{}({})".format(kind, cycles), func, resolution)
+        _periodic_tables[key] = table
+    return table
+
+
+def oscillation(cycles: float = 1) -> EasingTable:
+    """
+    获取摆动曲线 sin(2π·cycles·t)，取值范围[-1, 1]，两端为0
+
+    Args:
+        cycles: 完整摆动的次数
+
+    Returns:
+        EasingTable: 共享的摆动曲线查找表
+    """
+    return _periodic('oscillation', cycles, lambda t: math.sin(2 * math.pi * cycles * t))
+
+
+def hops(count: float = 1) -> EasingTable:
+    """
+    获取跳跃曲线 |sin(π·count·t)|，取值范围[0, 1]，每次跳跃都从0开始并回到0
+
+    Args:
+        count: 跳跃次数
+
+    Returns:
+        EasingTable: 共享的跳跃曲线查找表
+    """
+    return _periodic('hops', count, lambda t: abs(math.sin(math.pi * count * t)))
@@ -0,0 +1,229 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 引擎性能统计模块
+
+该模块负责收集动画引擎的运行数据，帮助定位卡顿原因：
+帧时间分布、掉帧数、队列深度变化，以及动画更新和引擎回调的耗时。
+
+主要功能:
+- EngineMetrics: 引擎性能统计类，记录帧时间、队列深度和回调耗时
+- MetricsOverlay: 画布性能浮层，在视口角落实时显示统计摘要（画布滚动后仍然可见）
+
+主要类:
+- EngineMetrics: 引擎性能统计类
+- MetricsOverlay: 画布性能浮层类
+"""
+
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Any
+import tkinter as tk
+
+
+class EngineMetrics:
+    """引擎性能统计类，记录帧时间、队列深度和回调耗时"""
+
+    # 帧时间直方图的分桶上限（毫秒），最后一个桶收集超过最大上限的帧
+    FRAME_BUCKETS_MS = (8, 16, 33, 50, 100, 250)
+
+    def __init__(self, frame_interval: float = 1.0 / 60, history_size: int = 600):
+        """
+        初始化性能统计
+
+        Args:
+            frame_interval: 目标帧间隔（秒），用于计算掉帧数
+            history_size: 队列深度历史记录的最大条数
+        """
+        self.frame_interval = frame_interval
+        self.history_size = history_size
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """清空所有统计数据"""
+        with self._lock:
+            self.frame_count = 0
+            self.total_frame_time = 0.0
+            self.max_frame_time = 0.0
+            self.dropped_frames = 0
+            self.frame_histogram: List[int] = [0] * (len(self.FRAME_BUCKETS_MS) + 1)
+            self.queue_depth_history = deque(maxlen=self.history_size)  # (时间, 队列深度)
+            self.max_queue_depth = 0
+            self.callback_costs: Dict[str, List[float]] = {}  # 名称 -> [次数, 总耗时, 最大耗时]
+            self._last_frame_time: Optional[float] = None
+
+    def record_frame(self, now: float, queue_depth: int) -> None:
+        """
+        记录一帧的开始
+
+        Args:
+            now: 当前时间（秒，来自引擎时钟）
+            queue_depth: 当前队列深度
+        """
+        with self._lock:
+            self.queue_depth_history.append((now, queue_depth))
+            self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+            if self._last_frame_time is not None:
+                frame_time = now - self._last_frame_time
+                self.frame_count += 1
+                self.total_frame_time += frame_time
+                self.max_frame_time = max(self.max_frame_time, frame_time)
+
+                # 放入直方图
+                frame_ms = frame_time * 1000
+                bucket = len(self.FRAME_BUCKETS_MS)
+                for i, limit in enumerate(self.FRAME_BUCKETS_MS):
+                    if frame_ms <= limit:
+                        bucket = i
+                        break
+                self.frame_histogram[bucket] += 1
+
+                # 超过目标帧间隔1.5倍视为掉帧，按跨越的帧数计数
+                if self.frame_interval > 0 and frame_time > self.frame_interval * 1.5:
+                    self.dropped_frames += int(frame_time / self.frame_interval) - 1
+
+            self._last_frame_time = now
+
+    def mark_idle(self) -> None:
+        """标记引擎进入空闲，下一帧不与空闲前的帧计算间隔"""
+        with self._lock:
+            self._last_frame_time = None
+
+    def record_cost(self, name: str, seconds: float) -> None:
+        """
+        记录一次回调耗时
+
+        Args:
+            name: 统计项名称，例如 "on_update:swap"
+            seconds: 耗时（秒）
+        """
+        with self._lock:
+            entry = self.callback_costs.get(name)
+            if entry is None:
+                self.callback_costs[name] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        获取统计数据快照
+
+        Returns:
+            Dict[str, Any]: 帧时间、掉帧、队列深度和回调耗时统计
+        """
+        with self._lock:
+            labels = [f"<={limit}ms" for limit in self.FRAME_BUCKETS_MS]
+            labels.append(f">{self.FRAME_BUCKETS_MS[-1]}ms")
+            depths = [depth for _, depth in self.queue_depth_history]
+
+            callbacks = {}
+            for name, (count, total, maximum) in self.callback_costs.items():
+                callbacks[name] = {
+                    'count': int(count),
+                    'total_ms': total * 1000,
+                    'avg_ms': total * 1000 / count,
+                    'max_ms': maximum * 1000
+                }
+
+            return {
+                'frames': self.frame_count,
+                'avg_frame_ms': self.total_frame_time * 1000 / self.frame_count if self.frame_count else 0.0,
+                'max_frame_ms': self.max_frame_time * 1000,
+                'frame_histogram': dict(zip(labels, self.frame_histogram)),
+                'dropped_frames': self.dropped_frames,
+                'queue_depth': {
+                    'current': depths[-1] if depths else 0,
+                    'max': self.max_queue_depth,
+                    'avg': sum(depths) / len(depths) if depths else 0.0
+                },
+                'queue_depth_history': list(self.queue_depth_history),
+                'callbacks': callbacks
+            }
+
+    def format_summary(self) -> str:
+        """
+        生成多行统计摘要文本
+
+        Returns:
+            str: 统计摘要
+        """
+        data = self.snapshot()
+        lines = [
+            f"帧数: {data['frames']}  平均: {data['avg_frame_ms']:.1f}ms  最大: {data['max_frame_ms']:.1f}ms",
+            f"掉帧: {data['dropped_frames']}  队列: {data['queue_depth']['current']} (最大 {data['queue_depth']['max']})"
+        ]
+        # 按总耗时列出最重的几项回调
+        heaviest = sorted(data['callbacks'].items(), key=lambda item: item[1]['total_ms'], reverse=True)[:4]
+        for name, cost in heaviest:
+            lines.append(f"{name}: {cost['avg_ms']:.2f}ms x{cost['count']}")
+        return "\n".join(lines)
+
+
+class MetricsOverlay:
+    """画布性能浮层，在视口角落实时显示统计摘要"""
+
+    TAG = "metrics_overlay"
+    # 浮层与视口左上角的距离（像素）
+    MARGIN = 10
+
+    def __init__(self, canvas: tk.Canvas, metrics: EngineMetrics, refresh_ms: int = 500):
+        """
+        初始化性能浮层
+
+        Args:
+            canvas: Tkinter画布对象
+            metrics: 引擎性能统计对象
+            refresh_ms: 刷新间隔（毫秒）
+        """
+        self.canvas = canvas
+        self.metrics = metrics
+        self.refresh_ms = refresh_ms
+        self.visible = False
+        self._text_item = None
+        self._after_id = None
+
+    def show(self) -> None:
+        """显示浮层并开始定时刷新"""
+        if self.visible:
+            return
+        self.visible = True
+        self._text_item = self.canvas.create_text(
+            *self._viewport_origin(), anchor=tk.NW, text="", font=("Consolas", 9),
+            fill="#333333", tags=(self.TAG,)
+        )
+        self._refresh()
+
+    def hide(self) -> None:
+        """隐藏浮层并停止刷新"""
+        self.visible = False
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+        self.canvas.delete(self.TAG)
+        self._text_item = None
+
+    def _viewport_origin(self) -> tuple:
+        """获取浮层在画布坐标中的位置（视口左上角加边距）"""
+        try:
+            return (self.canvas.canvasx(0) + self.MARGIN, self.canvas.canvasy(0) + self.MARGIN)
+        except Exception:
+            return self.MARGIN, self.MARGIN
+
+    def toggle(self) -> None:
+        """切换浮层显示状态"""
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+
+    def _refresh(self) -> None:
+        """刷新浮层文本"""
+        if not self.visible:
+            return
+        self.canvas.itemconfig(self._text_item, text=self.metrics.format_summary())
+        # 画布可能已经滚动，每次刷新时按视口位置重新放置
+        self.canvas.coords(self._text_item, *self._viewport_origin())
+        self.canvas.tag_raise(self.TAG)
+        self._after_id = self.canvas.after(self.refresh_ms, self._refresh)
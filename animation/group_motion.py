@@ -0,0 +1,208 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 群体运动动画模块
+
+该模块提供作用于一整组鸭子的动画。每帧用一次向量运算算出所有鸭子的
+位置（安装了NumPy时使用NumPy，否则使用等价的纯Python实现），再通过
+显示列表在帧末一次性提交，不再为每只鸭子单独安排定时器。
+
+主要功能:
+- GroupMotion: 群体运动类，保存一组鸭子的基准位置和运动参数
+- GroupMotionAnimator: 群体运动动画器，创建波浪、跳跃和已排序依次显示等群体动画
+
+主要类:
+- GroupMotion: 群体运动类
+- GroupMotionAnimator: 群体运动动画器
+"""
+
+import math
+from typing import Callable, List, Optional
+
+from .animation_engine import Animation, AnimationType, AnimationEngine
+
+try:
+    import numpy as np
+except ImportError:  # NumPy是可选依赖，没有安装时使用纯Python实现
+    np = None
+
+
+def _wave_offsets(motion: 'GroupMotion', progress: float):
+    """波浪：每只鸭子按相位依次起伏，整体幅度先增大后减小"""
+    amplitude = motion.amplitude * math.sin(math.pi * progress)
+    angle = 2 * math.pi * motion.cycles * progress
+    if np is not None:
+        return -amplitude * np.sin(angle - 2 * math.pi * motion.phases)
+    return [-amplitude * math.sin(angle - 2 * math.pi * phase) for phase in motion.phases]
+
+
+def _jump_offsets(motion: 'GroupMotion', progress: float):
+    """跳跃：每只鸭子按顺序错开起跳，各自跳一次"""
+    span = 1.0 - motion.stagger
+    if np is not None:
+        local = np.clip((progress - motion.phases * motion.stagger) / span, 0.0, 1.0)
+        return -motion.amplitude * np.sin(math.pi * local)
+    offsets = []
+    for phase in motion.phases:
+        local = min(1.0, max(0.0, (progress - phase * motion.stagger) / span))
+        offsets.append(-motion.amplitude * math.sin(math.pi * local))
+    return offsets
+
+
+class GroupMotion:
+    """群体运动类，保存一组鸭子的基准位置和运动参数"""
+
+    __slots__ = ('ducks', 'offset_func', 'amplitude', 'cycles', 'stagger',
+                 'reveal', 'phases', 'base_x', 'base_y', 'revealed')
+
+    def __init__(self,
+                 ducks: List,
+                 offset_func: Optional[Callable] = None,
+                 amplitude: float = 0.0,
+                 cycles: float = 1.0,
+                 stagger: float = 0.0,
+                 reveal: bool = False):
+        """
+        初始化群体运动
+
+        Args:
+            ducks: 鸭子列表
+            offset_func: 计算所有鸭子y方向偏移的函数 f(motion, progress)，None表示不移动
+            amplitude: 运动幅度（像素）
+            cycles: 波浪的周期数
+            stagger: 跳跃时起跳时间错开的比例（0到1之间）
+            reveal: 是否按从左到右的顺序依次标记为已排序
+        """
+        self.ducks = list(ducks)
+        self.offset_func = offset_func
+        self.amplitude = amplitude
+        self.cycles = cycles
+        self.stagger = min(0.9, max(0.0, stagger))
+        self.reveal = reveal
+        count = len(self.ducks)
+        phases = [index / count for index in range(count)] if count else []
+        self.phases = np.array(phases) if np is not None else phases
+        self.base_x = None  # 基准位置在动画开始时记录
+        self.base_y = None
+        self.revealed = 0   # 已标记为已排序的鸭子数量
+
+    def capture_base(self) -> None:
+        """记录所有鸭子当前的位置作为基准位置"""
+        xs = [duck.x for duck in self.ducks]
+        ys = [duck.y for duck in self.ducks]
+        if np is not None:
+            self.base_x = np.array(xs, dtype=float)
+            self.base_y = np.array(ys, dtype=float)
+        else:
+            self.base_x = xs
+            self.base_y = ys
+
+    def compute_y(self, progress: float):
+        """
+        计算所有鸭子在指定进度时的y坐标
+
+        Args:
+            progress: 动画进度
+
+        Returns:
+            所有鸭子的y坐标（NumPy数组或列表）
+        """
+        offsets = self.offset_func(self, progress)
+        if np is not None:
+            return self.base_y + offsets
+        return [y + offset for y, offset in zip(self.base_y, offsets)]
+
+
+def _update_group(animation: Animation, progress: float) -> None:
+    """群体动画的进度更新函数：一次算出所有鸭子的位置并写入显示列表"""
+    motion = animation.params
+    if motion.offset_func is not None:
+        if motion.base_y is None:
+            motion.capture_base()
+        ys = motion.compute_y(progress)
+        for duck, x, y in zip(motion.ducks, motion.base_x, ys):
+            animation.move_target(duck, float(x), float(y))
+
+    if motion.reveal:
+        count = min(len(motion.ducks), int(progress * len(motion.ducks)) + 1)
+        for duck in motion.ducks[motion.revealed:count]:
+            animation.set_target_state(duck, sorted=True)
+        motion.revealed = max(motion.revealed, count)
+
+
+def _complete_group(animation: Animation) -> None:
+    """群体动画的完成函数：所有鸭子回到基准位置"""
+    motion = animation.params
+    if motion.base_y is not None:
+        for duck, x, y in zip(motion.ducks, motion.base_x, motion.base_y):
+            animation.move_target(duck, float(x), float(y))
+    if motion.reveal:
+        for duck in motion.ducks[motion.revealed:]:
+            animation.set_target_state(duck, sorted=True)
+        motion.revealed = len(motion.ducks)
+
+
+class GroupMotionAnimator:
+    """群体运动动画器，创建波浪、跳跃和已排序依次显示等群体动画"""
+
+    def __init__(self, engine: AnimationEngine):
+        """
+        初始化群体运动动画器
+
+        Args:
+            engine: 动画引擎
+        """
+        self.engine = engine
+
+    def _create(self, motion: GroupMotion, animation_type: AnimationType, duration: float) -> Animation:
+        """从对象池创建驱动群体运动的动画"""
+        return self.engine.acquire_animation(
+            animation_type, duration, update_func=_update_group,
+            complete_func=_complete_group, params=motion
+        )
+
+    def wave(self, ducks: List, amplitude: float = 15, cycles: float = 2, duration: float = 2.0) -> Animation:
+        """
+        创建波浪动画
+
+        Args:
+            ducks: 鸭子列表
+            amplitude: 最大起伏高度
+            cycles: 波浪经过的周期数
+            duration: 动画持续时间
+
+        Returns:
+            Animation: 创建的波浪动画
+        """
+        motion = GroupMotion(ducks, _wave_offsets, amplitude=amplitude, cycles=cycles)
+        return self._create(motion, AnimationType.CUSTOM, duration)
+
+    def jump(self, ducks: List, height: float = 30, stagger: float = 0.6, duration: float = 1.5) -> Animation:
+        """
+        创建依次跳跃动画
+
+        Args:
+            ducks: 鸭子列表
+            height: 跳跃高度
+            stagger: 起跳时间错开的比例，0表示同时起跳
+            duration: 动画持续时间
+
+        Returns:
+            Animation: 创建的跳跃动画
+        """
+        motion = GroupMotion(ducks, _jump_offsets, amplitude=height, stagger=stagger)
+        return self._create(motion, AnimationType.CUSTOM, duration)
+
+    def reveal_sorted(self, ducks: List, duration: float = 2.0, height: float = 0) -> Animation:
+        """
+        创建已排序依次显示动画：从左到右依次标记为已排序，可同时依次跳起
+
+        Args:
+            ducks: 鸭子列表（按从左到右的顺序）
+            duration: 动画持续时间
+            height: 标记时跳起的高度，0表示不跳
+
+        Returns:
+            Animation: 创建的完成动画
+        """
+        motion = GroupMotion(ducks, _jump_offsets if height else None,
+                             amplitude=height, stagger=0.6, reveal=True)
+        return self._create(motion, AnimationType.COMPLETE, duration)
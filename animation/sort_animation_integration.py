@@ -2,10 +2,18 @@
 小鸭子冒泡排序可视化动画项目 - 排序动画集成模块
 
 该模块提供动画系统与排序算法的集成接口，负责接收排序算法的
-状态变化通知并触发相应的动画效果。
+状态变化通知并触发相应的动画效果。排序步骤只在主线程中执行：动画
+线程的回调只通过after_idle请求补充，主线程从前瞻缓冲区消费排序步骤，
+把动画提前排入队列（领先播放不超过一定的深度和时长），动画线程按
+自己的节奏连续播放，不需要等队列为空再往返一次。提前排队的动画使用
+各位置（槽位）的坐标，鸭子不会在动画开始前跳到新位置。快速播放模式
+下跳过过渡动画，主线程预先算好每帧应用的一批排序步骤，动画线程每帧
+只把最终位置和比较状态批量提交到画布。
 
 主要功能:
 - SortAnimationIntegration: 排序动画集成类，连接排序算法和动画系统
+- 提前排队: 主线程按前瞻深度补充动画队列
+- 快速播放: 每帧应用多步排序，统计数据保持准确
 
 主要类:
 - SortAnimationIntegration: 排序动画集成类
@@ -13,15 +21,38 @@
 
 from typing import List, Optional, Callable
 from algorithms.bubble_sort import BubbleSort
+from algorithms.sort_pipeline import StepKind
 from src.graphics import BabyDuck, MotherDuck
-from .animation_engine import AnimationEngine, AnimationState
-from .animators import DuckAnimator, SwapAnimator, HighlightAnimator, MotherDuckAnimator, ComparisonAnimator
+from .animation_engine import Animation, AnimationEngine, AnimationState, AnimationType
+from .group_motion import GroupMotionAnimator
+from .animators import (DuckAnimator, SwapAnimator, HighlightAnimator, MotherDuckAnimator,
+                        MotherTravelPlanner, ComparisonAnimator, COMPARE_WALK_END)
 from src.logger import get_logger, log_animation_event
 
 
+def _update_turbo(animation: Animation, progress: float) -> None:
+    """
+    快速播放动画的每帧更新：按进度提交预先算好的各批结果（target为排序动画集成对象，
+    params为[批次列表, 已提交的批数]），每帧提交一批，跳到结束时提交剩余的全部批次
+    """
+    batches = animation.params[0]
+    count = len(batches) if progress >= 1.0 else min(len(batches), int(progress * len(batches)) + 1)
+    while animation.params[1] < count:
+        animation.target._apply_turbo_batch(animation.display_list, batches[animation.params[1]])
+        animation.params[1] += 1
+
+
 class SortAnimationIntegration:
     """排序动画集成类，连接排序算法和动画系统"""
     
+    # 快速播放模式下每帧应用的排序步数（60帧/秒时约为每秒一万两千步）
+    TURBO_STEPS_PER_FRAME = 200
+    # 一个快速播放动画包含的帧数（动画的最短持续时间为0.1秒）
+    TURBO_FRAMES_PER_ANIMATION = 6
+    # 提前排队的上限：队列中的动画数量和剩余播放时长（秒），保持在积压策略的阈值之下
+    FEED_DEPTH = 12
+    FEED_LAG = 1.5
+    
     def __init__(self,
                  bubble_sort: BubbleSort,
                  baby_ducks: List[BabyDuck],
@@ -50,10 +81,13 @@ class SortAnimationIntegration:
         self.highlight_animator = HighlightAnimator(engine)
         self.mother_duck_animator = MotherDuckAnimator(mother_duck, engine)
         self.comparison_animator = ComparisonAnimator(engine)
+        self.travel_planner = MotherTravelPlanner(mother_duck)
+        self.group_animator = GroupMotionAnimator(engine)
         self.logger.info(f"创建了 {len(self.duck_animators)} 个鸭子动画器")
         
         # 动画配置
         self.animation_speed = 1.0
+        self.compare_duration = 1.5  # 一次比较的总时长（秒，正常速度下）
         self.enable_compare_animation = True
         self.enable_swap_animation = True
         self.enable_highlight_animation = True
@@ -63,6 +97,29 @@ class SortAnimationIntegration:
         self.is_animating = False
         self.animation_queue = []
         
+        # 主线程从前瞻缓冲区消费排序步骤，把动画提前排入队列
+        self.use_pipeline = True
+        self.feed_depth = self.FEED_DEPTH
+        self.feed_lag = self.FEED_LAG
+        self._feed_scheduled = False  # 是否已请求补充队列（尚未执行）
+        self._feed_generation = 0     # 停止或重新开始时递增，使之前请求的补充失效
+        self._autoplay = False        # 补充队列后是否启动动画引擎（由开始排序或单步执行启动时为True）
+        
+        # 各位置（槽位）的坐标，列表中第i只鸭子的动画最终停在第i个位置
+        self._slots = None
+        
+        # 快速播放模式：跳过过渡动画，每帧应用一批排序步骤并只提交最终位置和状态
+        self.turbo = False
+        self.turbo_steps_per_frame = self.TURBO_STEPS_PER_FRAME
+        self._turbo_fed = False   # 最近排入队列的是否为快速播放批次（主线程）
+        self._turbo_pair = None   # 当前标记为正在比较的两只鸭子（动画线程）
+        
+        # 可滚动的虚拟场景（鸭子多于画布能容纳的数量时使用）
+        self.virtual_scene = None
+        
+        # 鸭子的位置由动画负责，排序算法交换时不移动图形
+        self.bubble_sort.move_graphics = False
+        
         # 设置排序算法回调
         self._setup_sort_callbacks()
         
@@ -101,15 +158,16 @@ class SortAnimationIntegration:
         # 获取比较的鸭子
         duck1 = self.baby_ducks[index1]
         duck2 = self.baby_ducks[index2]
+        slots = self._get_slots()
         
-        # 创建比较动画序列
-        animations = self.comparison_animator.compare_ducks(
-            self.mother_duck, duck1, duck2, 1.5 / self.animation_speed
+        # 创建融合的比较动画（行走、指向、高亮、点头由同一个动画驱动）
+        compare_anim = self.comparison_animator.compare_timeline(
+            self.mother_duck, duck1, duck2, self.compare_duration / self.animation_speed,
+            planner=self.travel_planner, positions=(slots[index1][0], slots[index2][0])
         )
         
         # 添加到动画队列
-        for anim in animations:
-            self.engine.add_animation(anim)
+        self.engine.add_animation(compare_anim)
             
     def _on_swap(self, index1: int, index2: int) -> None:
         """
@@ -134,9 +192,17 @@ class SortAnimationIntegration:
         self.logger.debug(f"创建交换动画: 鸭子 {index1} (值: {duck1.value}) 和 鸭子 {index2} (值: {duck2.value})")
         
         try:
-            # 创建交换动画
+            # 交换的两只鸭子在弧线上经过其他鸭子上方，先整体提升到最上层
+            duck1.raise_to_top()
+            duck2.raise_to_top()
+
+            # 创建交换动画（尾段同时让母鸭走向下一次比较的位置），从两个槽位出发
+            slots = self._get_slots()
+            swap_duration = 1.0 / self.animation_speed
             swap_anim = self.swap_animator.swap_ducks(
-                duck1, duck2, 1.0 / self.animation_speed
+                duck1, duck2, swap_duration,
+                mother_leg=self._plan_mother_leg(index2, swap_duration),
+                start1=slots[index1], start2=slots[index2]
             )
             self.logger.debug("交换动画创建成功")
             
@@ -154,26 +220,86 @@ class SortAnimationIntegration:
             self.logger.error(f"创建交换动画时发生错误: {str(e)}")
             raise
         
+    def _plan_mother_leg(self, index2: int, swap_duration: float) -> Optional[tuple]:
+        """
+        规划在交换尾段进行的母鸭行走：交换(j, j+1)之后下一次比较的是(j+1, j+2)，
+        母鸭可以在交换进行时提前走过去，下一次比较就不需要再行走
+        
+        Args:
+            index2: 交换的第二个元素的索引
+            swap_duration: 交换动画的持续时间
+            
+        Returns:
+            Optional[tuple]: 交换动画使用的母鸭行走参数，不需要提前行走时为None
+        """
+        if not self.enable_compare_animation:
+            return None
+        # 从前瞻缓冲区查看下一步：必须是本轮内对(index2, index2 + 1)的比较
+        upcoming = self.bubble_sort.peek_step()
+        if upcoming is None or upcoming.kind != StepKind.COMPARE or upcoming.index1 != index2:
+            return None
+        
+        # 下一次比较的两只鸭子播放时停在index2和index2 + 1两个槽位上
+        slots = self._get_slots()
+        target_x, target_y = self.comparison_animator.get_position_between(
+            self.mother_duck, slots[index2][0], slots[index2 + 1][0]
+        )
+        from_x, from_y = self.travel_planner.get_planned_position()
+        # 行走最多占交换的后半段
+        max_walk = self.compare_duration * COMPARE_WALK_END / self.animation_speed
+        walk_time = min(self.travel_planner.plan_walk(target_x, target_y, max_walk), swap_duration * 0.5)
+        if walk_time <= 0:
+            return None
+        return (self.mother_duck, 1 - walk_time / swap_duration, from_x, from_y, target_x, target_y)
+        
     def _on_complete(self) -> None:
         """完成回调函数，当排序完成时触发"""
         if not self.enable_complete_animation:
             return
             
-        # 创建完成动画
-        complete_anim = self.engine.create_complete_animation(
+        # 创建完成动画：从左到右依次标记为已排序，状态变化每帧批量提交
+        complete_anim = self.group_animator.reveal_sorted(
             self.baby_ducks, 2.0 / self.animation_speed
         )
         
         # 添加到动画队列
         self.engine.add_animation(complete_anim)
         
-        # 母鸭庆祝动画
+        # 母鸭庆祝动画（之后母鸭的位置不再由行程规划器掌握）
+        self.travel_planner.reset()
         celebrate_anim = self.mother_duck_animator.celebrate(2.0 / self.animation_speed)
         self.engine.add_animation(celebrate_anim)
         
+    def set_mother_lane(self, lane_y: Optional[float]) -> None:
+        """
+        设置母鸭比较时所在行走线的y坐标（布局变化后调用）
+        
+        Args:
+            lane_y: 行走线的y坐标，None表示按画布的当前高度计算
+        """
+        self.comparison_animator.lane_y = lane_y
+        
+    def set_virtual_scene(self, scene) -> None:
+        """
+        设置虚拟场景：每帧末尾按视口更新鸭子的画布元素，比较开始时视口跟随比较的鸭子
+        
+        Args:
+            scene: 虚拟场景对象（VirtualScene），None表示不使用
+        """
+        self.virtual_scene = scene
+        if scene is not None:
+            scene.attach(self.engine)
+            scene.update()
+        else:
+            self.engine.on_frame_end = None
+        
     def _on_animation_start(self, animation) -> None:
-        """动画开始回调"""
+        """动画开始回调（在动画线程中调用）"""
         self.is_animating = True
+        # 播放一个动画时就补充队列，动画线程不需要等队列为空再往返
+        self._request_feed()
+        if self.virtual_scene is not None and animation.type == AnimationType.COMPARE:
+            self.virtual_scene.follow(animation.params[0].x)
         
     def _on_animation_complete(self, animation) -> None:
         """动画完成回调"""
@@ -181,7 +307,7 @@ class SortAnimationIntegration:
         pass
         
     def _on_queue_empty(self) -> None:
-        """动画队列为空回调"""
+        """动画队列为空回调（在动画线程中调用）"""
         self.logger.debug("动画队列为空回调开始")
         self.logger.debug(f"当前状态 - is_animating: {self.is_animating}, 排序完成: {self.bubble_sort.is_completed()}")
 
@@ -190,7 +316,10 @@ class SortAnimationIntegration:
         self.logger.debug("设置 is_animating = False")
 
         # 如果排序还没完成，继续下一步
-        if not self.bubble_sort.is_completed():
+        if not self.bubble_sort.is_completed() and self.use_pipeline:
+            # 正常情况下队列在播放中已被提前补充，这里只处理补充不及时或步骤没有动画的情况
+            self._request_feed()
+        elif not self.bubble_sort.is_completed():
             self.logger.debug("排序未完成，使用after()调度下一步排序")
             try:
                 # 🔧 关键修复：使用canvas.after()在主线程中异步执行下一步
@@ -204,6 +333,175 @@ class SortAnimationIntegration:
         else:
             self.logger.debug("排序已完成，不继续执行")
     
+    def _request_feed(self) -> None:
+        """
+        请求在主线程空闲时补充动画队列（可以在动画线程中调用，排序步骤和画布操作
+        都在主线程中执行；已请求而尚未执行时不重复调度）
+        """
+        if not self.use_pipeline or self._feed_scheduled:
+            return
+        self._feed_scheduled = True
+        try:
+            self.engine.canvas.after_idle(self._feed, self._feed_generation)
+        except Exception as e:
+            self._feed_scheduled = False
+            self.logger.error(f"调度补充动画队列时发生错误: {str(e)}")
+    
+    def _needs_feed(self) -> bool:
+        """检查动画队列是否低于提前排队的上限"""
+        return (self.engine.get_queue_length() < self.feed_depth
+                and self.engine.get_lag() < self.feed_lag)
+    
+    def _feed(self, generation: int) -> None:
+        """
+        在主线程中补充动画队列：让生产者补满前瞻缓冲区，再依次消费排序步骤并把动画
+        排入队列，直到队列达到提前排队的上限、排序暂停或完成
+        
+        Args:
+            generation: 请求时的补充代数，排序被停止或重新开始后请求失效
+        """
+        self._feed_scheduled = False
+        if generation != self._feed_generation:
+            return
+        sorter = self.bubble_sort
+        try:
+            sorter.pipeline.fill()
+            while not sorter.is_completed() and not sorter.is_paused() and self._needs_feed():
+                self.is_animating = True
+                self._feed_step()
+        except Exception as e:
+            self.logger.error(f"补充动画队列时发生错误: {str(e)}")
+        if self._autoplay and self.engine.get_queue_length() > 0 and not self.engine.is_playing():
+            self.engine.play()
+    
+    def _feed_step(self) -> bool:
+        """
+        消费一步排序（快速播放时为一个快速播放动画的全部批次）并把动画排入队列
+        
+        Returns:
+            bool: 是否执行了操作（False表示排序已完成）
+        """
+        if self.turbo:
+            self._queue_turbo_animation()
+            return True
+        if self._turbo_fed:
+            # 快速播放刚关闭：先排入一帧清除比较标记
+            self._queue_turbo_batches([((), None, 0.0, 0.0)])
+            self._turbo_fed = False
+        return self.bubble_sort.step()
+        
+    def set_turbo(self, enabled: bool, steps_per_frame: Optional[int] = None) -> None:
+        """
+        开启或关闭快速播放模式：开启后比较和交换不再创建过渡动画，每帧直接应用一批
+        排序步骤，只把鸭子的最终位置和比较状态批量提交到画布。播放中切换时在当前
+        动画结束后生效
+        
+        Args:
+            enabled: 是否开启快速播放
+            steps_per_frame: 每帧应用的排序步数，None表示不修改
+        """
+        self.turbo = enabled
+        if steps_per_frame is not None:
+            self.turbo_steps_per_frame = max(1, int(steps_per_frame))
+        
+    def _get_slots(self) -> list:
+        """获取各位置（槽位）的坐标，第一次使用时按鸭子当前停放的位置记录"""
+        if self._slots is None:
+            self._slots = [(duck.x, duck.y) for duck in self.baby_ducks]
+        return self._slots
+        
+    def _queue_turbo_animation(self) -> None:
+        """
+        在主线程中算好一个快速播放动画的各批结果：每批应用多步排序（排序只交换顺序和
+        更新统计），记录位置变化的鸭子的最终槽位和最后比较的一对鸭子，由动画线程每帧
+        提交一批。排序完成时之后排入完成动画
+        """
+        sorter = self.bubble_sort
+        slots = self._get_slots()
+        ducks = self.baby_ducks
+        batches = []
+        sorter.quiet = True
+        try:
+            for _ in range(self.TURBO_FRAMES_PER_ANIMATION):
+                moved = set()
+                pair = None
+                for _ in range(self.turbo_steps_per_frame):
+                    if not sorter.step():
+                        break
+                    if sorter.current_swap[0] >= 0:
+                        moved.update(sorter.current_swap)
+                    if sorter.current_comparison[0] >= 0:
+                        pair = sorter.current_comparison
+                placements = tuple((ducks[index],) + tuple(slots[index]) for index in moved)
+                if sorter.is_completed() or pair is None:
+                    batches.append((placements, None, 0.0, 0.0))
+                else:
+                    # 母鸭直接站到最后比较的一对鸭子上方（不行走），之后的比较从这里规划行走
+                    x, y = self.comparison_animator.get_position_between(
+                        self.mother_duck, slots[pair[0]][0], slots[pair[1]][0])
+                    self.travel_planner.plan_walk(x, y, 0.0)
+                    batches.append((placements, (ducks[pair[0]], ducks[pair[1]]), x, y))
+                if sorter.is_completed():
+                    break
+        finally:
+            sorter.quiet = False
+        
+        self._queue_turbo_batches(batches)
+        self._turbo_fed = not sorter.is_completed()
+        if sorter.is_completed():
+            # 安静模式下排序算法不调用完成回调，完成动画排在最后一批之后
+            self._on_complete()
+        
+    def _queue_turbo_batches(self, batches: list) -> None:
+        """
+        把预先算好的各批结果作为一个快速播放动画排入队列
+        
+        Args:
+            batches: 每帧提交的一批结果 (位置变化列表, 比较的一对鸭子或None, 母鸭x, 母鸭y)
+        """
+        self.engine.add_animation(self.engine.acquire_animation(
+            AnimationType.TURBO, self.engine.frame_interval * len(batches),
+            update_func=_update_turbo, target=self, params=[batches, 0]
+        ))
+        
+    def _apply_turbo_batch(self, display_list, batch: tuple) -> None:
+        """
+        在动画线程中提交一批快速播放的结果：位置变化的鸭子直接放到最终槽位，最后比较的
+        一对鸭子标记为正在比较，母鸭站到它们上方，全部写入显示列表在帧末一次提交
+        
+        Args:
+            display_list: 动画引擎的显示列表
+            batch: (位置变化列表, 比较的一对鸭子或None, 母鸭x, 母鸭y)
+        """
+        placements, pair, mother_x, mother_y = batch
+        for duck, x, y in placements:
+            display_list.move(duck, x, y)
+        
+        if self._turbo_pair is not None:
+            for duck in self._turbo_pair:
+                display_list.set_state(duck, comparing=False)
+        self._turbo_pair = pair
+        if pair is None:
+            return
+        for duck in pair:
+            display_list.set_state(duck, comparing=True)
+        display_list.move(self.mother_duck, mother_x, mother_y)
+        if self.virtual_scene is not None:
+            self.virtual_scene.follow(mother_x)
+        
+    def _reset_turbo_state(self) -> None:
+        """丢弃记录的槽位坐标、快速播放的比较标记和母鸭的行程规划"""
+        self._slots = None
+        self._turbo_fed = False
+        self._turbo_pair = None
+        self.travel_planner.reset()
+        
+    def _stop_feeding(self) -> None:
+        """使已请求的补充失效，并停止在补充后自动启动引擎"""
+        self._feed_generation += 1
+        self._feed_scheduled = False
+        self._autoplay = False
+        
     def _execute_next_step(self) -> None:
         """执行下一步排序（在主线程中调用）"""
         try:
@@ -251,7 +549,9 @@ class SortAnimationIntegration:
             self.logger.debug("排序状态已重置")
             
             # 清空动画队列
+            self._stop_feeding()
             self.engine.clear_queue()
+            self._reset_turbo_state()
             self.logger.debug("动画队列已清空")
             
             # 开始播放动画
@@ -265,8 +565,13 @@ class SortAnimationIntegration:
             self.logger.error(f"开始动画排序时发生错误: {str(e)}")
             raise
         
-    def step_sort(self) -> None:
-        """执行排序的一步"""
+    def step_sort(self, restart_engine: bool = True) -> None:
+        """
+        执行排序的一步
+        
+        Args:
+            restart_engine: 引擎未在播放时是否启动引擎，并在之后补充队列时保持播放
+        """
         self.logger.debug(f"step_sort 开始 - is_animating: {self.is_animating}, 排序完成: {self.bubble_sort.is_completed()}")
 
         # 添加更严格的状态检查
@@ -283,30 +588,31 @@ class SortAnimationIntegration:
         self.is_animating = True
         self.logger.debug("临时设置 is_animating = True")
 
+        if restart_engine:
+            self._autoplay = True
+
         try:
             self.logger.debug("执行排序算法的一步")
-            # 执行排序算法的一步
-            has_step = self.bubble_sort.step()
+            # 执行排序算法的一步（快速播放时加入一个快速播放动画，is_animating在队列为空时重置）
+            has_step = self._feed_step()
             self.logger.debug(f"排序步骤执行结果: {has_step}")
 
             # 添加额外的数据验证
             self._validate_data_consistency()
 
             if not has_step:
-                # 排序完成
-                self.logger.debug("排序算法返回False，触发完成回调")
-                self._on_complete()
-                # 排序完成后重置状态
+                # 排序完成（完成动画由排序算法的完成回调加入）
+                self.logger.debug("排序算法返回False，排序已完成")
                 self.is_animating = False
             else:
                 self.logger.debug("排序步骤执行成功，继续等待动画完成")
 
                 # 🔧 关键修复：不要立即重置is_animating，等待动画完成后再重置
                 # 这样可以防止在动画还没完成时就执行下一步
-                # is_animating 会在 _on_queue_empty 中重置
+                # is_animating 会在 _on_queue_empty 中重置，之后的步骤在动画开始播放时补充
                 
                 # 确保动画引擎在播放状态
-                if not self.engine.is_playing():
+                if restart_engine and not self.engine.is_playing():
                     self.logger.debug("动画引擎未播放，重新启动")
                     self.engine.play()
         except Exception as e:
@@ -342,18 +648,43 @@ class SortAnimationIntegration:
         """恢复动画"""
         self.engine.resume()
         self.bubble_sort.resume()
+        self._request_feed()
         
     def stop_animation(self) -> None:
         """停止动画"""
+        self._stop_feeding()
         self.engine.stop()
+        # 提前排队的动画被丢弃，鸭子回到列表顺序对应的槽位
+        if self._slots is not None:
+            for duck, (x, y) in zip(self.bubble_sort.ducks, self._slots):
+                duck.move_to(x, y)
         self.bubble_sort.reset()
+        self._reset_turbo_state()
+        self.is_animating = False
         
         # 重置所有鸭子状态
         for duck in self.baby_ducks:
-            duck.set_sorted(False)
-            duck.set_comparing(False)
-            duck.highlight(False)
+            duck.set_state(highlighted=False, comparing=False, sorted=False)
             
+    def rebind(self, baby_ducks: List[BabyDuck]) -> None:
+        """
+        绑定新的小鸭子列表并复用现有的排序算法、动画引擎和动画器：停止引擎
+        （等待动画线程结束，不启动新线程），重建鸭子动画器并重置排序状态，
+        已设置的回调保持不变
+        
+        Args:
+            baby_ducks: 新的小鸭子列表
+        """
+        self._stop_feeding()
+        self.engine.stop()
+        self.baby_ducks = baby_ducks
+        self.duck_animators = [DuckAnimator(duck, self.engine) for duck in baby_ducks]
+        self.bubble_sort.rebind(baby_ducks)
+        self._reset_turbo_state()
+        self.is_animating = False
+        self.animation_queue = []
+        self.logger.info(f"重新绑定了 {len(baby_ducks)} 只小鸭子")
+        
     def set_animation_speed(self, speed: float) -> None:
         """
         设置动画速度
@@ -364,6 +695,15 @@ class SortAnimationIntegration:
         self.animation_speed = max(0.1, speed)
         self.engine.set_speed(self.animation_speed)
         
+    def set_compare_duration(self, duration: float) -> None:
+        """
+        设置一次比较动画的总时长
+        
+        Args:
+            duration: 正常速度下的比较时长（秒）
+        """
+        self.compare_duration = max(0.1, duration)
+        
     def enable_animation(self, 
                         compare: bool = True, 
                         swap: bool = True, 
@@ -447,6 +787,12 @@ class SortAnimationIntegration:
         """检查排序是否完成"""
         return self.bubble_sort.is_completed()
         
+    def is_playback_finished(self) -> bool:
+        """检查排序是否完成且所有动画（包括完成动画）都已播放完毕"""
+        engine = self.engine
+        return (self.bubble_sort.is_completed() and engine.current_animation is None
+                and engine.get_queue_length() == 0)
+        
     def get_sort_progress(self) -> float:
         """获取排序进度"""
         return self.bubble_sort.get_progress()
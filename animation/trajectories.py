@@ -0,0 +1,304 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 交换轨迹模块
+
+该模块为交换动画预先生成平滑的弧形关键帧轨迹，按(横向距离, 鸭子1大小,
+鸭子2大小)缓存。生成时对关键帧之间的线性插值做解析检查：两只鸭子的相对
+位移在每一段内都是线性的，其到原点的最小距离可以精确求出，因此能够保证
+整条轨迹上两只鸭子的包围圆都不会重叠，不需要再通过实际播放动画来检查。
+起点距离本来就小于要求间距的两只鸭子，只在起飞和落地阶段允许保持起点距离，
+这种轨迹会被标记为未满足间距并记录警告。缓存键按0.5像素量化，
+布局或细节级别变化产生的微小尺寸差异可以共用同一条轨迹。
+
+主要功能:
+- SwapTrajectory: 交换轨迹类，保存关键帧并按进度插值
+- TrajectoryCache: 轨迹缓存类，按距离和鸭子大小生成并缓存轨迹
+- get_swap_trajectory: 从共享缓存获取交换轨迹
+- collision_radius: 计算鸭子的碰撞包围圆半径
+
+主要类:
+- SwapTrajectory: 交换轨迹类
+- TrajectoryCache: 轨迹缓存类
+
+主要函数:
+- get_swap_trajectory: 获取交换轨迹函数
+- collision_radius: 碰撞半径函数
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+from src.logger import get_logger
+
+# 关键帧数量
+KEYFRAME_COUNT = 48
+# 碰撞包围圆半径与鸭子大小的比例（覆盖身体、头部和嘴巴）
+COLLISION_RADIUS_RATIO = 0.65
+# 两只鸭子包围圆之间保留的最小间隙（像素）
+CLEARANCE = 10.0
+# 弧线的基础抬升高度（像素）
+BASE_LIFT = 50.0
+# 起飞和落地阶段各占的关键帧比例，起点距离不足时这两个阶段只要求不比起点更近
+LIFTOFF_RATIO = 0.125
+# 缓存键的量化步长（像素）
+KEY_QUANTUM = 0.5
+
+
+def collision_radius(size: float) -> float:
+    """
+    计算鸭子的碰撞包围圆半径
+
+    Args:
+        size: 鸭子大小
+
+    Returns:
+        float: 包围圆半径
+    """
+    return size * COLLISION_RADIUS_RATIO
+
+
+def _segment_min_distance(ax: float, ay: float, bx: float, by: float) -> float:
+    """计算原点到线段AB的最短距离"""
+    dx = bx - ax
+    dy = by - ay
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return math.hypot(ax, ay)
+    t = max(0.0, min(1.0, -(ax * dx + ay * dy) / length_sq))
+    return math.hypot(ax + dx * t, ay + dy * t)
+
+
+def _quantize(value: float) -> float:
+    """将距离按缓存键的量化步长四舍五入"""
+    return round(value / KEY_QUANTUM) * KEY_QUANTUM
+
+
+def _quantize_size(size: float) -> float:
+    """将鸭子大小按量化步长向上取整（包围圆只会变大，间距保证仍然成立）"""
+    return math.ceil(size / KEY_QUANTUM - 1e-9) * KEY_QUANTUM
+
+
+class SwapTrajectory:
+    """交换轨迹类，保存关键帧并按进度插值"""
+
+    __slots__ = ('dx', 'dy', 'separation', 'required_distance', 'min_distance',
+                 'airborne_min_distance', 'clearance_met', '_keyframes')
+
+    def __init__(self, dx: float, dy: float, separation: float, keyframes: List[Tuple[float, float, float, float]],
+                 required_distance: float = 0.0, liftoff: int = 1):
+        """
+        初始化交换轨迹
+
+        Args:
+            dx: 鸭子2起点相对鸭子1起点的x偏移
+            dy: 鸭子2起点相对鸭子1起点的y偏移
+            separation: 弧线中点处两只鸭子的垂直间距
+            keyframes: 关键帧列表，每帧为(鸭子1的x偏移, 鸭子1的y偏移, 鸭子2的x偏移, 鸭子2的y偏移)，
+                       偏移分别相对各自的起点
+            required_distance: 要求保持的最小中心距离
+            liftoff: 起飞和落地阶段各占的关键帧数量
+        """
+        self.dx = dx
+        self.dy = dy
+        self.separation = separation
+        self.required_distance = required_distance
+        self._keyframes = keyframes
+        self.min_distance = self._compute_min_distance()
+        # 起飞之后、落地之前的最短距离
+        self.airborne_min_distance = self._compute_min_distance(liftoff, len(keyframes) - 1 - liftoff)
+        self.clearance_met = self.min_distance >= required_distance - 1e-9
+
+    def _compute_min_distance(self, first: int = 0, last: int = -1) -> float:
+        """
+        精确计算按关键帧线性插值时两只鸭子中心的最短距离
+
+        Args:
+            first: 起始关键帧序号
+            last: 结束关键帧序号（负数表示从末尾倒数）
+
+        Returns:
+            float: 两个关键帧之间的最短中心距离
+        """
+        keyframes = self._keyframes
+        last = last % len(keyframes)
+        if last <= first:
+            return float('inf')
+        previous = None
+        minimum = float('inf')
+        for x1, y1, x2, y2 in keyframes[first:last + 1]:
+            # 鸭子2相对鸭子1的位置
+            relative = (self.dx + x2 - x1, self.dy + y2 - y1)
+            if previous is not None:
+                minimum = min(minimum, _segment_min_distance(previous[0], previous[1], relative[0], relative[1]))
+            previous = relative
+        return minimum
+
+    def get_keyframes(self) -> List[Tuple[float, float, float, float]]:
+        """获取关键帧列表"""
+        return list(self._keyframes)
+
+    def offsets_at(self, progress: float) -> Tuple[float, float, float, float]:
+        """
+        获取指定进度时两只鸭子相对各自起点的偏移
+
+        Args:
+            progress: 动画进度
+
+        Returns:
+            Tuple[float, float, float, float]: (鸭子1的x偏移, 鸭子1的y偏移, 鸭子2的x偏移, 鸭子2的y偏移)
+        """
+        keyframes = self._keyframes
+        if progress <= 0.0:
+            return keyframes[0]
+        if progress >= 1.0:
+            return keyframes[-1]
+        position = progress * (len(keyframes) - 1)
+        index = int(position)
+        fraction = position - index
+        a = keyframes[index]
+        b = keyframes[index + 1]
+        return (a[0] + (b[0] - a[0]) * fraction, a[1] + (b[1] - a[1]) * fraction,
+                a[2] + (b[2] - a[2]) * fraction, a[3] + (b[3] - a[3]) * fraction)
+
+
+class TrajectoryCache:
+    """轨迹缓存类，按距离和鸭子大小生成并缓存轨迹"""
+
+    def __init__(self, keyframe_count: int = KEYFRAME_COUNT, clearance: float = CLEARANCE):
+        """
+        初始化轨迹缓存
+
+        Args:
+            keyframe_count: 每条轨迹的关键帧数量
+            clearance: 两只鸭子包围圆之间保留的最小间隙
+        """
+        self.keyframe_count = keyframe_count
+        self.clearance = clearance
+        self._cache: Dict[tuple, SwapTrajectory] = {}
+
+    def get(self, dx: float, size1: float, size2: float, dy: float = 0.0) -> SwapTrajectory:
+        """
+        获取（必要时生成）交换轨迹
+
+        Args:
+            dx: 鸭子2起点相对鸭子1起点的x偏移
+            size1: 鸭子1的大小
+            size2: 鸭子2的大小
+            dy: 鸭子2起点相对鸭子1起点的y偏移（同一排的鸭子为0）
+
+        Returns:
+            SwapTrajectory: 交换轨迹
+        """
+        dx = _quantize(dx)
+        dy = _quantize(dy)
+        size1 = _quantize_size(size1)
+        size2 = _quantize_size(size2)
+        # 同一排鸭子交换时按(dx, size1, size2)缓存
+        key = (dx, size1, size2) if dy == 0 else (dx, size1, size2, dy)
+        trajectory = self._cache.get(key)
+        if trajectory is None:
+            # 实际起点与量化后的起点最多相差半个量化步长，要求的距离留出这部分余量
+            trajectory = self.generate(dx, size1, size2, dy, margin=KEY_QUANTUM)
+            self._cache[key] = trajectory
+        return trajectory
+
+    def get_required_distance(self, dx: float, size1: float, size2: float, dy: float = 0.0) -> float:
+        """
+        获取轨迹必须保持的最小中心距离：两只包围圆加上间隙
+
+        Args:
+            dx: 鸭子2起点相对鸭子1起点的x偏移
+            size1: 鸭子1的大小
+            size2: 鸭子2的大小
+            dy: 鸭子2起点相对鸭子1起点的y偏移
+
+        Returns:
+            float: 最小中心距离
+        """
+        return collision_radius(size1) + collision_radius(size2) + self.clearance
+
+    def generate(self, dx: float, size1: float, size2: float, dy: float = 0.0,
+                 margin: float = 0.0) -> SwapTrajectory:
+        """
+        生成交换轨迹：两只鸭子沿同形状的弧线交换位置，鸭子1的弧线更高，
+        两条弧线之间的垂直间距在中点最大；间距不足时逐步加大直到通过检查。
+
+        起点距离小于要求间距时整条轨迹不可能满足要求：这时起飞和落地阶段
+        只要求不比起点更近，其余部分仍然保持完整的间距，返回的轨迹
+        clearance_met为False，并记录一条警告。
+
+        Args:
+            dx: 鸭子2起点相对鸭子1起点的x偏移
+            size1: 鸭子1的大小
+            size2: 鸭子2的大小
+            dy: 鸭子2起点相对鸭子1起点的y偏移
+            margin: 在要求的距离之外额外保留的余量
+
+        Returns:
+            SwapTrajectory: 通过不重叠检查的交换轨迹
+
+        Raises:
+            RuntimeError: 无法生成满足不重叠要求的轨迹
+        """
+        required = self.get_required_distance(dx, size1, size2, dy) + margin
+        start_distance = math.hypot(dx, dy)
+        liftoff = max(1, int(self.keyframe_count * LIFTOFF_RATIO))
+        separation = collision_radius(size1) + collision_radius(size2) + self.clearance
+        for _ in range(32):
+            trajectory = self._build(dx, dy, separation, required, liftoff)
+            if trajectory.clearance_met:
+                return trajectory
+            if (start_distance < required and trajectory.airborne_min_distance >= required - 1e-9
+                    and trajectory.min_distance >= start_distance - 1e-9):
+                get_logger().warning(
+                    "交换轨迹无法在起飞和落地阶段保持间距: 起点距离 {:.1f} < 要求距离 {:.1f} "
+                    "(dx={}, size1={}, size2={})".format(start_distance, required, dx, size1, size2))
+                return trajectory
+            separation *= 1.25
+        raise RuntimeError("无法生成不重叠的交换轨迹: dx={}, size1={}, size2={}".format(dx, size1, size2))
+
+    def _build(self, dx: float, dy: float, separation: float, required: float = 0.0,
+               liftoff: int = 1) -> SwapTrajectory:
+        """按给定的弧线间距生成关键帧"""
+        keyframes = []
+        lift1 = BASE_LIFT + separation / 2
+        lift2 = BASE_LIFT - separation / 2
+        last = self.keyframe_count - 1
+        for index in range(self.keyframe_count):
+            t = index / last
+            # 第一段和最后一段只做竖直移动：先抬起再横移，横移结束后再落下，
+            # 这样起点距离本来就很近的两只鸭子在离开起点时也不会更靠近
+            h = min(1.0, max(0.0, (index - 1) / (last - 2))) if last > 2 else t
+            eased = h * h * (3 - 2 * h)  # 平滑的起止速度
+            arc = math.sin(math.pi * t)
+            keyframes.append((dx * eased, dy * eased - lift1 * arc,
+                              -dx * eased, -dy * eased - lift2 * arc))
+        # 终点精确落在对方的起点
+        keyframes[-1] = (dx, dy, -dx, -dy)
+        return SwapTrajectory(dx, dy, separation, keyframes, required, liftoff)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# 所有交换动画共享的轨迹缓存
+_SHARED_CACHE = TrajectoryCache()
+
+
+def get_swap_trajectory(dx: float, size1: float, size2: float, dy: float = 0.0) -> SwapTrajectory:
+    """
+    从共享缓存获取交换轨迹
+
+    Args:
+        dx: 鸭子2起点相对鸭子1起点的x偏移
+        size1: 鸭子1的大小
+        size2: 鸭子2的大小
+        dy: 鸭子2起点相对鸭子1起点的y偏移
+
+    Returns:
+        SwapTrajectory: 交换轨迹
+    """
+    return _SHARED_CACHE.get(dx, size1, size2, dy)
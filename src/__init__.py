@@ -4,10 +4,24 @@
 该包包含项目的核心源代码：
 - main.py: 主应用程序
 - graphics.py: 图形模块
+- canvas_geometry.py: 画布几何模块
+- sprites.py: 鸭子精灵图模块
+- fonts.py: 字体缓存模块
+- duck_model.py: 鸭子模型模块
+- virtual_scene.py: 虚拟场景模块
+- layout.py: 场景布局模块
+- decorations.py: 画布装饰层模块
 - logger.py: 日志记录模块
 
 主要模块:
 - main: 主应用程序模块
 - graphics: 图形模块
+- canvas_geometry: 画布几何模块
+- sprites: 鸭子精灵图模块
+- fonts: 字体缓存模块
+- duck_model: 鸭子模型模块
+- virtual_scene: 虚拟场景模块
+- layout: 场景布局模块
+- decorations: 画布装饰层模块
 - logger: 日志记录模块
 """
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 画布几何模块
+
+该模块提供共享的画布几何服务。画布尺寸只在创建时查询一次，之后由
+<Configure>事件更新，移动鸭子和创建动画时的边界计算直接使用缓存，
+不再每次都同步调用winfo_width()/winfo_height()。缓存的尺寸是去掉
+边框和焦点高亮框之后的可绘制区域。画布可滚动时，安全边界按可滚动的
+场景范围计算。
+
+主要功能:
+- CanvasGeometry: 画布几何类，缓存画布尺寸和安全边界并提供位置限制
+- get_canvas_geometry: 获取画布共享的几何服务
+
+主要类:
+- CanvasGeometry: 画布几何类
+
+主要函数:
+- get_canvas_geometry: 获取画布几何服务函数
+"""
+
+from typing import Any, Dict, Tuple
+
+
+class CanvasGeometry:
+    """画布几何类，缓存画布尺寸和安全边界并提供位置限制"""
+
+    # 画布尚未显示或无法查询时使用的默认尺寸
+    DEFAULT_WIDTH = 1000
+    DEFAULT_HEIGHT = 400
+
+    def __init__(self, canvas: Any = None):
+        """
+        初始化画布几何服务
+
+        Args:
+            canvas: Tkinter画布对象（为None时始终使用默认尺寸）
+        """
+        self.canvas = canvas
+        self._size: Tuple[int, int] = (self.DEFAULT_WIDTH, self.DEFAULT_HEIGHT)
+        self._scene_size: Tuple[int, int] = (0, 0)  # 可滚动场景的尺寸，(0, 0)表示不滚动
+        self._bounds: Dict[float, Tuple[float, float, float, float]] = {}  # 边距 -> 安全边界
+        self._inset = 0  # 边框和焦点高亮框的宽度（窗口尺寸两侧各包含一份）
+
+        if canvas is not None:
+            self._inset = self._query_inset()
+            self.refresh()
+            try:
+                canvas.bind("<Configure>", self._on_configure, add="+")
+            except Exception:
+                pass
+
+    @property
+    def width(self) -> int:
+        """画布宽度"""
+        return self._size[0]
+
+    @property
+    def height(self) -> int:
+        """画布高度"""
+        return self._size[1]
+
+    def get_size(self) -> Tuple[int, int]:
+        """
+        获取缓存的画布尺寸
+
+        Returns:
+            Tuple[int, int]: 画布尺寸 (宽度, 高度)
+        """
+        return self._size
+
+    def _query_inset(self) -> int:
+        """查询画布边框和焦点高亮框的总宽度（无法查询时为0）"""
+        try:
+            return int(float(self.canvas.cget('highlightthickness'))) + int(float(self.canvas.cget('borderwidth')))
+        except Exception:
+            return 0
+
+    def refresh(self) -> None:
+        """重新查询一次画布的实际尺寸（画布尚未显示时保留当前尺寸）"""
+        try:
+            self._set_size(int(self.canvas.winfo_width()), int(self.canvas.winfo_height()))
+        except Exception:
+            pass
+
+    def _on_configure(self, event) -> None:
+        """画布尺寸变化事件处理"""
+        self._set_size(event.width, event.height)
+
+    def _set_size(self, width: int, height: int) -> None:
+        """按窗口尺寸（含边框）更新可绘制区域的尺寸并使缓存的边界失效"""
+        if width <= 1 or height <= 1:  # 画布还未初始化
+            return
+        width -= 2 * self._inset
+        height -= 2 * self._inset
+        if (width, height) != self._size:
+            self._size = (width, height)
+            self._bounds = {}
+
+    def set_scene_size(self, width: int, height: int = 0) -> None:
+        """
+        设置可滚动场景的尺寸，场景大于画布时安全边界按场景计算
+
+        Args:
+            width: 场景宽度（0表示不滚动）
+            height: 场景高度（0表示不滚动）
+        """
+        if (width, height) != self._scene_size:
+            self._scene_size = (width, height)
+            self._bounds = {}
+
+    def get_bounds(self, margin: float) -> Tuple[float, float, float, float]:
+        """
+        获取留出边距后的安全边界
+
+        Args:
+            margin: 四周的边距
+
+        Returns:
+            Tuple[float, float, float, float]: 安全边界 (min_x, max_x, min_y, max_y)
+        """
+        bounds = self._bounds.get(margin)
+        if bounds is None:
+            width = max(self._size[0], self._scene_size[0])
+            height = max(self._size[1], self._scene_size[1])
+            bounds = (margin, width - margin, margin, height - margin)
+            self._bounds[margin] = bounds
+        return bounds
+
+    def clamp(self, x: float, y: float, margin: float) -> Tuple[float, float]:
+        """
+        将位置限制在安全边界内
+
+        Args:
+            x: x坐标
+            y: y坐标
+            margin: 四周的边距
+
+        Returns:
+            Tuple[float, float]: 限制后的位置 (x, y)
+        """
+        min_x, max_x, min_y, max_y = self.get_bounds(margin)
+        return max(min_x, min(max_x, x)), max(min_y, min(max_y, y))
+
+
+# 没有画布时共用的默认几何服务
+_DEFAULT_GEOMETRY = CanvasGeometry()
+
+
+def get_canvas_geometry(canvas: Any) -> CanvasGeometry:
+    """
+    获取画布共享的几何服务（每个画布只创建一个）
+
+    Args:
+        canvas: Tkinter画布对象，可以为None
+
+    Returns:
+        CanvasGeometry: 画布几何服务
+    """
+    if canvas is None:
+        return _DEFAULT_GEOMETRY
+    geometry = getattr(canvas, '_duck_geometry', None)
+    if geometry is None:
+        geometry = CanvasGeometry(canvas)
+        try:
+            canvas._duck_geometry = geometry
+        except AttributeError:
+            pass
+    return geometry
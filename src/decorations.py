@@ -0,0 +1,127 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 画布装饰层模块
+
+该模块把画布上的静态装饰（上下两条波浪线、四角的方框和一排圆点）作为
+独立的背景层绘制。装饰元素只带有装饰层自己的标签，不带鸭子的公共标签，
+删除、移动或提升鸭子都不会碰到它们；元素设置为disabled状态，不参与
+鼠标命中测试。装饰层只在画布尺寸变化时重新绘制一次，动画的每一帧
+没有任何装饰相关的开销。
+
+主要功能:
+- wave_points: 计算装饰波浪线的折线坐标
+- DecorationLayer: 画布装饰层类，按画布尺寸一次绘制全部装饰元素
+
+主要类:
+- DecorationLayer: 画布装饰层类
+
+主要函数:
+- wave_points: 计算波浪线坐标函数
+"""
+
+import math
+from typing import Any, List, Optional, Tuple
+
+
+def wave_points(width: int, base_y: float, amplitude: float, frequency: float,
+                phase: float = 0.0, step: int = 15) -> List[float]:
+    """
+    计算横贯画布的装饰波浪线的折线坐标
+
+    Args:
+        width: 画布宽度
+        base_y: 波浪线的中心y坐标
+        amplitude: 振幅
+        frequency: 每像素的角频率
+        phase: 初相位
+        step: 采样间隔（像素）
+
+    Returns:
+        List[float]: 展开的坐标列表 [x0, y0, x1, y1, ...]
+    """
+    points = []
+    for x in range(0, width, step):
+        points.extend([x, base_y + amplitude * math.sin(x * frequency + phase)])
+    return points
+
+
+class DecorationLayer:
+    """画布装饰层类，按画布尺寸一次绘制全部装饰元素"""
+
+    # 装饰元素的公共标签（不带鸭子的公共标签）
+    TAG = "decoration"
+    # 角落方框的边长
+    CORNER_SIZE = 30
+
+    def __init__(self, canvas: Any):
+        """
+        初始化画布装饰层
+
+        Args:
+            canvas: Tkinter画布对象
+        """
+        self.canvas = canvas
+        self._rendered: Optional[Tuple[int, int, float]] = None  # 已绘制时的(宽度, 高度, 圆点y坐标)
+        self._item_count = 0
+
+    def render(self, width: int, height: int, row_y: float) -> bool:
+        """
+        按画布尺寸绘制装饰层，尺寸与上次相同时不做任何画布操作
+
+        Args:
+            width: 画布宽度
+            height: 画布高度
+            row_y: 装饰圆点所在行的y坐标（与小鸭子在同一行）
+
+        Returns:
+            bool: 是否重新绘制
+        """
+        key = (width, height, row_y)
+        if key == self._rendered:
+            return False
+        self.clear()
+
+        canvas = self.canvas
+        options = {'tags': (self.TAG,), 'state': 'disabled'}
+        count = 0
+
+        # 底部和顶部的装饰波浪线
+        for points, color, line_width in (
+                (wave_points(width, height - 20, 8, 0.015), '#4682B4', 3),
+                (wave_points(width, 20, 6, 0.02, math.pi / 2), '#87CEEB', 2)):
+            if len(points) >= 4:
+                canvas.create_line(points, fill=color, width=line_width, smooth=True, **options)
+                count += 1
+
+        # 角落装饰：外框和内框
+        size = self.CORNER_SIZE
+        for x, y in ((10, 10), (width - 40, 10), (10, height - 40), (width - 40, height - 40)):
+            canvas.create_rectangle(x, y, x + size, y + size,
+                                    outline='#4682B4', width=3, fill='', **options)
+            canvas.create_rectangle(x + 5, y + 5, x + size - 5, y + size - 5,
+                                    outline='#87CEEB', width=1, fill='', **options)
+            count += 2
+
+        # 装饰性圆点
+        step = (width - 200) / 4
+        for i in range(5):
+            x = 50 + i * step
+            canvas.create_oval(x - 2, row_y - 2, x + 2, row_y + 2,
+                               fill='#B0C4DE', outline='', **options)
+            count += 1
+
+        # 整个装饰层一次置于最底层
+        canvas.tag_lower(self.TAG)
+        self._item_count = count
+        self._rendered = key
+        return True
+
+    def clear(self) -> None:
+        """删除全部装饰元素"""
+        if self._item_count:
+            self.canvas.delete(self.TAG)
+        self._item_count = 0
+        self._rendered = None
+
+    def get_item_count(self) -> int:
+        """获取装饰层的画布元素数量"""
+        return self._item_count
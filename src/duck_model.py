@@ -0,0 +1,148 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 鸭子模型模块
+
+该模块提供与Tkinter无关的鸭子模型。模型只保存位置、大小、数值和状态，
+使用__slots__存储属性，没有实例字典；图形模块中的鸭子类作为视图绑定
+到模型上。排序算法和测试可以直接使用纯模型运行，不需要画布。
+一排鸭子的位置和大小一次批量算出（安装了NumPy时使用NumPy）。
+
+主要功能:
+- DuckModel: 鸭子模型类，保存鸭子的位置、大小、数值和状态
+- compute_layout: 一次算出一排鸭子的x坐标和大小
+- create_models: 根据数值列表创建一排鸭子模型
+
+主要类:
+- DuckModel: 鸭子模型类
+
+主要函数:
+- compute_layout: 计算布局函数
+- create_models: 创建鸭子模型函数
+"""
+
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy是可选依赖，没有安装时使用纯Python实现
+    np = None
+
+# 小鸭子大小的范围（像素），按数值线性分布
+MIN_DUCK_SIZE = 20
+MAX_DUCK_SIZE = 50
+
+
+class DuckModel:
+    """鸭子模型类，保存鸭子的位置、大小、数值和状态"""
+
+    __slots__ = ('x', 'y', 'size', 'value', 'is_highlighted', 'is_comparing', 'is_sorted')
+
+    def __init__(self, x: float, y: float, size: float, value: int):
+        """
+        初始化鸭子模型
+
+        Args:
+            x: 鸭子的x坐标
+            y: 鸭子的y坐标
+            size: 鸭子的大小
+            value: 鸭子代表的数值（用于排序）
+        """
+        self.x = x
+        self.y = y
+        self.size = size
+        self.value = value
+        self.is_highlighted = False  # 是否高亮显示
+        self.is_comparing = False  # 是否正在比较
+        self.is_sorted = False  # 是否已排序
+
+    def move_to(self, new_x: float, new_y: float) -> None:
+        """移动到新位置"""
+        self.x = new_x
+        self.y = new_y
+
+    def highlight(self, highlight: bool = True) -> None:
+        """设置是否高亮"""
+        self.is_highlighted = highlight
+
+    def set_comparing(self, comparing: bool = True) -> None:
+        """设置是否正在比较"""
+        self.is_comparing = comparing
+
+    def set_sorted(self, sorted: bool = True) -> None:
+        """设置是否已排序"""
+        self.is_sorted = sorted
+
+    def set_state(self,
+                  highlighted: Optional[bool] = None,
+                  comparing: Optional[bool] = None,
+                  sorted: Optional[bool] = None) -> None:
+        """一次设置多个状态（None表示不修改）"""
+        if highlighted is not None:
+            self.is_highlighted = highlighted
+        if comparing is not None:
+            self.is_comparing = comparing
+        if sorted is not None:
+            self.is_sorted = sorted
+
+    def __repr__(self) -> str:
+        return "DuckModel(value={}, x={}, y={})".format(self.value, self.x, self.y)
+
+
+def compute_layout(start_x: float, spacing: float, values: List[int],
+                   min_size: float = MIN_DUCK_SIZE,
+                   max_size: float = MAX_DUCK_SIZE) -> Tuple[List[float], List[float]]:
+    """
+    一次算出一排鸭子的x坐标和大小（大小按数值在最小和最大大小之间线性分布，数值全部相同时取中间值）
+
+    Args:
+        start_x: 起始x坐标
+        spacing: 鸭子之间的间距
+        values: 鸭子代表的数值列表
+        min_size: 最小数值对应的大小
+        max_size: 最大数值对应的大小
+
+    Returns:
+        Tuple[List[float], List[float]]: (x坐标列表, 大小列表)
+    """
+    if not values:
+        return [], []
+    size_range = max_size - min_size
+    if np is not None:
+        array = np.asarray(values, dtype=float)
+        xs = start_x + np.arange(len(values)) * spacing
+        low, high = array.min(), array.max()
+        if high != low:
+            sizes = min_size + (array - low) / (high - low) * size_range
+        else:
+            sizes = np.full(len(values), min_size + size_range * 0.5)
+        return xs.tolist(), sizes.tolist()
+
+    low = min(values)
+    high = max(values)
+    xs = [start_x + i * spacing for i in range(len(values))]
+    if high != low:
+        scale = size_range / (high - low)
+        sizes = [min_size + (value - low) * scale for value in values]
+    else:
+        sizes = [min_size + size_range * 0.5] * len(values)
+    return xs, sizes
+
+
+def create_models(start_x: float, start_y: float, spacing: float, values: List[int],
+                  min_size: float = MIN_DUCK_SIZE,
+                  max_size: float = MAX_DUCK_SIZE) -> List[DuckModel]:
+    """
+    根据数值列表创建一排鸭子模型
+
+    Args:
+        start_x: 起始x坐标
+        start_y: 起始y坐标
+        spacing: 鸭子之间的间距
+        values: 鸭子代表的数值列表
+        min_size: 最小数值对应的大小
+        max_size: 最大数值对应的大小
+
+    Returns:
+        List[DuckModel]: 鸭子模型列表
+    """
+    xs, sizes = compute_layout(start_x, spacing, values, min_size, max_size)
+    return [DuckModel(x, start_y, size, value) for x, size, value in zip(xs, sizes, values)]
@@ -0,0 +1,121 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 字体缓存模块
+
+该模块为小鸭子的数值文字提供共享的字体对象。数值文字的字号由鸭子大小
+决定，每个字号只创建一个tkinter.font.Font，所有同字号的文字元素共用；
+重新绘制或原地更新文字时直接引用已解析的字体对象，Tk不再为每个元素
+重新解析字体描述。
+
+主要功能:
+- label_font_size: 根据鸭子大小计算数值文字的字号
+- FontCache: 字体缓存类，按字号缓存共享的字体对象
+- get_font_cache: 获取画布共享的字体缓存
+
+主要类:
+- FontCache: 字体缓存类
+
+主要函数:
+- label_font_size: 计算字号函数
+- get_font_cache: 获取字体缓存函数
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+# 数值文字的字体族和粗细
+LABEL_FAMILY = "Arial"
+LABEL_WEIGHT = "bold"
+# 鸭子大小与数值文字字号的比例
+LABEL_SIZE_RATIO = 3.5
+
+
+def label_font_size(size: float) -> int:
+    """
+    根据鸭子大小计算数值文字的字号（同时作为字体缓存的档位）
+
+    Args:
+        size: 鸭子大小
+
+    Returns:
+        int: 字号（至少为1，字号0在Tk中表示默认字号）
+    """
+    return max(1, int(size / LABEL_SIZE_RATIO))
+
+
+class FontCache:
+    """字体缓存类，按字号缓存共享的字体对象"""
+
+    def __init__(self, canvas: Any = None, font_factory: Optional[Callable[[int], Any]] = None):
+        """
+        初始化字体缓存
+
+        Args:
+            canvas: Tkinter画布对象，作为字体对象的root
+            font_factory: 创建字体的函数 f(字号)，默认创建tkinter.font.Font
+        """
+        self.canvas = canvas
+        self._font_factory = font_factory or self._create_font
+        self._fonts: Dict[int, Any] = {}  # 字号 -> 字体对象
+
+    def _create_font(self, point_size: int) -> Any:
+        """创建指定字号的字体对象（没有可用的Tk解释器时使用等价的字体描述）"""
+        try:
+            from tkinter import font as tkfont
+            return tkfont.Font(root=self.canvas, family=LABEL_FAMILY, size=point_size,
+                               weight=LABEL_WEIGHT)
+        except Exception:
+            return (LABEL_FAMILY, point_size, LABEL_WEIGHT)
+
+    def get(self, point_size: int) -> Any:
+        """
+        获取（必要时创建）指定字号的字体
+
+        Args:
+            point_size: 字号
+
+        Returns:
+            Any: 共享的字体对象
+        """
+        font = self._fonts.get(point_size)
+        if font is None:
+            font = self._font_factory(point_size)
+            self._fonts[point_size] = font
+        return font
+
+    def for_duck_size(self, size: float) -> Any:
+        """
+        获取指定大小的鸭子所用的数值文字字体
+
+        Args:
+            size: 鸭子大小
+
+        Returns:
+            Any: 共享的字体对象
+        """
+        return self.get(label_font_size(size))
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._fonts.clear()
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+
+def get_font_cache(canvas: Any) -> FontCache:
+    """
+    获取画布共享的字体缓存（每个画布只创建一个）
+
+    Args:
+        canvas: Tkinter画布对象
+
+    Returns:
+        FontCache: 字体缓存
+    """
+    cache = getattr(canvas, '_duck_fonts', None)
+    if cache is None:
+        cache = FontCache(canvas)
+        try:
+            canvas._duck_fonts = cache
+        except AttributeError:
+            pass
+    return cache
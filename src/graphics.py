@@ -6,31 +6,107 @@
 - BabyDuck: 小鸭子类
 - MotherDuck: 大母鸭类
 
-使用Tkinter Canvas绘制鸭子图形。
+使用Tkinter Canvas绘制鸭子图形。元素较多时小鸭子按细节级别简化为
+轮廓、柱形或点，所有级别共用同一套状态接口。
 
 主要功能:
 - Duck: 鸭子基类，定义所有鸭子的基本属性和行为
 - BabyDuck: 小鸭子类，用于表示排序数组中的元素
 - MotherDuck: 大母鸭类，用于执行排序操作
 - DuckFactory: 鸭子工厂类，用于创建不同类型的鸭子
+- DetailLevel: 细节级别枚举
+- select_detail_level: 根据元素数量和缩放比例选择细节级别
 
 主要类:
+- DetailLevel: 细节级别枚举
 - Duck: 鸭子基类
 - BabyDuck: 小鸭子类
 - MotherDuck: 大母鸭类
 - DuckFactory: 鸭子工厂类
+
+主要函数:
+- select_detail_level: 选择细节级别函数
 """
 
 import tkinter as tk
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from enum import Enum
+from typing import Any, Callable, List, Tuple, Optional
 import math
+import itertools
+from operator import attrgetter
+
+from src.canvas_geometry import get_canvas_geometry
+from src.fonts import get_font_cache, label_font_size
+from src.sprites import SIZE_STEP, get_sprite_cache
+from src.duck_model import (DuckModel, MAX_DUCK_SIZE, MIN_DUCK_SIZE, compute_layout,
+                            create_models)
+
+
+class DetailLevel(Enum):
+    """小鸭子的细节级别枚举"""
+    FULL = "full"              # 完整的鸭子
+    SILHOUETTE = "silhouette"  # 简化轮廓（身体和头部）
+    BAR = "bar"                # 柱形，高度表示数值
+    POINT = "point"            # 点，位于柱形顶端
+
+
+# 每个元素至少占用的水平像素数 -> 细节级别（从高到低）
+DETAIL_THRESHOLDS = (
+    (45.0, DetailLevel.FULL),
+    (12.0, DetailLevel.SILHOUETTE),
+    (1.0, DetailLevel.BAR),
+)
+
+
+def select_detail_level(count: int, zoom: float = 1.0, span: float = 1000.0) -> DetailLevel:
+    """
+    根据元素数量和缩放比例选择细节级别
+
+    Args:
+        count: 元素数量
+        zoom: 缩放比例（大于1表示放大）
+        span: 排列元素的水平范围（像素）
+
+    Returns:
+        DetailLevel: 每个元素可用的水平空间所对应的细节级别
+    """
+    if count <= 0:
+        return DetailLevel.FULL
+    per_element = span * zoom / count
+    for min_width, level in DETAIL_THRESHOLDS:
+        if per_element >= min_width:
+            return level
+    return DetailLevel.POINT
+
+
+def _model_attribute(name: str, doc: str) -> property:
+    """创建转发到鸭子模型属性的特性"""
+    return property(attrgetter('model.' + name),
+                    lambda self, value: setattr(self.model, name, value),
+                    doc=doc)
 
 
 class Duck(ABC):
-    """鸭子基类，定义所有鸭子的基本属性和行为"""
+    """鸭子基类：绑定到鸭子模型的画布视图，位置、数值和状态都保存在模型中"""
+    
+    __slots__ = ('canvas', 'geometry', 'model', 'tag', 'graphic_elements')
+    
+    # 所有鸭子图形元素共有的画布标签
+    DUCK_TAG = "duck"
+    # 为每只鸭子生成唯一标签的计数器
+    _tag_counter = itertools.count(1)
     
-    def __init__(self, canvas: tk.Canvas, x: float, y: float, size: float, value: int):
+    x = _model_attribute('x', "鸭子的x坐标")
+    y = _model_attribute('y', "鸭子的y坐标")
+    size = _model_attribute('size', "鸭子的大小")
+    value = _model_attribute('value', "鸭子代表的数值")
+    is_highlighted = _model_attribute('is_highlighted', "是否高亮显示")
+    is_comparing = _model_attribute('is_comparing', "是否正在比较")
+    is_sorted = _model_attribute('is_sorted', "是否已排序")
+    
+    def __init__(self, canvas: tk.Canvas, x: float, y: float, size: float, value: int,
+                 model: Optional[DuckModel] = None):
         """
         初始化鸭子
         
@@ -40,51 +116,116 @@ class Duck(ABC):
             y: 鸭子的y坐标
             size: 鸭子的大小
             value: 鸭子代表的数值（用于排序）
+            model: 要绑定的鸭子模型，None表示按上面的参数新建模型
         """
         self.canvas = canvas
-        self.x = x
-        self.y = y
-        self.size = size
-        self.value = value
+        self.geometry = get_canvas_geometry(canvas)  # 共享的画布几何服务
+        self.model = model if model is not None else DuckModel(x, y, size, value)
+        self.tag = "duck_{}".format(next(Duck._tag_counter))  # 鸭子所有图形元素共用的唯一标签
         self.graphic_elements = []  # 存储鸭子的图形元素
-        self.is_highlighted = False  # 是否高亮显示
-        self.is_comparing = False  # 是否正在比较
-        self.is_sorted = False  # 是否已排序
         
     @abstractmethod
     def draw(self) -> None:
         """绘制鸭子的抽象方法，子类必须实现"""
         pass
     
+    def _item_tags(self, *roles: str) -> Tuple[str, ...]:
+        """
+        获取新建图形元素的标签：鸭子的唯一标签、公共标签，以及按部位区分的子标签
+        
+        Args:
+            roles: 部位名称（如"fill"表示随状态变色的部位，"body"表示身体）
+            
+        Returns:
+            Tuple[str, ...]: 标签元组
+        """
+        return (self.tag, self.DUCK_TAG) + tuple("{}_{}".format(self.tag, role) for role in roles)
+    
     def move_to(self, new_x: float, new_y: float) -> None:
         """移动鸭子到新位置，添加边界检查防止鸭子跑出界面外"""
-        # 获取画布尺寸
-        try:
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            if canvas_width == 1:  # 画布还未初始化
-                canvas_width = 1000
-                canvas_height = 400
-        except:
-            canvas_width = 1000
-            canvas_height = 400
-            
-        # 计算安全边界（考虑鸭子大小）
-        margin = self.size / 2 + 10  # 鸭子大小的一半加上额外边距
-        
-        # 确保新位置在边界内
-        safe_x = max(margin, min(canvas_width - margin, new_x))
-        safe_y = max(margin, min(canvas_height - margin, new_y))
+        # 确保新位置在边界内（边距为鸭子大小的一半加上额外边距）
+        safe_x, safe_y = self.geometry.clamp(new_x, new_y, self.size / 2 + 10)
         
         dx = safe_x - self.x
         dy = safe_y - self.y
         
-        for element in self.graphic_elements:
-            self.canvas.move(element, dx, dy)
+        # 位置没有变化时不产生任何画布操作
+        if dx == 0 and dy == 0:
+            return
         
-        self.x = safe_x
-        self.y = safe_y
+        # 通过鸭子的标签一次移动所有图形元素（没有画布元素时只更新模型）
+        if self.graphic_elements:
+            self.canvas.move(self.tag, dx, dy)
+        
+        self.model.move_to(safe_x, safe_y)
     
+    def scale_about_center(self, factor: float) -> None:
+        """
+        以鸭子中心为原点缩放所有图形元素（不重新创建画布元素）
+
+        Args:
+            factor: 相对于当前大小的缩放比例
+        """
+        if self.graphic_elements:
+            self.canvas.scale(self.tag, self.x, self.y, factor, factor)
+
+    def snapshot_geometry(self) -> Tuple[float, float, List[int], List[List[float]]]:
+        """
+        保存鸭子当前的位置和所有图形元素的坐标
+
+        Returns:
+            Tuple: 几何快照 (x, y, 元素列表, 元素坐标列表)
+        """
+        elements = list(self.graphic_elements)
+        return self.x, self.y, elements, [self.canvas.coords(element) for element in elements]
+
+    def restore_geometry(self, snapshot: Tuple[float, float, List[int], List[List[float]]]) -> None:
+        """
+        精确恢复几何快照中的元素坐标，并保留快照之后发生的位移
+
+        Args:
+            snapshot: snapshot_geometry返回的几何快照
+        """
+        x, y, elements, coords = snapshot
+        if elements != self.graphic_elements:  # 鸭子已经重新绘制，快照失效
+            return
+        dx = self.x - x
+        dy = self.y - y
+        for element, element_coords in zip(elements, coords):
+            if dx or dy:
+                element_coords = [value + (dy if index % 2 else dx) for index, value in enumerate(element_coords)]
+            self.canvas.coords(element, *element_coords)
+
+    def is_drawn(self) -> bool:
+        """检查鸭子当前是否拥有画布元素"""
+        return bool(self.graphic_elements)
+
+    def raise_to_top(self) -> None:
+        """把鸭子的所有图形元素提升到最上层"""
+        if self.graphic_elements:
+            self.canvas.tag_raise(self.tag)
+
+    def set_state(self,
+                  highlighted: Optional[bool] = None,
+                  comparing: Optional[bool] = None,
+                  sorted: Optional[bool] = None) -> None:
+        """
+        一次设置多个状态，只更新一次外观（None表示不修改）
+
+        Args:
+            highlighted: 是否高亮
+            comparing: 是否正在比较
+            sorted: 是否已排序
+        """
+        model = self.model
+        if highlighted is not None:
+            model.is_highlighted = highlighted
+        if comparing is not None:
+            model.is_comparing = comparing
+        if sorted is not None:
+            model.is_sorted = sorted
+        self._update_appearance()
+
     def highlight(self, highlight: bool = True) -> None:
         """高亮或取消高亮鸭子"""
         self.is_highlighted = highlight
@@ -106,14 +247,16 @@ class Duck(ABC):
     
     def clear(self) -> None:
         """从画布上清除鸭子"""
-        for element in self.graphic_elements:
-            self.canvas.delete(element)
+        if self.graphic_elements:
+            self.canvas.delete(self.tag)
         self.graphic_elements.clear()
 
 
 class BabyDuck(Duck):
     """小鸭子类，用于表示排序数组中的元素"""
     
+    __slots__ = ('use_sprite', 'detail', 'footprint', 'pulse_scale', '_applied_appearance', '_applied_label')
+    
     # 小鸭子的颜色方案 - 更柔和现代的配色
     BODY_COLOR = "#FFD700"  # 金黄色
     BEAK_COLOR = "#FF8C00"  # 深橙色
@@ -127,7 +270,19 @@ class BabyDuck(Duck):
     SORTED_COLOR = "#32CD32"     # 绿色（已排序）
     GLOW_COLOR = "#FFFFE0"       # 发光效果颜色
     
-    def __init__(self, canvas: tk.Canvas, x: float, y: float, size: float, value: int):
+    # 精灵图用到的所有外观 (身体颜色, 轮廓宽度)，按排序过程中出现的先后排列
+    SPRITE_APPEARANCES = ((BODY_COLOR, 2), (COMPARING_COLOR, 3), (HIGHLIGHT_COLOR, 2), (SORTED_COLOR, 4))
+    
+    # 柱形的高度和宽度与鸭子大小的比例
+    BAR_HEIGHT_RATIO = 2.0
+    BAR_WIDTH_RATIO = 0.25
+    # 点的边长（像素）
+    POINT_SIZE = 2
+    
+    def __init__(self, canvas: tk.Canvas, x: float, y: float, size: float, value: int,
+                 use_sprite: bool = False, detail: DetailLevel = DetailLevel.FULL,
+                 footprint: Optional[float] = None, model: Optional[DuckModel] = None,
+                 draw: bool = True):
         """
         初始化小鸭子
         
@@ -137,122 +292,434 @@ class BabyDuck(Duck):
             y: 鸭子的y坐标
             size: 鸭子的大小（20-50像素）
             value: 鸭子代表的数值
+            use_sprite: 是否使用缓存的精灵图绘制（一个图片元素加一个数值文字元素）
+            detail: 细节级别
+            footprint: 每只鸭子在排列中占用的水平宽度，用于确定柱形宽度（None表示按大小计算）
+            model: 要绑定的鸭子模型，None表示新建模型
+            draw: 是否立即绘制（False时创建的小鸭子没有画布元素，之后再调用draw或take_items）
         """
-        super().__init__(canvas, x, y, size, value)
-        self.draw()
+        super().__init__(canvas, x, y, size, value, model)
+        self.use_sprite = use_sprite
+        self.detail = detail
+        self.footprint = footprint
+        self.pulse_scale = 1.0  # 精灵图脉冲时的缩放比例（精灵图换成对应大小的图片）
+        self._applied_appearance: Optional[Tuple[str, int]] = None  # 画布上当前的(颜色, 轮廓宽度)
+        self._applied_label: Optional[Tuple[str, int]] = None  # 画布上当前的(数值文字, 字号)
+        if draw:
+            self.draw()
+    
+    def set_detail_level(self, detail: DetailLevel) -> None:
+        """
+        切换细节级别（级别变化时重新绘制）
+
+        Args:
+            detail: 新的细节级别
+        """
+        if detail != self.detail:
+            self.detail = detail
+            self.draw()
     
     def draw(self) -> None:
         """绘制小鸭子"""
         # 清除之前的图形
         self.clear()
+        self.pulse_scale = 1.0
+        
+        if self.detail == DetailLevel.SILHOUETTE:
+            self._draw_silhouette()
+        elif self.detail == DetailLevel.BAR:
+            self._draw_bar()
+        elif self.detail == DetailLevel.POINT:
+            self._draw_point()
+        elif self.use_sprite:
+            self._draw_sprite()
+        else:
+            self._draw_vector()
         
+        # 新建的图形元素已经按当前状态着色（只有完整的鸭子显示数值文字）
+        self._applied_appearance = self._get_appearance()
+        self._applied_label = self._get_label() if self.detail == DetailLevel.FULL else None
+    
+    def scale_about_center(self, factor: float) -> None:
+        """
+        以鸭子中心为原点缩放：画布不缩放图片元素，精灵图换成对应大小的精灵图
+
+        Args:
+            factor: 相对于当前大小的缩放比例
+        """
+        if not (self.use_sprite and self.detail == DetailLevel.FULL and self.graphic_elements):
+            super().scale_about_center(factor)
+            return
+        self._set_pulse_scale(self.pulse_scale * factor)
+        self.canvas.scale(self.tag + "_label", self.x, self.y, factor, factor)
+
+    def restore_geometry(self, snapshot: Tuple[float, float, List[int], List[List[float]]]) -> None:
+        """
+        精确恢复几何快照中的元素坐标，精灵图恢复为原大小的精灵图
+
+        Args:
+            snapshot: snapshot_geometry返回的几何快照
+        """
+        super().restore_geometry(snapshot)
+        if self.pulse_scale != 1.0:
+            self._set_pulse_scale(1.0)
+
+    def _set_pulse_scale(self, scale: float) -> None:
+        """设置精灵图的脉冲缩放比例，只在落入另一个大小档位时切换图片"""
+        cache = get_sprite_cache(self.canvas)
+        appearance = self._get_appearance()
+        previous = cache.get(self.size * self.pulse_scale, *appearance)
+        self.pulse_scale = scale
+        image = cache.get(self.size * scale, *appearance)
+        if image is not previous and self._applied_appearance == appearance:
+            self.canvas.itemconfig(self.tag + "_sprite", image=image)
+
+    def prepare_pulse(self, scale_factor: float) -> None:
+        """
+        提前生成脉冲过程中会用到的各个大小的精灵图（在创建脉冲动画时调用）
+
+        Args:
+            scale_factor: 脉冲的最大缩放因子
+        """
+        if not (self.use_sprite and self.detail == DetailLevel.FULL):
+            return
+        low, high = sorted((self.size * max(0.05, 2 - scale_factor), self.size * scale_factor))
+        sizes = [low + SIZE_STEP * step for step in range(int((high - low) / SIZE_STEP) + 1)] + [high]
+        appearance = self._get_appearance()
+        get_sprite_cache(self.canvas).prewarm((size,) + appearance for size in sizes)
+
+    def _vector_coords(self) -> List[List[float]]:
+        """
+        获取矢量小鸭子各部分的坐标，顺序与绘制时创建元素的顺序相同：阴影、身体、身体高光、
+        头部、嘴巴、眼白、眼珠、眼睛高光、翅膀、数值背景、数值文字
+        """
         # 计算鸭子各部分的相对位置
+        x, y = self.x, self.y
         body_width = self.size * 0.8
         body_height = self.size * 0.6
         head_radius = self.size * 0.25
         beak_length = self.size * 0.15
         eye_radius = self.size * 0.05
+        shadow_offset = 3
+        head_x = x + body_width * 0.3
+        head_y = y - body_height * 0.3
+        eye_x = head_x + head_radius * 0.5
+        eye_y = head_y - head_radius * 0.3
+        wing_width = body_width * 0.3
+        wing_height = body_height * 0.4
+        return [
+            [x - body_width/2 + shadow_offset, y - body_height/2 + shadow_offset,
+             x + body_width/2 + shadow_offset, y + body_height/2 + shadow_offset],
+            [x - body_width/2, y - body_height/2, x + body_width/2, y + body_height/2],
+            [x - body_width/4, y - body_height/3, x - body_width/8, y - body_height/4],
+            [head_x - head_radius, head_y - head_radius, head_x + head_radius, head_y + head_radius],
+            [head_x + head_radius, head_y,  # 嘴巴根部
+             head_x + head_radius + beak_length, head_y,  # 嘴巴尖端
+             head_x + head_radius, head_y + beak_length/2],  # 嘴巴底部
+            [eye_x - eye_radius * 1.5, eye_y - eye_radius * 1.5, eye_x + eye_radius * 1.5, eye_y + eye_radius * 1.5],
+            [eye_x - eye_radius, eye_y - eye_radius, eye_x + eye_radius, eye_y + eye_radius],
+            [eye_x - eye_radius * 0.3, eye_y - eye_radius * 0.3, eye_x - eye_radius * 0.1, eye_y - eye_radius * 0.1],
+            [x - body_width * 0.1, y - wing_height/2, x - body_width * 0.1 + wing_width, y + wing_height/2],
+            [x - self.size/4, y + body_height/2 + 5, x + self.size/4, y + body_height/2 + 20],
+            [x, y + body_height/2 + 12],
+        ]
+    
+    def _draw_vector(self) -> None:
+        """使用矢量图形绘制完整的小鸭子"""
+        (shadow_coords, body_coords, highlight_coords, head_coords, beak_points, eye_white_coords,
+         eye_coords, eye_highlight_coords, wing_coords, text_bg_coords, text_coords) = self._vector_coords()
         
         # 添加阴影效果
-        shadow_offset = 3
         shadow = self.canvas.create_oval(
-            self.x - body_width/2 + shadow_offset, self.y - body_height/2 + shadow_offset,
-            self.x + body_width/2 + shadow_offset, self.y + body_height/2 + shadow_offset,
-            fill="#D3D3D3", outline="", stipple="gray50"
+            *shadow_coords,
+            fill="#D3D3D3", outline="", stipple="gray50",
+            tags=self._item_tags()
         )
         self.graphic_elements.append(shadow)
         
         # 绘制身体（椭圆）- 带有渐变效果
         body = self.canvas.create_oval(
-            self.x - body_width/2, self.y - body_height/2,
-            self.x + body_width/2, self.y + body_height/2,
-            fill=self._get_body_color(), outline=self.BODY_OUTLINE, width=2
+            *body_coords,
+            fill=self._get_body_color(), outline=self.BODY_OUTLINE, width=self._get_body_width(),
+            tags=self._item_tags('fill', 'body')
         )
         self.graphic_elements.append(body)
         
         # 绘制身体高光
         highlight = self.canvas.create_oval(
-            self.x - body_width/4, self.y - body_height/3,
-            self.x - body_width/8, self.y - body_height/4,
-            fill=self.GLOW_COLOR, outline="", stipple="gray75"
+            *highlight_coords,
+            fill=self.GLOW_COLOR, outline="", stipple="gray75",
+            tags=self._item_tags()
         )
         self.graphic_elements.append(highlight)
         
         # 绘制头部（圆形）
-        head_x = self.x + body_width * 0.3
-        head_y = self.y - body_height * 0.3
         head = self.canvas.create_oval(
-            head_x - head_radius, head_y - head_radius,
-            head_x + head_radius, head_y + head_radius,
-            fill=self._get_body_color(), outline=self.BODY_OUTLINE, width=2
+            *head_coords,
+            fill=self._get_body_color(), outline=self.BODY_OUTLINE, width=2,
+            tags=self._item_tags('fill')
         )
         self.graphic_elements.append(head)
         
         # 绘制嘴巴（三角形）
-        beak_points = [
-            head_x + head_radius, head_y,  # 嘴巴根部
-            head_x + head_radius + beak_length, head_y,  # 嘴巴尖端
-            head_x + head_radius, head_y + beak_length/2  # 嘴巴底部
-        ]
         beak = self.canvas.create_polygon(
-            beak_points, fill=self.BEAK_COLOR, outline="#000000", width=1
+            beak_points, fill=self.BEAK_COLOR, outline="#000000", width=1,
+            tags=self._item_tags()
         )
         self.graphic_elements.append(beak)
         
         # 绘制眼睛（更生动的设计）
-        eye_x = head_x + head_radius * 0.5
-        eye_y = head_y - head_radius * 0.3
-        
         # 眼白
         eye_white = self.canvas.create_oval(
-            eye_x - eye_radius * 1.5, eye_y - eye_radius * 1.5,
-            eye_x + eye_radius * 1.5, eye_y + eye_radius * 1.5,
-            fill="white", outline="#000000", width=1
+            *eye_white_coords,
+            fill="white", outline="#000000", width=1,
+            tags=self._item_tags()
         )
         self.graphic_elements.append(eye_white)
         
         # 眼珠
         eye = self.canvas.create_oval(
-            eye_x - eye_radius, eye_y - eye_radius,
-            eye_x + eye_radius, eye_y + eye_radius,
-            fill=self.EYE_COLOR, outline=""
+            *eye_coords,
+            fill=self.EYE_COLOR, outline="",
+            tags=self._item_tags()
         )
         self.graphic_elements.append(eye)
         
         # 眼睛高光
         eye_highlight = self.canvas.create_oval(
-            eye_x - eye_radius * 0.3, eye_y - eye_radius * 0.3,
-            eye_x - eye_radius * 0.1, eye_y - eye_radius * 0.1,
-            fill="white", outline=""
+            *eye_highlight_coords,
+            fill="white", outline="",
+            tags=self._item_tags()
         )
         self.graphic_elements.append(eye_highlight)
         
         # 绘制翅膀（小椭圆）
-        wing_width = body_width * 0.3
-        wing_height = body_height * 0.4
         wing = self.canvas.create_oval(
-            self.x - body_width * 0.1, self.y - wing_height/2,
-            self.x - body_width * 0.1 + wing_width, self.y + wing_height/2,
-            fill=self.WING_COLOR, outline="#000000", width=1
+            *wing_coords,
+            fill=self.WING_COLOR, outline="#000000", width=1,
+            tags=self._item_tags()
         )
         self.graphic_elements.append(wing)
         
         # 数值背景
         text_bg = self.canvas.create_rectangle(
-            self.x - self.size/4, self.y + body_height/2 + 5,
-            self.x + self.size/4, self.y + body_height/2 + 20,
-            fill="#FFFFFF", outline="#8B7500", width=1
+            *text_bg_coords,
+            fill="#FFFFFF", outline="#8B7500", width=1,
+            tags=self._item_tags()
         )
         self.graphic_elements.append(text_bg)
         
         # 显示数值
         text = self.canvas.create_text(
-            self.x, self.y + body_height/2 + 12,
-            text=str(self.value), font=("Arial", int(self.size/3.5), "bold"),
-            fill="#000000"
+            *text_coords,
+            text=str(self.value), font=self._label_font(),
+            fill="#000000",
+            tags=self._item_tags('label')
+        )
+        self.graphic_elements.append(text)
+    
+    def _label_font(self) -> Any:
+        """获取数值文字的字体（按字号共享的字体对象）"""
+        return get_font_cache(self.canvas).for_duck_size(self.size)
+    
+    def _get_label(self) -> Tuple[str, int]:
+        """获取当前的数值文字和字号 (文字, 字号)"""
+        return str(self.value), label_font_size(self.size)
+    
+    def _update_label(self) -> None:
+        """原地更新数值文字，只向画布发送与上次不同的文字或字体"""
+        if not self.graphic_elements or self.detail != DetailLevel.FULL:
+            return
+        label = self._get_label()
+        applied = self._applied_label
+        if label == applied:
+            return
+        changes = {}
+        if applied is None or label[0] != applied[0]:
+            changes['text'] = label[0]
+        if applied is None or label[1] != applied[1]:
+            changes['font'] = get_font_cache(self.canvas).get(label[1])
+        self.canvas.itemconfig(self.tag + "_label", **changes)
+        self._applied_label = label
+    
+    def _label_position(self) -> Tuple[float, float]:
+        """获取数值文字的位置（位于身体下方的数值背景中）"""
+        return self.x, self.y + self.size * 0.3 + 12
+    
+    def _silhouette_coords(self) -> Tuple[List[float], List[float]]:
+        """获取简化轮廓的身体和头部坐标"""
+        body_width = self.size * 0.8
+        body_height = self.size * 0.6
+        head_radius = self.size * 0.25
+        head_x = self.x + body_width * 0.3
+        head_y = self.y - body_height * 0.3
+        return ([self.x - body_width/2, self.y - body_height/2, self.x + body_width/2, self.y + body_height/2],
+                [head_x - head_radius, head_y - head_radius, head_x + head_radius, head_y + head_radius])
+    
+    def _bar_coords(self) -> List[float]:
+        """获取柱形的坐标：底边位于鸭子底部，高度与鸭子大小成正比"""
+        width = self.size * self.BAR_WIDTH_RATIO
+        if self.footprint is not None:
+            width = min(width, self.footprint * 0.8)  # 相邻柱形之间留出间隙
+        half_width = max(0.5, width / 2)
+        bottom = self.y + self.size / 2
+        return [self.x - half_width, bottom - self.size * self.BAR_HEIGHT_RATIO, self.x + half_width, bottom]
+    
+    def _point_coords(self) -> List[float]:
+        """获取点的坐标：位于同一只鸭子柱形的顶端"""
+        top = self.y + self.size / 2 - self.size * self.BAR_HEIGHT_RATIO
+        half = self.POINT_SIZE / 2
+        return [self.x - half, top - half, self.x + half, top + half]
+    
+    def _draw_sprite(self) -> None:
+        """使用缓存的精灵图绘制小鸭子"""
+        image = get_sprite_cache(self.canvas).get(
+            self.size, self._get_body_color(), self._get_body_width()
+        )
+        sprite = self.canvas.create_image(
+            self.x, self.y, image=image, anchor="center",
+            tags=self._item_tags('sprite')
+        )
+        self.graphic_elements.append(sprite)
+        
+        # 数值文字（背景已包含在精灵图中）
+        text = self.canvas.create_text(
+            *self._label_position(),
+            text=str(self.value), font=self._label_font(),
+            fill="#000000",
+            tags=self._item_tags('label')
         )
         self.graphic_elements.append(text)
     
+    def _draw_silhouette(self) -> None:
+        """绘制简化轮廓：只有身体和头部"""
+        body_coords, head_coords = self._silhouette_coords()
+        body = self.canvas.create_oval(
+            *body_coords,
+            fill=self._get_body_color(), outline=self.BODY_OUTLINE, width=self._get_body_width(),
+            tags=self._item_tags('fill', 'body')
+        )
+        self.graphic_elements.append(body)
+        
+        head = self.canvas.create_oval(
+            *head_coords,
+            fill=self._get_body_color(), outline=self.BODY_OUTLINE, width=1,
+            tags=self._item_tags('fill', 'head')
+        )
+        self.graphic_elements.append(head)
+    
+    def _draw_bar(self) -> None:
+        """绘制柱形"""
+        bar = self.canvas.create_rectangle(
+            *self._bar_coords(),
+            fill=self._get_body_color(), outline="",
+            tags=self._item_tags('fill')
+        )
+        self.graphic_elements.append(bar)
+    
+    def _draw_point(self) -> None:
+        """绘制点"""
+        point = self.canvas.create_rectangle(
+            *self._point_coords(),
+            fill=self._get_body_color(), outline="",
+            tags=self._item_tags('fill')
+        )
+        self.graphic_elements.append(point)
+    
+    def take_items(self, donor: 'BabyDuck') -> None:
+        """
+        接管另一只小鸭子的画布元素并按自己的位置、大小、数值和状态原地更新，
+        不删除也不新建画布元素（用于视口外的鸭子把元素让给进入视口的鸭子）
+
+        Args:
+            donor: 让出画布元素的小鸭子，接管后它不再拥有画布元素
+        """
+        if donor is self or not donor.graphic_elements:
+            return
+        self.clear()
+        # 交换标签，让出元素的鸭子保留一个没有元素的唯一标签
+        self.tag, donor.tag = donor.tag, self.tag
+        self.graphic_elements, donor.graphic_elements = donor.graphic_elements, []
+        self._applied_appearance, donor._applied_appearance = donor._applied_appearance, None
+        self._applied_label, donor._applied_label = donor._applied_label, None
+        
+        if self.detail != donor.detail or self.use_sprite != donor.use_sprite:
+            # 元素的组成不同，重新绘制
+            self.draw()
+            return
+        self._refit_in_place()
+
+    def rebind(self, x: float, y: float, size: float, value: int) -> None:
+        """
+        绑定新的位置、大小和数值并清除所有状态，已有的画布元素原地更新而不是
+        删除后重新创建（用于生成新数据时复用原来的小鸭子）
+
+        Args:
+            x: 新的x坐标
+            y: 新的y坐标
+            size: 新的大小
+            value: 新的数值
+        """
+        model = self.model
+        model.x, model.y, model.size, model.value = x, y, size, value
+        model.set_state(highlighted=False, comparing=False, sorted=False)
+        self._refit_in_place()
+
+    def place(self, x: float, y: float, size: float, footprint: Optional[float] = None) -> None:
+        """
+        把小鸭子放到新的位置并设置新的大小，保留数值和状态（用于画布尺寸变化后
+        重新排列）：大小和占用宽度不变时只移动已有的画布元素，否则原地更新
+
+        Args:
+            x: 新的x坐标
+            y: 新的y坐标
+            size: 新的大小
+            footprint: 新的占用宽度（None表示不修改）
+        """
+        model = self.model
+        resized = size != model.size
+        if footprint is not None and footprint != self.footprint:
+            self.footprint = footprint
+            resized = True
+        if not resized:
+            dx, dy = x - model.x, y - model.y
+            model.x, model.y = x, y
+            if self.graphic_elements and (dx or dy):
+                self.canvas.move(self.tag, dx, dy)
+            return
+        model.x, model.y, model.size = x, y, size
+        self._refit_in_place()
+
+    def _refit_in_place(self) -> None:
+        """按模型当前的位置、大小、数值和状态更新已有的画布元素"""
+        if not self.graphic_elements:
+            return
+        self._refit_items()
+        self._update_appearance()
+
+    def _refit_items(self) -> None:
+        """按当前的位置、大小和数值原地更新已有画布元素的坐标和文字"""
+        tag = self.tag
+        if self.detail == DetailLevel.SILHOUETTE:
+            body_coords, head_coords = self._silhouette_coords()
+            self.canvas.coords(tag + "_body", *body_coords)
+            self.canvas.coords(tag + "_head", *head_coords)
+        elif self.detail == DetailLevel.BAR:
+            self.canvas.coords(tag + "_fill", *self._bar_coords())
+        elif self.detail == DetailLevel.POINT:
+            self.canvas.coords(tag + "_fill", *self._point_coords())
+        elif not self.use_sprite:
+            # 矢量小鸭子的各部分按绘制顺序逐个设置坐标（同时撤销脉冲时的缩放），数值文字另外更新
+            for element, element_coords in zip(self.graphic_elements, self._vector_coords()):
+                self.canvas.coords(element, *element_coords)
+            self._update_label()
+        else:
+            # 精灵图按大小档位切换，外观更新时一并处理
+            self.canvas.coords(tag + "_sprite", self.x, self.y)
+            self._applied_appearance = None
+            self.canvas.coords(tag + "_label", *self._label_position())
+            self._update_label()
+    
     def _get_body_color(self) -> str:
         """根据状态获取身体颜色"""
         if self.is_sorted:
@@ -264,36 +731,46 @@ class BabyDuck(Duck):
         else:
             return self.BODY_COLOR
     
-    def _update_appearance(self) -> None:
-        """更新小鸭子的外观"""
-        if self.graphic_elements:
-            # 更新身体颜色
-            body_color = self._get_body_color()
-            self.canvas.itemconfig(self.graphic_elements[2], fill=body_color)  # 身体
-            self.canvas.itemconfig(self.graphic_elements[5], fill=body_color)  # 头部
-            
-            # 添加闪烁效果
-            if self.is_comparing:
-                self._add_glow_effect()
-            elif self.is_sorted:
-                self._add_sorted_effect()
+    def _get_body_width(self) -> int:
+        """根据状态获取身体轮廓宽度"""
+        if self.is_sorted:
+            return 4  # 已排序的鸭子使用特殊边框
+        elif self.is_comparing:
+            return 3  # 比较时的发光边框
+        else:
+            return 2
     
-    def _add_glow_effect(self) -> None:
-        """添加比较时的发光效果"""
-        if len(self.graphic_elements) > 10:  # 确保有足够的元素
-            # 为身体添加发光边框
-            self.canvas.itemconfig(self.graphic_elements[2], width=3)
+    def _get_appearance(self) -> Tuple[str, int]:
+        """获取当前状态对应的外观 (身体颜色, 轮廓宽度)"""
+        return self._get_body_color(), self._get_body_width()
     
-    def _add_sorted_effect(self) -> None:
-        """添加排序完成时的特效"""
-        if len(self.graphic_elements) > 10:
-            # 为已排序的鸭子添加特殊边框
-            self.canvas.itemconfig(self.graphic_elements[2], width=4)
+    def _update_appearance(self) -> None:
+        """更新小鸭子的外观，只向画布发送与上次不同的部分"""
+        if not self.graphic_elements:
+            return
+        appearance = self._get_appearance()
+        applied = self._applied_appearance
+        if appearance == applied:
+            return
+        color, width = appearance
+        if self.use_sprite and self.detail == DetailLevel.FULL:
+            # 切换为对应状态（和脉冲大小）的精灵图
+            image = get_sprite_cache(self.canvas).get(self.size * self.pulse_scale, color, width)
+            self.canvas.itemconfig(self.tag + "_sprite", image=image)
+        else:
+            # 通过部位标签更新身体和头部的颜色以及身体的边框（柱形和点没有边框）
+            if applied is None or color != applied[0]:
+                self.canvas.itemconfig(self.tag + "_fill", fill=color)
+            if (applied is None or width != applied[1]) and self.detail in (DetailLevel.FULL, DetailLevel.SILHOUETTE):
+                self.canvas.itemconfig(self.tag + "_body", width=width)
+        self._applied_appearance = appearance
 
 
 class MotherDuck(Duck):
     """大母鸭类，用于执行排序操作"""
     
+    __slots__ = ()
+    
     # 大母鸭的颜色方案 - 更优雅的配色
     BODY_COLOR = "#8B4513"  # 棕色
     BEAK_COLOR = "#FF6347"  # 番茄红
@@ -302,6 +779,7 @@ class MotherDuck(Duck):
     CROWN_COLOR = "#FFD700" # 金色皇冠
     BODY_OUTLINE = "#654321" # 深棕色轮廓
     CROWN_GEM = "#FF1493"   # 皇冠宝石
+    LABEL_FONT_SIZE = 14    # "母鸭"文字的字号
     
     def __init__(self, canvas: tk.Canvas, x: float, y: float):
         """
@@ -335,7 +813,8 @@ class MotherDuck(Duck):
         shadow = self.canvas.create_oval(
             self.x - body_width/2 + shadow_offset, self.y - body_height/2 + shadow_offset,
             self.x + body_width/2 + shadow_offset, self.y + body_height/2 + shadow_offset,
-            fill="#A9A9A9", outline="", stipple="gray50"
+            fill="#A9A9A9", outline="", stipple="gray50",
+            tags=self._item_tags()
         )
         self.graphic_elements.append(shadow)
         
@@ -343,7 +822,8 @@ class MotherDuck(Duck):
         body = self.canvas.create_oval(
             self.x - body_width/2, self.y - body_height/2,
             self.x + body_width/2, self.y + body_height/2,
-            fill=self.BODY_COLOR, outline=self.BODY_OUTLINE, width=3
+            fill=self.BODY_COLOR, outline=self.BODY_OUTLINE, width=3,
+            tags=self._item_tags('fill', 'body')
         )
         self.graphic_elements.append(body)
         
@@ -351,7 +831,8 @@ class MotherDuck(Duck):
         highlight = self.canvas.create_oval(
             self.x - body_width/3, self.y - body_height/2.5,
             self.x - body_width/6, self.y - body_height/3,
-            fill="#D2691E", outline="", stipple="gray75"
+            fill="#D2691E", outline="", stipple="gray75",
+            tags=self._item_tags()
         )
         self.graphic_elements.append(highlight)
         
@@ -361,7 +842,8 @@ class MotherDuck(Duck):
         head = self.canvas.create_oval(
             head_x - head_radius, head_y - head_radius,
             head_x + head_radius, head_y + head_radius,
-            fill=self.BODY_COLOR, outline=self.BODY_OUTLINE, width=3
+            fill=self.BODY_COLOR, outline=self.BODY_OUTLINE, width=3,
+            tags=self._item_tags('fill')
         )
         self.graphic_elements.append(head)
         
@@ -374,7 +856,8 @@ class MotherDuck(Duck):
             head_x + head_radius * 0.8, head_y - head_radius - crown_height/2  # 右下
         ]
         crown = self.canvas.create_polygon(
-            crown_points, fill=self.CROWN_COLOR, outline=self.BODY_OUTLINE, width=2
+            crown_points, fill=self.CROWN_COLOR, outline=self.BODY_OUTLINE, width=2,
+            tags=self._item_tags()
         )
         self.graphic_elements.append(crown)
         
@@ -382,7 +865,8 @@ class MotherDuck(Duck):
         gem = self.canvas.create_oval(
             head_x - head_radius * 0.15, head_y - head_radius - crown_height * 0.7,
             head_x + head_radius * 0.15, head_y - head_radius - crown_height * 0.5,
-            fill=self.CROWN_GEM, outline="#FFFFFF", width=1
+            fill=self.CROWN_GEM, outline="#FFFFFF", width=1,
+            tags=self._item_tags()
         )
         self.graphic_elements.append(gem)
         
@@ -393,7 +877,8 @@ class MotherDuck(Duck):
             head_x + head_radius, head_y + beak_length/2  # 嘴巴底部
         ]
         beak = self.canvas.create_polygon(
-            beak_points, fill=self.BEAK_COLOR, outline="#000000", width=2
+            beak_points, fill=self.BEAK_COLOR, outline="#000000", width=2,
+            tags=self._item_tags()
         )
         self.graphic_elements.append(beak)
         
@@ -405,7 +890,8 @@ class MotherDuck(Duck):
         eye_white = self.canvas.create_oval(
             eye_x - eye_radius * 1.5, eye_y - eye_radius * 1.5,
             eye_x + eye_radius * 1.5, eye_y + eye_radius * 1.5,
-            fill="white", outline=self.BODY_OUTLINE, width=1
+            fill="white", outline=self.BODY_OUTLINE, width=1,
+            tags=self._item_tags()
         )
         self.graphic_elements.append(eye_white)
         
@@ -413,7 +899,8 @@ class MotherDuck(Duck):
         eye = self.canvas.create_oval(
             eye_x - eye_radius, eye_y - eye_radius,
             eye_x + eye_radius, eye_y + eye_radius,
-            fill=self.EYE_COLOR, outline=""
+            fill=self.EYE_COLOR, outline="",
+            tags=self._item_tags()
         )
         self.graphic_elements.append(eye)
         
@@ -421,7 +908,8 @@ class MotherDuck(Duck):
         eye_highlight = self.canvas.create_oval(
             eye_x - eye_radius * 0.3, eye_y - eye_radius * 0.3,
             eye_x - eye_radius * 0.1, eye_y - eye_radius * 0.1,
-            fill="white", outline=""
+            fill="white", outline="",
+            tags=self._item_tags()
         )
         self.graphic_elements.append(eye_highlight)
         
@@ -431,7 +919,8 @@ class MotherDuck(Duck):
         wing = self.canvas.create_oval(
             self.x - body_width * 0.1, self.y - wing_height/2,
             self.x - body_width * 0.1 + wing_width, self.y + wing_height/2,
-            fill=self.WING_COLOR, outline="#000000", width=2
+            fill=self.WING_COLOR, outline="#000000", width=2,
+            tags=self._item_tags()
         )
         self.graphic_elements.append(wing)
         
@@ -439,15 +928,17 @@ class MotherDuck(Duck):
         text_bg = self.canvas.create_rectangle(
             self.x - 20, self.y + body_height/2 + 10,
             self.x + 20, self.y + body_height/2 + 30,
-            fill="#FFFFFF", outline=self.BODY_OUTLINE, width=2
+            fill="#FFFFFF", outline=self.BODY_OUTLINE, width=2,
+            tags=self._item_tags()
         )
         self.graphic_elements.append(text_bg)
         
         # 显示"母鸭"文字
         text = self.canvas.create_text(
             self.x, self.y + body_height/2 + 20,
-            text="👑 母鸭", font=("Arial", 14, "bold"),
-            fill="#8B4513"
+            text="👑 母鸭", font=get_font_cache(self.canvas).get(self.LABEL_FONT_SIZE),
+            fill="#8B4513",
+            tags=self._item_tags()
         )
         self.graphic_elements.append(text)
     
@@ -476,9 +967,14 @@ class DuckFactory:
     
     @staticmethod
     def create_baby_ducks(canvas: tk.Canvas, start_x: float, start_y: float, 
-                         spacing: float, values: List[int]) -> List[BabyDuck]:
+                         spacing: float, values: List[int],
+                         use_sprite: bool = False,
+                         detail: Optional[DetailLevel] = None,
+                         draw: bool = True,
+                         size_range: Tuple[float, float] = (MIN_DUCK_SIZE, MAX_DUCK_SIZE)) -> List[BabyDuck]:
         """
-        创建一组小鸭子
+        创建一组小鸭子：先一次算出所有鸭子的位置和大小，创建未绘制的小鸭子，
+        再统一绘制
         
         Args:
             canvas: Tkinter画布对象
@@ -486,25 +982,117 @@ class DuckFactory:
             start_y: 起始y坐标
             spacing: 鸭子之间的间距
             values: 鸭子代表的数值列表
+            use_sprite: 是否使用缓存的精灵图绘制小鸭子
+            detail: 细节级别，None表示按鸭子数量和间距自动选择
+            draw: 是否立即绘制（False时由调用者之后调用materialize或交给虚拟场景）
+            size_range: 小鸭子大小的范围 (最小大小, 最大大小)，按数值线性分布
             
         Returns:
             小鸭子列表
         """
-        ducks = []
-        min_value = min(values)
-        max_value = max(values)
-        
-        for i, value in enumerate(values):
-            # 根据数值计算鸭子大小（20-50像素）
-            normalized_value = (value - min_value) / (max_value - min_value) if max_value != min_value else 0.5
-            size = 20 + normalized_value * 30  # 20-50像素范围
-            
-            x = start_x + i * spacing
-            duck = BabyDuck(canvas, x, start_y, size, value)
-            ducks.append(duck)
+        if detail is None:
+            detail = select_detail_level(len(values), span=spacing * len(values))
         
+        # 先创建纯模型（大小按数值在大小范围内分布），再绑定未绘制的画布视图
+        ducks = [
+            BabyDuck(canvas, model.x, model.y, model.size, model.value, use_sprite, detail,
+                     footprint=spacing, model=model, draw=False)
+            for model in create_models(start_x, start_y, spacing, values, *size_range)
+        ]
+        if draw:
+            DuckFactory.materialize(ducks)
         return ducks
     
+    @staticmethod
+    def materialize(ducks: List[BabyDuck], chunk_size: Optional[int] = None,
+                    on_complete: Optional[Callable[[], None]] = None) -> None:
+        """
+        绘制尚未绘制的小鸭子，数量很多时分批在空闲时绘制，避免一次阻塞界面
+        
+        Args:
+            ducks: 小鸭子列表
+            chunk_size: 每批绘制的数量，None表示全部立即绘制
+            on_complete: 全部绘制完成后调用的函数
+        """
+        pending = [duck for duck in ducks if not duck.is_drawn()]
+        if chunk_size is None or chunk_size <= 0:
+            chunk_size = max(1, len(pending))
+        
+        def draw_chunk(start: int) -> None:
+            for duck in pending[start:start + chunk_size]:
+                if not duck.is_drawn():  # 分批期间可能已被虚拟场景等绘制
+                    duck.draw()
+            if start + chunk_size < len(pending):
+                pending[0].canvas.after_idle(draw_chunk, start + chunk_size)
+            elif on_complete:
+                on_complete()
+        
+        draw_chunk(0)
+
+    @staticmethod
+    def prewarm_sprites(ducks: List[BabyDuck], chunk_size: Optional[int] = None,
+                        on_complete: Optional[Callable[[], None]] = None) -> int:
+        """
+        提前生成小鸭子各状态会用到的精灵图（在创建或重新布局小鸭子后调用），
+        排序过程中切换状态时只需查表；数量很多时分批在空闲时生成
+
+        Args:
+            ducks: 小鸭子列表（只处理使用精灵图的完整小鸭子）
+            chunk_size: 每批生成的精灵图数量，None表示全部立即生成
+            on_complete: 全部生成完成后调用的函数
+
+        Returns:
+            int: 需要生成的精灵图数量
+        """
+        sprite_ducks = [duck for duck in ducks if duck.use_sprite and duck.detail == DetailLevel.FULL]
+        if not sprite_ducks:
+            if on_complete:
+                on_complete()
+            return 0
+        canvas = sprite_ducks[0].canvas
+        cache = get_sprite_cache(canvas)
+        # 按外观分组，按排序过程中用到的先后生成所有大小档位的精灵图
+        missing = cache.get_missing((duck.size,) + appearance
+                                    for appearance in BabyDuck.SPRITE_APPEARANCES
+                                    for duck in sprite_ducks)
+        if chunk_size is None or chunk_size <= 0:
+            chunk_size = max(1, len(missing))
+
+        def render_chunk(start: int) -> None:
+            cache.prewarm(missing[start:start + chunk_size])
+            if start + chunk_size < len(missing):
+                canvas.after_idle(render_chunk, start + chunk_size)
+            elif on_complete:
+                on_complete()
+
+        render_chunk(0)
+        return len(missing)
+
+    @staticmethod
+    def rebind_baby_ducks(ducks: List[BabyDuck], start_x: float, start_y: float,
+                          spacing: float, values: List[int],
+                          size_range: Tuple[float, float] = (MIN_DUCK_SIZE, MAX_DUCK_SIZE)) -> bool:
+        """
+        让已有的小鸭子按新的数值重新排列，复用它们的画布元素
+
+        Args:
+            ducks: 已有的小鸭子列表（按当前位置从左到右排列）
+            start_x: 起始x坐标
+            start_y: 起始y坐标
+            spacing: 鸭子之间的间距
+            values: 新的数值列表
+            size_range: 小鸭子大小的范围 (最小大小, 最大大小)
+
+        Returns:
+            bool: 是否成功复用（数量不一致时返回False，调用者应重新创建）
+        """
+        if len(ducks) != len(values):
+            return False
+        xs, sizes = compute_layout(start_x, spacing, values, *size_range)
+        for duck, x, size, value in zip(ducks, xs, sizes, values):
+            duck.rebind(x, start_y, size, value)
+        return True
+
     @staticmethod
     def create_mother_duck(canvas: tk.Canvas, x: float, y: float) -> MotherDuck:
         """
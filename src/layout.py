@@ -0,0 +1,184 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 布局模块
+
+该模块根据小鸭子的数量和画布的实际尺寸计算场景布局：每只小鸭子的
+位置（槽位）、小鸭子大小的范围、细节级别以及大母鸭所在的行走线。
+画布尺寸变化时重新计算布局，只移动已有的画布元素（大小变化时原地
+更新），不重新创建小鸭子。设置了最小间距时，鸭子多到画布放不下的
+布局比画布更宽，由可横向滚动的虚拟场景显示。
+
+主要功能:
+- SceneLayout: 场景布局类，保存一次布局计算的结果
+- LayoutEngine: 布局引擎类，计算布局并应用到已有的鸭子上
+
+主要类:
+- SceneLayout: 场景布局类
+- LayoutEngine: 布局引擎类
+"""
+
+from typing import Any, List, Optional, Tuple
+
+from src.duck_model import MAX_DUCK_SIZE, MIN_DUCK_SIZE, compute_layout
+from src.graphics import DetailLevel, select_detail_level
+
+
+class SceneLayout:
+    """场景布局类，保存一次布局计算的结果"""
+
+    __slots__ = ('count', 'width', 'height', 'start_x', 'spacing', 'duck_y',
+                 'min_size', 'max_size', 'detail', 'mother_x', 'mother_y', 'scene_width')
+
+    def __init__(self, count: int, width: int, height: int, start_x: float, spacing: float,
+                 duck_y: float, min_size: float, max_size: float, detail: DetailLevel,
+                 mother_x: float, mother_y: float, scene_width: Optional[float] = None):
+        """
+        初始化场景布局
+
+        Args:
+            count: 小鸭子数量
+            width: 画布宽度
+            height: 画布高度
+            start_x: 第一个槽位的x坐标
+            spacing: 相邻槽位之间的间距
+            duck_y: 小鸭子所在行的y坐标
+            min_size: 最小数值对应的小鸭子大小
+            max_size: 最大数值对应的小鸭子大小
+            detail: 小鸭子的细节级别
+            mother_x: 大母鸭的初始x坐标
+            mother_y: 大母鸭行走线的y坐标
+            scene_width: 场景宽度，None表示与画布同宽
+        """
+        self.count = count
+        self.width = width
+        self.height = height
+        self.start_x = start_x
+        self.spacing = spacing
+        self.duck_y = duck_y
+        self.min_size = min_size
+        self.max_size = max_size
+        self.detail = detail
+        self.mother_x = mother_x
+        self.mother_y = mother_y
+        self.scene_width = width if scene_width is None else scene_width
+
+    def _key(self) -> Tuple:
+        """获取用于比较布局是否相同的元组"""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, SceneLayout) and self._key() == other._key()
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    @property
+    def size_range(self) -> Tuple[float, float]:
+        """小鸭子大小的范围 (最小大小, 最大大小)"""
+        return self.min_size, self.max_size
+
+    @property
+    def scrolls(self) -> bool:
+        """场景是否比画布宽（需要横向滚动）"""
+        return self.scene_width > self.width
+
+    @property
+    def mother_position(self) -> Tuple[float, float]:
+        """大母鸭的初始位置 (x, y)"""
+        return self.mother_x, self.mother_y
+
+    def slot_x(self, index: int) -> float:
+        """
+        获取指定槽位的x坐标
+
+        Args:
+            index: 槽位索引
+
+        Returns:
+            float: 槽位的x坐标
+        """
+        return self.start_x + index * self.spacing
+
+
+class LayoutEngine:
+    """布局引擎类，计算布局并应用到已有的鸭子上"""
+
+    # 相邻小鸭子的最大间距（鸭子较少时不再继续拉开）
+    MAX_SPACING = 70.0
+    # 一排小鸭子左右两侧至少留出的空白
+    MIN_MARGIN = 60.0
+    # 小鸭子所在行和大母鸭行走线的y坐标占画布高度的比例
+    DUCK_ROW_RATIO = 0.625
+    MOTHER_LANE_RATIO = 0.3125
+    # 最大的小鸭子不超过画布高度的比例（给上下装饰和母鸭留出空间）
+    HEIGHT_SIZE_RATIO = 0.15
+
+    def __init__(self, min_spacing: float = 0.0):
+        """
+        初始化布局引擎
+
+        Args:
+            min_spacing: 相邻小鸭子的最小间距，画布放不下时场景横向延伸；
+                         0表示总是把所有小鸭子挤进画布
+        """
+        self.min_spacing = min_spacing
+
+    def compute(self, count: int, width: int, height: int) -> SceneLayout:
+        """
+        根据小鸭子数量和画布尺寸计算布局：一排小鸭子在画布中水平居中，
+        间距按可用宽度均分（不超过最大间距），大小范围随间距和画布高度缩小。
+        间距小于最小间距时按最小间距排列，场景比画布宽
+
+        Args:
+            count: 小鸭子数量
+            width: 画布宽度
+            height: 画布高度
+
+        Returns:
+            SceneLayout: 计算得到的布局
+        """
+        usable = max(1.0, width - 2 * self.MIN_MARGIN)
+        if count > 1:
+            spacing = min(self.MAX_SPACING, usable / (count - 1))
+        else:
+            spacing = self.MAX_SPACING
+        fits = spacing >= self.min_spacing
+        spacing = max(spacing, self.min_spacing)
+        span = spacing * max(0, count - 1)
+        scene_width = width if fits else span + 2 * self.MIN_MARGIN
+        start_x = (scene_width - span) / 2
+        detail = select_detail_level(count, span=max(usable, span))
+
+        # 完整的鸭子和轮廓需要水平空间，柱形和点只受画布高度限制
+        max_size = min(MAX_DUCK_SIZE, height * self.HEIGHT_SIZE_RATIO)
+        if detail in (DetailLevel.FULL, DetailLevel.SILHOUETTE):
+            max_size = min(max_size, spacing * MAX_DUCK_SIZE / self.MAX_SPACING)
+        min_size = max_size * MIN_DUCK_SIZE / MAX_DUCK_SIZE
+
+        return SceneLayout(count, width, height, start_x, spacing,
+                           height * self.DUCK_ROW_RATIO, min_size, max_size, detail,
+                           width / 2, height * self.MOTHER_LANE_RATIO, scene_width)
+
+    def apply(self, layout: SceneLayout, ducks: List, mother_duck: Any = None) -> None:
+        """
+        把布局应用到已有的鸭子上：小鸭子按在列表中的顺序放入槽位，只移动或原地
+        更新已有的画布元素；细节级别变化时小鸭子才重新绘制
+
+        Args:
+            layout: 要应用的布局
+            ducks: 小鸭子列表（按槽位从左到右排列）
+            mother_duck: 大母鸭，None表示不移动
+        """
+        xs, sizes = compute_layout(layout.start_x, layout.spacing,
+                                   [duck.value for duck in ducks], *layout.size_range)
+        for duck, x, size in zip(ducks, xs, sizes):
+            if duck.detail != layout.detail:
+                duck.model.x, duck.model.y, duck.model.size = x, layout.duck_y, size
+                duck.footprint = layout.spacing
+                if duck.is_drawn():
+                    duck.set_detail_level(layout.detail)
+                else:
+                    duck.detail = layout.detail
+            else:
+                duck.place(x, layout.duck_y, size, layout.spacing)
+        if mother_duck is not None:
+            mother_duck.move_to(*layout.mother_position)
@@ -19,13 +19,18 @@ import tkinter as tk
 from tkinter import ttk, messagebox, font
 import random
 import threading
-import math
 from typing import List, Optional
 from tkinter import Canvas
 
-from src.graphics import DuckFactory, BabyDuck, MotherDuck
+from src.canvas_geometry import get_canvas_geometry
+from src.decorations import DecorationLayer
+from src.graphics import Duck, DuckFactory, BabyDuck, MotherDuck
+from src.layout import LayoutEngine, SceneLayout
+from src.virtual_scene import VirtualScene
 from algorithms.bubble_sort import BubbleSort
-from animation.animation_engine import AnimationEngine
+from animation.animation_engine import AnimationEngine, BacklogPolicy
+from animation.engine_metrics import MetricsOverlay
+from animation.group_motion import GroupMotionAnimator
 from animation.sort_animation_integration import SortAnimationIntegration
 from src.logger import get_logger, log_user_action, log_error
 
@@ -33,6 +38,22 @@ from src.logger import get_logger, log_user_action, log_error
 class DuckBubbleSortApp:
     """小鸭子冒泡排序可视化主应用程序类"""
     
+    # 动画积压阈值：队列深度和画面最大滞后时间（秒）
+    MAX_QUEUE_DEPTH = 20
+    MAX_ANIMATION_LAG = 3.0
+    # 使用缓存的精灵图绘制小鸭子（每只鸭子一个图片元素加一个数值文字元素）
+    USE_SPRITE_DUCKS = True
+    # 空闲时每批提前生成的精灵图数量（创建或重新布局小鸭子后生成各状态的精灵图）
+    SPRITE_PREWARM_CHUNK = 8
+    # 小鸭子分批绘制时每批的数量（超过该数量时其余的在空闲时继续绘制）
+    MATERIALIZE_CHUNK = 200
+    # 小鸭子数量（位置、大小和大母鸭的行走线由布局引擎按画布尺寸计算）
+    DUCK_COUNT = 12
+    # 相邻小鸭子的最小间距：鸭子多到画布放不下时场景横向滚动，只绘制视口内的鸭子
+    MIN_DUCK_SPACING = 8.0
+    # 画布尺寸变化后等待多久再重新布局（毫秒），拖动窗口时只布局一次
+    RELAYOUT_DELAY = 100
+    
     def __init__(self, root: tk.Tk):
         # 添加线程锁
         self.sort_lock = threading.Lock()
@@ -59,6 +80,7 @@ class DuckBubbleSortApp:
         self.is_running = False
         self.is_paused = False
         self.animation_speed = 1.0
+        self.turbo_mode = False
         
         # 鸭子和排序相关对象
         self.baby_ducks: List[BabyDuck] = []
@@ -66,6 +88,18 @@ class DuckBubbleSortApp:
         self.bubble_sort: Optional[BubbleSort] = None
         self.animation_engine: Optional[AnimationEngine] = None
         self.sort_animation_integration: Optional[SortAnimationIntegration] = None
+        self.metrics_overlay: Optional[MetricsOverlay] = None
+        
+        # 画布装饰层
+        self.decorations: Optional[DecorationLayer] = None
+        
+        # 场景布局（随画布尺寸重新计算）
+        self.layout_engine = LayoutEngine(min_spacing=self.MIN_DUCK_SPACING)
+        self.layout: Optional[SceneLayout] = None
+        self.virtual_scene: Optional[VirtualScene] = None  # 场景比画布宽时使用的可滚动场景
+        self._relayout_job = None  # 等待执行的重新布局
+        self._layout_pending = False  # 排序进行中发生的尺寸变化，停止后再应用
+        self._statistics_job = None  # 等待执行的统计信息更新
         
         try:
             # 设置样式
@@ -75,6 +109,15 @@ class DuckBubbleSortApp:
             self._create_gui()
             self.logger.info("GUI界面创建成功")
             
+            # 让画布完成布局，之后按画布的实际尺寸计算场景布局
+            self.root.update_idletasks()
+            get_canvas_geometry(self.canvas).refresh()
+            self.layout = self._compute_layout()
+            
+            # 添加装饰性边框（独立的装饰层，重置和生成新鸭子时保留）
+            self.decorations = DecorationLayer(self.canvas)
+            self._add_canvas_decorations()
+            
             # 初始化鸭子
             self._initialize_ducks()
             self.logger.info(f"初始化了 {len(self.baby_ducks)} 只小鸭子")
@@ -86,6 +129,9 @@ class DuckBubbleSortApp:
             # 绑定窗口关闭事件
             self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
             
+            # F3切换性能统计浮层
+            self.root.bind("<F3>", lambda event: self._toggle_metrics_overlay())
+            
             self.logger.info("应用程序初始化完成")
         except Exception as e:
             self.logger.error(f"应用程序初始化失败: {str(e)}")
@@ -139,13 +185,17 @@ class DuckBubbleSortApp:
         canvas_container = ttk.Frame(canvas_frame)
         canvas_container.pack(fill=tk.BOTH, expand=True)
         
-        # 创建画布
+        # 创建画布和水平滚动条（场景比画布宽时滚动查看，滚动由虚拟场景处理）
+        self.h_scrollbar = ttk.Scrollbar(canvas_container, orient=tk.HORIZONTAL,
+                                         command=self._on_scroll)
+        self.h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X, padx=5)
         self.canvas = Canvas(canvas_container, width=1000, height=320, 
-                           bg="#E6F3FF", highlightthickness=2, highlightbackground="#87CEEB")
-        self.canvas.pack(padx=5, pady=5)
-        
-        # 添加装饰性边框
-        self._add_canvas_decorations()
+                           bg="#E6F3FF", highlightthickness=2, highlightbackground="#87CEEB",
+                           xscrollcommand=self.h_scrollbar.set)
+        self.canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.canvas.bind("<Configure>", self._on_canvas_configure, add="+")
+        for sequence in ("<Shift-MouseWheel>", "<Shift-Button-4>", "<Shift-Button-5>"):
+            self.canvas.bind(sequence, self._on_scroll_wheel)
         
         # 创建控制面板框架
         control_frame = ttk.LabelFrame(main_frame, text="🎮 控制面板", padding="10")
@@ -301,6 +351,16 @@ class DuckBubbleSortApp:
                                         foreground="#2E8B57")
         self.speed_value_label.pack(anchor=tk.W, pady=(8, 0))
         
+        # 快速播放开关：跳过过渡动画，用于快进大规模排序的中间过程
+        self.turbo_var = tk.BooleanVar(value=self.turbo_mode)
+        self.turbo_check = ttk.Checkbutton(
+            parent,
+            text="⚡ 快速播放",
+            variable=self.turbo_var,
+            command=self._on_turbo_toggle
+        )
+        self.turbo_check.pack(anchor=tk.W, pady=(8, 0))
+        
     def _create_statistics_display(self, parent: ttk.Frame) -> None:
         """
         创建统计信息显示
@@ -433,87 +493,160 @@ class DuckBubbleSortApp:
             line.pack(fill=tk.X, pady=1)
     
     def _add_canvas_decorations(self) -> None:
-        """为画布添加装饰性元素"""
-        # 添加底部装饰波浪线
-        wave_points = []
-        for x in range(0, 1000, 15):
-            y = 300 + 8 * math.sin(x * 0.015)
-            wave_points.extend([x, y])
-        
-        if len(wave_points) >= 4:
-            wave = self.canvas.create_line(wave_points, fill='#4682B4', width=3, smooth=True)
-            self.canvas.tag_lower(wave)  # 将波浪线置于底层
-        
-        # 添加顶部装饰波浪线
-        wave_points_top = []
-        for x in range(0, 1000, 15):
-            y = 20 + 6 * math.sin(x * 0.02 + math.pi/2)
-            wave_points_top.extend([x, y])
-        
-        if len(wave_points_top) >= 4:
-            wave_top = self.canvas.create_line(wave_points_top, fill='#87CEEB', width=2, smooth=True)
-            self.canvas.tag_lower(wave_top)
-        
-        # 添加角落装饰
-        corner_size = 30
-        corners = [
-            (10, 10),  # 左上
-            (960, 10),  # 右上
-            (10, 280),  # 左下
-            (960, 280)  # 右下
-        ]
-        
-        for x, y in corners:
-            # 外框
-            corner_outer = self.canvas.create_rectangle(
-                x, y, x + corner_size, y + corner_size,
-                outline='#4682B4', width=3, fill=''
-            )
-            # 内框
-            corner_inner = self.canvas.create_rectangle(
-                x + 5, y + 5, x + corner_size - 5, y + corner_size - 5,
-                outline='#87CEEB', width=1, fill=''
-            )
-            self.canvas.tag_lower(corner_outer)
-            self.canvas.tag_lower(corner_inner)
-        
-        # 添加装饰性圆点
-        for i in range(5):
-            x = 50 + i * 200
-            y = 200
-            dot = self.canvas.create_oval(
-                x - 2, y - 2, x + 2, y + 2,
-                fill='#B0C4DE', outline=''
-            )
-            self.canvas.tag_lower(dot)
+        """为画布添加装饰性元素（按当前布局的画布尺寸绘制独立的装饰层，尺寸不变时不重绘）"""
+        self.decorations.render(self.layout.width, self.layout.height, self.layout.duck_y)
         
     def _initialize_ducks(self) -> None:
         """初始化鸭子"""
-        # 清除现有鸭子
-        self.canvas.delete("all")
+        # 清除现有鸭子（只删除鸭子的画布元素，保留画布装饰）
+        self._detach_virtual_scene()
+        self.canvas.delete(Duck.DUCK_TAG)
         self.baby_ducks.clear()
         
-        # 生成12个随机数值（1-100）
-        values = random.sample(range(1, 101), 12)
-        
-        # 创建小鸭子
-        start_x = 100
-        start_y = 200
-        spacing = 70
-        
+        # 按当前布局创建小鸭子
+        layout = self.layout
         self.baby_ducks = DuckFactory.create_baby_ducks(
-            self.canvas, start_x, start_y, spacing, values
+            self.canvas, layout.start_x, layout.duck_y, layout.spacing,
+            self._generate_values(), use_sprite=self.USE_SPRITE_DUCKS, detail=layout.detail,
+            draw=False, size_range=layout.size_range
         )
+        if not layout.scrolls:
+            # 场景比画布宽时只绘制视口内的鸭子（由虚拟场景负责）
+            DuckFactory.materialize(self.baby_ducks, chunk_size=self.MATERIALIZE_CHUNK)
+        DuckFactory.prewarm_sprites(self.baby_ducks, chunk_size=self.SPRITE_PREWARM_CHUNK)
         
         # 创建大母鸭
-        mother_x = 500
-        mother_y = 100
+        mother_x, mother_y = layout.mother_position
         self.mother_duck = DuckFactory.create_mother_duck(self.canvas, mother_x, mother_y)
         
         # 更新状态
         self._update_status("状态: 就绪")
         self._update_sort_status("排序状态: 未开始")
         
+    def _compute_layout(self) -> SceneLayout:
+        """按小鸭子数量和画布的当前尺寸计算场景布局"""
+        width, height = get_canvas_geometry(self.canvas).get_size()
+        return self.layout_engine.compute(self.DUCK_COUNT, width, height)
+        
+    def _on_canvas_configure(self, event) -> None:
+        """画布尺寸变化事件处理：延迟重新布局，连续的尺寸变化只布局一次"""
+        if self._relayout_job is not None:
+            self.canvas.after_cancel(self._relayout_job)
+        self._relayout_job = self.canvas.after(self.RELAYOUT_DELAY, self._relayout)
+        
+    def _relayout(self) -> None:
+        """
+        按画布的新尺寸重新布局：移动已有的鸭子和装饰元素，不重新创建小鸭子。
+        排序进行中时鸭子的位置由动画掌握，等排序停止后再应用
+        """
+        self._relayout_job = None
+        if self.layout is None:
+            return
+        if self.is_running:
+            self._layout_pending = True
+            return
+        self._layout_pending = False
+        layout = self._compute_layout()
+        if layout == self.layout:
+            return
+        self.layout = layout
+        
+        # 先滚回场景起点（固定在视口中的母鸭和装饰层随之复位），再按新布局放置
+        self._detach_virtual_scene()
+        self.layout_engine.apply(layout, self.baby_ducks, self.mother_duck)
+        if not layout.scrolls:
+            DuckFactory.materialize(self.baby_ducks, chunk_size=self.MATERIALIZE_CHUNK)
+        DuckFactory.prewarm_sprites(self.baby_ducks, chunk_size=self.SPRITE_PREWARM_CHUNK)
+        
+        # 装饰层按新尺寸重新绘制一次
+        self._add_canvas_decorations()
+        if self.sort_animation_integration:
+            self.sort_animation_integration.set_mother_lane(layout.mother_y)
+        self._attach_virtual_scene()
+        self.logger.info(f"画布尺寸变为 {layout.width}x{layout.height}，已重新布局")
+        
+    def _generate_values(self) -> List[int]:
+        """生成小鸭子的随机数值（1-100，互不相同）"""
+        return random.sample(range(1, 101), self.DUCK_COUNT)
+        
+    def _rebind_ducks(self) -> bool:
+        """
+        复用现有的小鸭子和排序、动画对象生成新数据：画布元素原地更新，
+        排序算法、动画引擎和排序动画集成只重置不重建
+        
+        Returns:
+            bool: 是否成功复用（没有可复用的对象时返回False）
+        """
+        if not self.baby_ducks or not self.mother_duck or not self.sort_animation_integration:
+            return False
+        self._detach_virtual_scene()
+        layout = self.layout
+        if not DuckFactory.rebind_baby_ducks(self.baby_ducks, layout.start_x, layout.duck_y,
+                                             layout.spacing, self._generate_values(),
+                                             size_range=layout.size_range):
+            return False
+        DuckFactory.prewarm_sprites(self.baby_ducks, chunk_size=self.SPRITE_PREWARM_CHUNK)
+        
+        # 停止引擎并重置排序状态（不启动新的动画线程）
+        self.sort_animation_integration.rebind(self.baby_ducks)
+        self.mother_duck.move_to(*layout.mother_position)
+        self._attach_virtual_scene()
+        
+        self._update_status("状态: 就绪")
+        self._update_sort_status("排序状态: 未开始")
+        return True
+        
+    def _attach_virtual_scene(self) -> None:
+        """
+        当前布局比画布宽时创建虚拟场景并交给排序动画集成：排序时视口跟随比较的鸭子，
+        装饰层、性能浮层和大母鸭固定在视口中
+        """
+        if self.virtual_scene is not None or not self.layout.scrolls:
+            return
+        if not self.sort_animation_integration:
+            return
+        scene = VirtualScene(self.canvas, self.baby_ducks, self.layout.start_x, self.layout.spacing)
+        scene.pin(DecorationLayer.TAG)
+        scene.pin(MetricsOverlay.TAG)
+        scene.pin_duck(self.mother_duck)
+        self.virtual_scene = scene
+        self.sort_animation_integration.set_virtual_scene(scene)
+        
+    def _detach_virtual_scene(self) -> None:
+        """滚回场景起点并停用虚拟场景（重新布局或重新创建鸭子之前调用）"""
+        scene = self.virtual_scene
+        if scene is None:
+            return
+        scene.scroll_to(0)
+        self.virtual_scene = None
+        if self.sort_animation_integration:
+            self.sort_animation_integration.set_virtual_scene(None)
+        scene.geometry.set_scene_size(0)
+        self.canvas.configure(scrollregion="")
+        
+    def _on_scroll(self, *args) -> None:
+        """
+        水平滚动条回调
+        
+        Args:
+            args: 滚动条命令（moveto或scroll）
+        """
+        if self.virtual_scene is not None:
+            # 排序进行中母鸭的位置由动画掌握，只滚动视口（视口会在下一次比较时跟随母鸭）
+            self.virtual_scene.xview(*args, carry_ducks=not self.is_running)
+            
+    def _on_scroll_wheel(self, event) -> None:
+        """
+        Shift+鼠标滚轮水平滚动场景
+        
+        Args:
+            event: 鼠标滚轮事件
+        """
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self._on_scroll('scroll', -1, 'units')
+        else:
+            self._on_scroll('scroll', 1, 'units')
+            
     def _setup_sort_and_animation(self) -> None:
         """设置排序算法和动画系统"""
         if not self.baby_ducks or not self.mother_duck:
@@ -525,6 +658,11 @@ class DuckBubbleSortApp:
         # 创建动画引擎
         self.animation_engine = AnimationEngine(self.canvas)
         
+        # 限制动画积压，保证画面落后于排序状态不超过最大滞后时间
+        self.animation_engine.set_backlog_policy(
+            BacklogPolicy(max_queue_depth=self.MAX_QUEUE_DEPTH, max_lag=self.MAX_ANIMATION_LAG)
+        )
+        
         # 创建排序动画集成
         self.sort_animation_integration = SortAnimationIntegration(
             self.bubble_sort,
@@ -535,6 +673,20 @@ class DuckBubbleSortApp:
         
         # 设置动画速度
         self.sort_animation_integration.set_animation_speed(self.animation_speed)
+        self.sort_animation_integration.set_turbo(self.turbo_mode)
+        # 母鸭比较时停在当前布局的行走线上
+        self.sort_animation_integration.set_mother_lane(self.layout.mother_y if self.layout else None)
+        
+        # 场景比画布宽时使用可滚动的虚拟场景
+        self._attach_virtual_scene()
+        
+        # 性能统计浮层跟随新的动画引擎
+        overlay_visible = self.metrics_overlay is not None and self.metrics_overlay.visible
+        if self.metrics_overlay:
+            self.metrics_overlay.hide()
+        self.metrics_overlay = MetricsOverlay(self.canvas, self.animation_engine.metrics)
+        if overlay_visible:
+            self.metrics_overlay.show()
         
     def _start_sort(self) -> None:
         """开始排序"""
@@ -646,9 +798,7 @@ class DuckBubbleSortApp:
         
         # 重置鸭子状态
         for duck in self.baby_ducks:
-            duck.set_sorted(False)
-            duck.set_comparing(False)
-            duck.highlight(False)
+            duck.set_state(highlighted=False, comparing=False, sorted=False)
         
         # 更新按钮状态
         self.start_button.config(state=tk.NORMAL)
@@ -665,6 +815,10 @@ class DuckBubbleSortApp:
         self._update_animation_status("动画状态: 空闲")
         self._update_current_operation("当前操作: 无")
         
+        # 应用排序期间发生的画布尺寸变化
+        if self._layout_pending:
+            self._relayout()
+        
         # 重置统计信息
         self._update_statistics()
         
@@ -699,15 +853,26 @@ class DuckBubbleSortApp:
         if self.is_running:
             self._reset_sort()
             
-        # 重新初始化鸭子
-        self._initialize_ducks()
-        
-        # 重新设置排序和动画系统
-        self._setup_sort_and_animation()
+        # 应用尚未应用的画布尺寸变化
+        if self._layout_pending:
+            self._relayout()
+            
+        # 优先复用现有的鸭子和排序、动画对象，无法复用时才重新创建
+        if not self._rebind_ducks():
+            # 重新初始化鸭子
+            self._initialize_ducks()
+            
+            # 重新设置排序和动画系统
+            self._setup_sort_and_animation()
         
         # 重置统计信息
         self._update_statistics()
         
+    def _toggle_metrics_overlay(self) -> None:
+        """切换画布上的性能统计浮层"""
+        if self.metrics_overlay:
+            self.metrics_overlay.toggle()
+            
     def _on_speed_change(self, value: str) -> None:
         """
         速度滑块变化回调
@@ -722,6 +887,13 @@ class DuckBubbleSortApp:
         if self.sort_animation_integration:
             self.sort_animation_integration.set_animation_speed(self.animation_speed)
             
+    def _on_turbo_toggle(self) -> None:
+        """快速播放开关回调"""
+        self.turbo_mode = self.turbo_var.get()
+        log_user_action("快速播放", "开启" if self.turbo_mode else "关闭")
+        if self.sort_animation_integration:
+            self.sort_animation_integration.set_turbo(self.turbo_mode)
+            
     def _on_sort_complete(self) -> None:
         """排序完成回调"""
         # 更新按钮状态
@@ -739,24 +911,47 @@ class DuckBubbleSortApp:
         self._update_animation_status("动画状态: 空闲")
         self._update_current_operation("当前操作: 排序完成 🏆")
         
+        # 应用排序期间发生的画布尺寸变化
+        self._apply_pending_layout()
+        
         # 添加完成动画效果
         self._celebrate_completion()
         
         # 显示完成消息
         messagebox.showinfo("恭喜！", "🎊 小鸭子们已经按大小排好队了！\n\n🏆 排序动画演示完成！\n\n🦆 大母鸭做得很棒！")
         
+    def _apply_pending_layout(self) -> None:
+        """应用排序期间推迟的重新布局：动画还在播放时（如完成动画）等播放完毕再应用"""
+        if not self._layout_pending:
+            return
+        integration = self.sort_animation_integration
+        if integration and not integration.is_playback_finished():
+            self.root.after(self.RELAYOUT_DELAY, self._apply_pending_layout)
+            return
+        self._relayout()
+        
     def _start_statistics_update(self) -> None:
         """启动统计信息更新"""
+        if self._statistics_job is not None:
+            self.root.after_cancel(self._statistics_job)
+            
         def update():
-            if self.is_running and not self.is_paused:
+            self._statistics_job = None
+            if not self.is_running:
+                return
+            if not self.is_paused:
                 self._update_statistics()
                 
-                # 如果排序还在进行，继续更新
-                if not self.bubble_sort.is_completed():
-                    self.root.after(100, update)
+                # 排序完成且完成动画播放完毕后进入完成状态
+                if self.sort_animation_integration.is_playback_finished():
+                    self._on_sort_complete()
+                    return
                     
+            # 排序还在进行（或暂停中），继续更新
+            self._statistics_job = self.root.after(100, update)
+            
         # 开始更新
-        self.root.after(100, update)
+        self._statistics_job = self.root.after(100, update)
         
     def _update_statistics(self) -> None:
         """更新统计信息显示"""
@@ -851,27 +1046,19 @@ class DuckBubbleSortApp:
         
     def _celebrate_completion(self) -> None:
         """添加排序完成的庆祝效果"""
-        # 为所有小鸭子添加庆祝动画
-        for i, duck in enumerate(self.baby_ducks):
-            # 创建跳跃动画
-            self._animate_duck_jump(duck, i * 100)  # 错开时间
+        # 所有小鸭子依次跳跃庆祝：一个群体动画每帧统一计算并提交所有鸭子的位置
+        if self.animation_engine and self.baby_ducks:
+            jump_anim = GroupMotionAnimator(self.animation_engine).jump(
+                self.baby_ducks, height=30, duration=1.5
+            )
+            self.animation_engine.add_animation(jump_anim)
+            if not self.animation_engine.is_playing():
+                self.animation_engine.play()
         
         # 母鸭点头庆祝
         if self.mother_duck:
             self._animate_mother_duck_celebration()
     
-    def _animate_duck_jump(self, duck, delay_ms: int) -> None:
-        """让小鸭子跳跃庆祝"""
-        def jump():
-            original_y = duck.y
-            # 向上跳
-            duck.move_to(duck.x, original_y - 30)
-            # 落回原位
-            self.root.after(200, lambda: duck.move_to(duck.x, original_y))
-        
-        # 延迟执行
-        self.root.after(delay_ms, jump)
-    
     def _animate_mother_duck_celebration(self) -> None:
         """母鸭庆祝动画"""
         if not self.mother_duck:
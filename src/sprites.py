@@ -0,0 +1,390 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 鸭子精灵图模块
+
+该模块把小鸭子的矢量图形（阴影、身体、头部、嘴巴、眼睛、翅膀和数值背景）
+按(大小档位, 身体颜色, 轮廓宽度)栅格化一次，缓存为PhotoImage。使用精灵图
+的小鸭子在画布上只有一个图片元素和一个数值文字元素，状态变化只需一次
+itemconfig(image=...)，不再为每只鸭子维护十几个矢量元素。
+
+栅格化本身是不依赖Tkinter的纯函数，每个部分只在自己的包围盒内着色，
+写入PhotoImage时按行合并相同颜色的连续像素，每段只调用一次put。
+栅格化仍然较慢，应在创建或重新布局鸭子时用prewarm提前生成各状态的精灵图，
+不要等到排序过程中第一次切换状态时才生成。
+
+主要功能:
+- rasterize_baby_duck: 把小鸭子的矢量图形栅格化为像素颜色表
+- row_runs: 把一行像素合并为相同颜色的连续段
+- size_bucket: 把鸭子大小归入精灵图的大小档位
+- SpriteCache: 精灵图缓存类，按大小档位和状态缓存PhotoImage
+- get_sprite_cache: 获取画布共享的精灵图缓存
+
+主要类:
+- DuckRaster: 栅格化结果类
+- SpriteCache: 精灵图缓存类
+
+主要函数:
+- rasterize_baby_duck: 栅格化函数
+- row_runs: 行程合并函数
+- size_bucket: 大小档位函数
+- get_sprite_cache: 获取精灵图缓存函数
+"""
+
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 精灵图大小档位的步长（像素），大小相差不到一档的鸭子共用同一张精灵图
+SIZE_STEP = 2
+
+# 与BabyDuck矢量绘制一致的固定颜色
+SHADOW_COLOR = "#D3D3D3"
+GLOW_COLOR = "#FFFFE0"
+BODY_OUTLINE = "#8B7500"
+BEAK_COLOR = "#FF8C00"
+WING_COLOR = "#FFA500"
+EYE_COLOR = "#000000"
+LABEL_BG_COLOR = "#FFFFFF"
+SHADOW_OFFSET = 3
+# 精灵图四周的留白（像素），足够容纳最宽的轮廓
+SPRITE_MARGIN = 3
+
+
+def size_bucket(size: float) -> int:
+    """
+    把鸭子大小归入精灵图的大小档位
+
+    Args:
+        size: 鸭子大小
+
+    Returns:
+        int: 大小档位（SIZE_STEP的整数倍，至少为SIZE_STEP）
+    """
+    return max(SIZE_STEP, int(round(size / SIZE_STEP)) * SIZE_STEP)
+
+
+class DuckRaster:
+    """栅格化结果类，保存像素颜色表和鸭子中心在图中的位置"""
+
+    __slots__ = ('width', 'height', 'origin_x', 'origin_y', 'rows')
+
+    def __init__(self, width: int, height: int, origin_x: int, origin_y: int,
+                 rows: List[List[Optional[str]]]):
+        """
+        初始化栅格化结果
+
+        Args:
+            width: 图片宽度
+            height: 图片高度
+            origin_x: 鸭子中心在图片中的x坐标
+            origin_y: 鸭子中心在图片中的y坐标
+            rows: 像素颜色表，按行保存，None表示透明
+        """
+        self.width = width
+        self.height = height
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.rows = rows
+
+
+def _ellipse_value(x: float, y: float, cx: float, cy: float, rx: float, ry: float) -> float:
+    """计算点相对椭圆的归一化距离平方（小于等于1表示在椭圆内）"""
+    if rx <= 0 or ry <= 0:
+        return float('inf')
+    nx = (x - cx) / rx
+    ny = (y - cy) / ry
+    return nx * nx + ny * ny
+
+
+def _paint_ellipse(x: float, y: float, box: Tuple[float, float, float, float],
+                   fill: Optional[str], outline: Optional[str], width: float) -> Optional[str]:
+    """
+    计算点在椭圆上的颜色（与Canvas的create_oval参数对应）
+
+    Returns:
+        Optional[str]: 轮廓色、填充色，或None表示不在椭圆上
+    """
+    x1, y1, x2, y2 = box
+    cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+    rx, ry = (x2 - x1) / 2, (y2 - y1) / 2
+    half = width / 2 if outline else 0.0
+    if _ellipse_value(x, y, cx, cy, rx + half, ry + half) > 1:
+        return None
+    if outline and _ellipse_value(x, y, cx, cy, rx - half, ry - half) > 1:
+        return outline
+    return fill
+
+
+def _segment_distance(x: float, y: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """计算点到线段的距离"""
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((x - ax) * dx + (y - ay) * dy) / length_sq))
+    return math.hypot(x - ax - dx * t, y - ay - dy * t)
+
+
+def _paint_polygon(x: float, y: float, points: List[Tuple[float, float]],
+                   fill: str, outline: str, width: float) -> Optional[str]:
+    """计算点在多边形上的颜色（与Canvas的create_polygon参数对应）"""
+    edges = list(zip(points, points[1:] + points[:1]))
+    if min(_segment_distance(x, y, a[0], a[1], b[0], b[1]) for a, b in edges) <= width / 2:
+        return outline
+    inside = False
+    for (ax, ay), (bx, by) in edges:
+        if (ay > y) != (by > y) and x < ax + (y - ay) * (bx - ax) / (by - ay):
+            inside = not inside
+    return fill if inside else None
+
+
+Bounds = Tuple[float, float, float, float]
+
+
+def _ellipse_bounds(box: Bounds, width: float = 0) -> Bounds:
+    """计算椭圆（含轮廓）的包围盒"""
+    half = width / 2
+    return box[0] - half, box[1] - half, box[2] + half, box[3] + half
+
+
+def _duck_layers(size: float, body_color: str,
+                 outline_width: float) -> List[Tuple[Bounds, Callable[[float, float, int, int], Optional[str]]]]:
+    """按绘制顺序生成小鸭子各部分的(包围盒, 着色函数)（坐标相对鸭子中心）"""
+    body_width = size * 0.8
+    body_height = size * 0.6
+    head_radius = size * 0.25
+    beak_length = size * 0.15
+    eye_radius = size * 0.05
+    head_x = body_width * 0.3
+    head_y = -body_height * 0.3
+    eye_x = head_x + head_radius * 0.5
+    eye_y = head_y - head_radius * 0.3
+    wing_width = body_width * 0.3
+    wing_height = body_height * 0.4
+    beak = [(head_x + head_radius, head_y), (head_x + head_radius + beak_length, head_y),
+            (head_x + head_radius, head_y + beak_length / 2)]
+
+    def shadow(x, y, px, py):
+        # 模拟gray50点画：棋盘格中一半像素着色
+        if (px + py) % 2:
+            return None
+        return _paint_ellipse(x, y, (-body_width / 2 + SHADOW_OFFSET, -body_height / 2 + SHADOW_OFFSET,
+                                     body_width / 2 + SHADOW_OFFSET, body_height / 2 + SHADOW_OFFSET),
+                              SHADOW_COLOR, None, 0)
+
+    def glint(x, y, px, py):
+        # 模拟gray75点画：每四个像素中三个着色
+        if px % 2 and py % 2:
+            return None
+        return _paint_ellipse(x, y, (-body_width / 4, -body_height / 3, -body_width / 8, -body_height / 4),
+                              GLOW_COLOR, None, 0)
+
+    def label_background(x, y, px, py):
+        # 数值背景（数值文字仍是单独的画布元素），边框宽度为1
+        x1, y1, x2, y2 = -size / 4, body_height / 2 + 5, size / 4, body_height / 2 + 20
+        if not (x1 - 0.5 <= x <= x2 + 0.5 and y1 - 0.5 <= y <= y2 + 0.5):
+            return None
+        if x < x1 + 0.5 or x > x2 - 0.5 or y < y1 + 0.5 or y > y2 - 0.5:
+            return BODY_OUTLINE
+        return LABEL_BG_COLOR
+
+    body_box = (-body_width / 2, -body_height / 2, body_width / 2, body_height / 2)
+    shadow_box = (body_box[0] + SHADOW_OFFSET, body_box[1] + SHADOW_OFFSET,
+                  body_box[2] + SHADOW_OFFSET, body_box[3] + SHADOW_OFFSET)
+    glint_box = (-body_width / 4, -body_height / 3, -body_width / 8, -body_height / 4)
+    head_box = (head_x - head_radius, head_y - head_radius, head_x + head_radius, head_y + head_radius)
+    eye_outer_box = (eye_x - eye_radius * 1.5, eye_y - eye_radius * 1.5,
+                     eye_x + eye_radius * 1.5, eye_y + eye_radius * 1.5)
+    eye_box = (eye_x - eye_radius, eye_y - eye_radius, eye_x + eye_radius, eye_y + eye_radius)
+    eye_glint_box = (eye_x - eye_radius * 0.3, eye_y - eye_radius * 0.3,
+                     eye_x - eye_radius * 0.1, eye_y - eye_radius * 0.1)
+    wing_box = (-body_width * 0.1, -wing_height / 2, -body_width * 0.1 + wing_width, wing_height / 2)
+    beak_box = (min(x for x, _ in beak) - 0.5, min(y for _, y in beak) - 0.5,
+                max(x for x, _ in beak) + 0.5, max(y for _, y in beak) + 0.5)
+    label_box = (-size / 4 - 0.5, body_height / 2 + 4.5, size / 4 + 0.5, body_height / 2 + 20.5)
+
+    return [
+        (shadow_box, shadow),
+        (_ellipse_bounds(body_box, outline_width),
+         lambda x, y, px, py: _paint_ellipse(x, y, body_box, body_color, BODY_OUTLINE, outline_width)),
+        (glint_box, glint),
+        (_ellipse_bounds(head_box, 2),
+         lambda x, y, px, py: _paint_ellipse(x, y, head_box, body_color, BODY_OUTLINE, 2)),
+        (beak_box, lambda x, y, px, py: _paint_polygon(x, y, beak, BEAK_COLOR, "#000000", 1)),
+        (_ellipse_bounds(eye_outer_box, 1),
+         lambda x, y, px, py: _paint_ellipse(x, y, eye_outer_box, "white", "#000000", 1)),
+        (eye_box, lambda x, y, px, py: _paint_ellipse(x, y, eye_box, EYE_COLOR, None, 0)),
+        (eye_glint_box, lambda x, y, px, py: _paint_ellipse(x, y, eye_glint_box, "white", None, 0)),
+        (_ellipse_bounds(wing_box, 1),
+         lambda x, y, px, py: _paint_ellipse(x, y, wing_box, WING_COLOR, "#000000", 1)),
+        (label_box, label_background),
+    ]
+
+
+def rasterize_baby_duck(size: float, body_color: str, outline_width: float = 2) -> DuckRaster:
+    """
+    把小鸭子的矢量图形栅格化为像素颜色表（按像素中心采样，后绘制的部分覆盖先绘制的部分）
+
+    Args:
+        size: 鸭子大小
+        body_color: 身体和头部的颜色
+        outline_width: 身体轮廓宽度
+
+    Returns:
+        DuckRaster: 栅格化结果
+    """
+    # 边距与轮廓宽度无关，同一大小档位的各状态精灵图中心位置一致
+    margin = SPRITE_MARGIN
+    left = -size * 0.4 - margin
+    right = size * 0.8 * 0.3 + size * 0.25 + size * 0.15 + margin
+    top = -size * 0.6 * 0.3 - size * 0.25 - margin
+    bottom = max(size * 0.3 + SHADOW_OFFSET, size * 0.3 + 20) + margin
+    # 图片以鸭子中心对称，画布上以anchor="center"放置，缩放鸭子时图片不会偏移
+    origin_x = int(math.ceil(max(-left, right)))
+    origin_y = int(math.ceil(max(-top, bottom)))
+    width = origin_x * 2
+    height = origin_y * 2
+
+    layers = _duck_layers(size, body_color, outline_width)
+    rows = []
+    for py in range(height):
+        y = py + 0.5 - origin_y
+        row: List[Optional[str]] = [None] * width
+        # 每个部分只在与本行相交的包围盒范围内着色，按绘制顺序覆盖
+        for (x1, y1, x2, y2), layer in layers:
+            if y < y1 or y > y2:
+                continue
+            first = max(0, int(math.floor(x1 + origin_x - 0.5)))
+            last = min(width - 1, int(math.ceil(x2 + origin_x - 0.5)))
+            for px in range(first, last + 1):
+                painted = layer(px + 0.5 - origin_x, y, px, py)
+                if painted is not None:
+                    row[px] = painted
+        rows.append(row)
+    return DuckRaster(width, height, origin_x, origin_y, rows)
+
+
+def row_runs(row: List[Optional[str]]) -> List[Tuple[int, int, str]]:
+    """
+    把一行像素合并为相同颜色的连续段（跳过透明像素）
+
+    Args:
+        row: 一行像素颜色
+
+    Returns:
+        List[Tuple[int, int, str]]: 连续段列表 (起始x, 结束x(不含), 颜色)
+    """
+    runs = []
+    start = 0
+    for index in range(1, len(row) + 1):
+        if index == len(row) or row[index] != row[start]:
+            if row[start] is not None:
+                runs.append((start, index, row[start]))
+            start = index
+    return runs
+
+
+class SpriteCache:
+    """精灵图缓存类，按大小档位和状态缓存PhotoImage"""
+
+    def __init__(self, canvas: Any = None, image_factory: Optional[Callable[..., Any]] = None):
+        """
+        初始化精灵图缓存
+
+        Args:
+            canvas: Tkinter画布对象，作为PhotoImage的master
+            image_factory: 创建空白图片的函数 f(width, height)，默认使用tk.PhotoImage
+        """
+        self.canvas = canvas
+        if image_factory is None:
+            import tkinter as tk
+            image_factory = lambda width, height: tk.PhotoImage(master=canvas, width=width, height=height)
+        self._image_factory = image_factory
+        # (大小档位, 身体颜色, 轮廓宽度) -> 图片
+        self._sprites: Dict[Tuple[int, str, float], Any] = {}
+
+    def get(self, size: float, body_color: str, outline_width: float = 2) -> Any:
+        """
+        获取（必要时栅格化）精灵图
+
+        Args:
+            size: 鸭子大小
+            body_color: 身体和头部的颜色
+            outline_width: 身体轮廓宽度
+
+        Returns:
+            Any: 以鸭子中心为图片中心的PhotoImage
+        """
+        key = (size_bucket(size), body_color, outline_width)
+        image = self._sprites.get(key)
+        if image is None:
+            image = self._render(key)
+        return image
+
+    def _render(self, key: Tuple[int, str, float]) -> Any:
+        """栅格化并缓存一张精灵图"""
+        raster = rasterize_baby_duck(*key)
+        image = self._image_factory(raster.width, raster.height)
+        for y, row in enumerate(raster.rows):
+            for start, end, color in row_runs(row):
+                image.put(color, to=(start, y, end, y + 1))
+        self._sprites[key] = image
+        return image
+
+    def get_missing(self, requests: Iterable[Tuple[float, str, float]]) -> List[Tuple[int, str, float]]:
+        """
+        获取尚未生成的精灵图（按请求顺序去重）
+
+        Args:
+            requests: (鸭子大小, 身体颜色, 轮廓宽度)的序列
+
+        Returns:
+            List[Tuple[int, str, float]]: 尚未缓存的 (大小档位, 身体颜色, 轮廓宽度) 列表
+        """
+        missing = []
+        seen = set()
+        for size, body_color, outline_width in requests:
+            key = (size_bucket(size), body_color, outline_width)
+            if key not in self._sprites and key not in seen:
+                seen.add(key)
+                missing.append(key)
+        return missing
+
+    def prewarm(self, requests: Iterable[Tuple[float, str, float]]) -> int:
+        """
+        提前生成精灵图，之后的get只需查表
+
+        Args:
+            requests: (鸭子大小, 身体颜色, 轮廓宽度)的序列
+
+        Returns:
+            int: 新生成的精灵图数量
+        """
+        missing = self.get_missing(requests)
+        for key in missing:
+            if key not in self._sprites:
+                self._render(key)
+        return len(missing)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._sprites.clear()
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+
+def get_sprite_cache(canvas: Any) -> SpriteCache:
+    """
+    获取画布共享的精灵图缓存（每个画布只创建一个）
+
+    Args:
+        canvas: Tkinter画布对象
+
+    Returns:
+        SpriteCache: 精灵图缓存
+    """
+    cache = getattr(canvas, '_duck_sprites', None)
+    if cache is None:
+        cache = SpriteCache(canvas)
+        try:
+            canvas._duck_sprites = cache
+        except AttributeError:
+            pass
+    return cache
@@ -0,0 +1,207 @@
+"""
+小鸭子冒泡排序可视化动画项目 - 虚拟场景模块
+
+该模块提供可横向滚动的虚拟场景。所有小鸭子按固定间距排成一排，场景
+宽度可以远大于画布；只有位于视口及其两侧边距内的小鸭子拥有画布元素，
+离开视口的小鸭子把元素让给进入视口的小鸭子原地复用，画布元素数量只
+取决于视口宽度，与鸭子总数无关。视口可以自动跟随当前比较的位置，也可以
+由滚动条和鼠标滚轮控制。固定在视口中的元素（如装饰层）和大母鸭随视口
+一起移动，滚动时不会离开画面。
+
+主要功能:
+- VirtualScene: 虚拟场景类，按视口裁剪并复用小鸭子的画布元素
+
+主要类:
+- VirtualScene: 虚拟场景类
+"""
+
+import math
+from typing import Any, List, Set, Tuple
+
+from src.canvas_geometry import get_canvas_geometry
+
+
+class VirtualScene:
+    """虚拟场景类，按视口裁剪并复用小鸭子的画布元素"""
+
+    def __init__(self,
+                 canvas: Any,
+                 ducks: List,
+                 start_x: float,
+                 spacing: float,
+                 margin: float = 200.0,
+                 follow_padding: float = 150.0):
+        """
+        初始化虚拟场景
+
+        Args:
+            canvas: Tkinter画布对象
+            ducks: 小鸭子列表（与排序算法共用同一个列表，按位置从左到右排列，
+                   可以用draw=False创建）
+            start_x: 第一只小鸭子的x坐标
+            spacing: 小鸭子之间的间距
+            margin: 视口两侧额外保留画布元素的宽度
+            follow_padding: 自动跟随时，目标离视口边缘小于该距离就滚动
+        """
+        self.canvas = canvas
+        self.ducks = ducks
+        self.start_x = start_x
+        self.spacing = spacing
+        self.margin = margin
+        self.follow_padding = follow_padding
+        self.geometry = get_canvas_geometry(canvas)
+        self.scroll_x = 0.0  # 视口左边缘在场景中的x坐标
+        self._pinned_tags: List[str] = []  # 固定在视口中的画布标签
+        self._pinned_ducks: List[Any] = []  # 固定在视口中的鸭子（如大母鸭）
+        self._drawn: Set[Any] = {duck for duck in ducks if duck.is_drawn()}  # 拥有画布元素的小鸭子
+        self._configure_scene()
+
+    @property
+    def scene_width(self) -> float:
+        """场景宽度（最后一只小鸭子右侧留出与左侧相同的空白）"""
+        return max(self.geometry.width, self.start_x * 2 + self.spacing * max(0, len(self.ducks) - 1))
+
+    def _configure_scene(self) -> None:
+        """设置画布的滚动范围，并让鸭子的边界限制按场景宽度计算"""
+        width = int(math.ceil(self.scene_width))
+        self.geometry.set_scene_size(width)
+        try:
+            self.canvas.configure(scrollregion=(0, 0, width, self.geometry.height))
+            self.canvas.xview_moveto(0)
+        except Exception:
+            pass
+
+    def pin(self, tag: str) -> None:
+        """
+        把带有指定标签的画布元素固定在视口中，滚动时随视口一起移动
+
+        Args:
+            tag: 画布标签（如装饰层的标签）
+        """
+        self._pinned_tags.append(tag)
+
+    def pin_duck(self, duck: Any) -> None:
+        """
+        把鸭子固定在视口中：滚动条和滚轮滚动时鸭子随视口一起移动；
+        跟随比较位置的自动滚动不移动它（它正走向被跟随的位置）
+
+        Args:
+            duck: 鸭子对象（如大母鸭）
+        """
+        self._pinned_ducks.append(duck)
+
+    def get_viewport(self) -> Tuple[float, float]:
+        """
+        获取视口在场景中的横向范围
+
+        Returns:
+            Tuple[float, float]: (左边缘x, 右边缘x)
+        """
+        return self.scroll_x, self.scroll_x + self.geometry.width
+
+    def get_visible_range(self) -> Tuple[int, int]:
+        """
+        获取需要拥有画布元素的小鸭子索引范围（视口加两侧边距）
+
+        Returns:
+            Tuple[int, int]: (起始索引, 结束索引(不含))
+        """
+        left, right = self.get_viewport()
+        first = int(math.floor((left - self.margin - self.start_x) / self.spacing))
+        last = int(math.ceil((right + self.margin - self.start_x) / self.spacing)) + 1
+        return max(0, first), min(len(self.ducks), last)
+
+    def get_drawn_count(self) -> int:
+        """获取当前拥有画布元素的小鸭子数量"""
+        return len(self._drawn)
+
+    def scroll_to(self, x: float, carry_ducks: bool = True) -> None:
+        """
+        把视口左边缘滚动到场景中的指定位置，固定在视口中的元素随之移动
+
+        Args:
+            x: 视口左边缘的x坐标（超出场景范围时会被限制）
+            carry_ducks: 固定在视口中的鸭子是否随视口移动
+        """
+        x = max(0.0, min(self.scene_width - self.geometry.width, x))
+        if x == self.scroll_x:
+            return
+        dx = x - self.scroll_x
+        self.scroll_x = x
+        try:
+            self.canvas.xview_moveto(x / self.scene_width)
+            for tag in self._pinned_tags:
+                self.canvas.move(tag, dx, 0)
+        except Exception:
+            pass
+        if carry_ducks:
+            for duck in self._pinned_ducks:
+                duck.move_to(duck.x + dx, duck.y)
+        self.update()
+
+    def xview(self, *args, carry_ducks: bool = True) -> None:
+        """
+        按滚动条的命令滚动视口（可直接作为水平滚动条的command）
+
+        Args:
+            args: 滚动条命令，('moveto', 比例) 或 ('scroll', 数量, 'units'/'pages')
+            carry_ducks: 固定在视口中的鸭子是否随视口移动
+        """
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self.scroll_to(float(args[1]) * self.scene_width, carry_ducks)
+        elif args[0] == 'scroll':
+            if args[2] == 'pages':
+                step = self.geometry.width * 0.9
+            else:
+                step = max(self.spacing, 20.0)
+            self.scroll_to(self.scroll_x + int(args[1]) * step, carry_ducks)
+
+    def follow(self, x: float) -> None:
+        """
+        让视口跟随场景中的指定位置：离视口边缘太近时把它滚动到视口中央
+
+        Args:
+            x: 要跟随的x坐标（如当前比较的小鸭子的位置）
+        """
+        left, right = self.get_viewport()
+        if left + self.follow_padding <= x <= right - self.follow_padding:
+            return
+        self.scroll_to(x - self.geometry.width / 2, carry_ducks=False)
+
+    def update(self) -> None:
+        """
+        按当前视口更新拥有画布元素的小鸭子：离开范围的让出元素，进入范围的
+        优先复用让出的元素，不够时才新建（每帧调用，开销只与视口内的鸭子数量有关）
+        """
+        first, last = self.get_visible_range()
+        visible = self.ducks[first:last]
+        visible_set = set(visible)
+
+        # 离开范围的小鸭子成为元素的提供者
+        donors = [duck for duck in self._drawn if duck not in visible_set]
+        for duck in visible:
+            if duck in self._drawn:
+                continue
+            if donors:
+                donor = donors.pop()
+                duck.take_items(donor)
+                self._drawn.discard(donor)
+            else:
+                duck.draw()
+            self._drawn.add(duck)
+
+        # 没有被复用的元素已在视口之外，删除以保持元素数量有界
+        for donor in donors:
+            donor.clear()
+            self._drawn.discard(donor)
+
+    def attach(self, engine: Any) -> None:
+        """
+        在动画引擎的每帧末尾更新场景
+
+        Args:
+            engine: 动画引擎
+        """
+        engine.on_frame_end = self.update
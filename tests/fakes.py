@@ -0,0 +1,296 @@
+"""
+测试共用的模拟对象（无需图形界面）
+
+各测试模块从这里导入模拟画布、模拟图片和模拟鸭子，不再各自定义。
+模拟画布记录所有元素的坐标、标签和选项，以及每一次画布调用，
+测试按需检查记录即可。
+
+主要功能:
+- FakeCanvas: 模拟Tkinter画布类，记录元素和调用
+- FakeImage: 模拟PhotoImage类，记录写入的像素
+- MockDuck: 模拟鸭子类，记录位置、状态和提交次数
+- run_main_loop: 交替运行动画引擎和画布的空闲调度，模拟主线程的事件循环
+
+主要类:
+- FakeCanvas: 模拟画布类
+- FakeImage: 模拟图片类
+- MockDuck: 模拟鸭子类
+
+主要函数:
+- run_main_loop: 模拟事件循环函数
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class FakeCanvas:
+    """模拟Tkinter画布类，按元素记录坐标、标签和选项，并记录每一次画布调用"""
+
+    def __init__(self, width: int = 1000, height: int = 600):
+        """
+        初始化模拟画布
+
+        Args:
+            width: 画布宽度
+            height: 画布高度
+        """
+        self.width = width
+        self.height = height
+        self.items: Dict[int, Dict[str, Any]] = {}  # 元素ID -> {'kind', 'coords', 'tags', 其他选项}
+        self.next_id = 1
+        self.created = 0
+        self.deleted = 0
+        self.calls: List[Tuple] = []                 # 除创建以外的所有画布调用 (名称, 参数...)
+        self.configs: List[Tuple[Any, dict]] = []    # itemconfig调用 (标签或ID, 选项)
+        self.moves: List[Tuple[Any, float, float]] = []  # move调用 (标签或ID, dx, dy)
+        self.after_calls: List[Tuple[int, Callable, tuple]] = []  # after调度 (延迟, 函数, 参数)
+        self.idle: List[Tuple[Callable, tuple]] = []  # after_idle调度 (函数, 参数)
+        self.handlers: List[Callable] = []           # 绑定的<Configure>事件处理函数
+        self.queries = 0                             # 尺寸查询次数
+        self.options: Dict[str, Any] = {}            # 画布选项（configure设置，cget查询）
+        self.view_x = 0.0                            # 视口左边缘的画布x坐标（xview_moveto按滚动区域设置）
+
+    # ---- 创建元素 ----
+
+    def _create(self, kind: str, args: tuple, kwargs: dict) -> int:
+        coords = list(args[0]) if len(args) == 1 and isinstance(args[0], (list, tuple)) else list(args)
+        item = self.next_id
+        self.next_id += 1
+        data = dict(kwargs)
+        data['kind'] = kind
+        data['coords'] = [float(value) for value in coords]
+        data['tags'] = tuple(kwargs.get('tags', ()))
+        self.items[item] = data
+        self.created += 1
+        return item
+
+    def create_oval(self, *args, **kwargs) -> int:
+        return self._create('oval', args, kwargs)
+
+    def create_polygon(self, *args, **kwargs) -> int:
+        return self._create('polygon', args, kwargs)
+
+    def create_rectangle(self, *args, **kwargs) -> int:
+        return self._create('rectangle', args, kwargs)
+
+    def create_text(self, *args, **kwargs) -> int:
+        return self._create('text', args, kwargs)
+
+    def create_line(self, *args, **kwargs) -> int:
+        return self._create('line', args, kwargs)
+
+    def create_arc(self, *args, **kwargs) -> int:
+        return self._create('arc', args, kwargs)
+
+    def create_image(self, *args, **kwargs) -> int:
+        return self._create('image', args, kwargs)
+
+    # ---- 查找和修改元素 ----
+
+    def find_withtag(self, tag_or_id) -> List[int]:
+        """按标签或元素ID查找元素"""
+        if tag_or_id in self.items:
+            return [tag_or_id]
+        return [item for item, data in self.items.items() if tag_or_id in data['tags']]
+
+    def count(self, name: str) -> int:
+        """统计指定名称的画布调用次数"""
+        return sum(1 for call in self.calls if call[0] == name)
+
+    def coords(self, tag_or_id, *values):
+        """模拟坐标查询和设置"""
+        self.calls.append(('coords', tag_or_id) + values)
+        items = self.find_withtag(tag_or_id)
+        if values:
+            flat = list(values[0]) if len(values) == 1 else list(values)
+            for item in items:
+                self.items[item]['coords'] = [float(value) for value in flat]
+        return list(self.items[items[0]]['coords']) if items else []
+
+    def itemconfig(self, tag_or_id, **kwargs) -> None:
+        """模拟外观设置"""
+        self.calls.append(('itemconfig', tag_or_id, kwargs))
+        self.configs.append((tag_or_id, kwargs))
+        for item in self.find_withtag(tag_or_id):
+            self.items[item].update(kwargs)
+
+    def move(self, tag_or_id, dx, dy) -> None:
+        """模拟移动"""
+        self.calls.append(('move', tag_or_id, dx, dy))
+        self.moves.append((tag_or_id, dx, dy))
+        for item in self.find_withtag(tag_or_id):
+            data = self.items[item]
+            data['coords'] = [value + (dy if index % 2 else dx) for index, value in enumerate(data['coords'])]
+
+    def scale(self, tag_or_id, x0, y0, fx, fy) -> None:
+        """模拟缩放"""
+        self.calls.append(('scale', tag_or_id, x0, y0, fx, fy))
+        for item in self.find_withtag(tag_or_id):
+            data = self.items[item]
+            data['coords'] = [(y0 + (value - y0) * fy) if index % 2 else (x0 + (value - x0) * fx)
+                              for index, value in enumerate(data['coords'])]
+
+    def delete(self, tag_or_id) -> None:
+        """模拟删除"""
+        self.calls.append(('delete', tag_or_id))
+        for item in self.find_withtag(tag_or_id):
+            del self.items[item]
+            self.deleted += 1
+
+    def tag_raise(self, tag_or_id, above=None) -> None:
+        """模拟提升层级"""
+        self.calls.append(('tag_raise', tag_or_id))
+
+    def tag_lower(self, tag_or_id, below=None) -> None:
+        """模拟降低层级"""
+        self.calls.append(('tag_lower', tag_or_id))
+
+    # ---- 调度 ----
+
+    def after(self, delay: int, func: Optional[Callable] = None, *args) -> str:
+        """记录after调度"""
+        self.after_calls.append((delay, func, args))
+        return "after#{}".format(len(self.after_calls))
+
+    def after_idle(self, func: Callable, *args) -> str:
+        """记录空闲时的调度"""
+        self.idle.append((func, args))
+        return "idle#{}".format(len(self.idle))
+
+    def after_cancel(self, job) -> None:
+        """模拟取消调度"""
+
+    def run_idle(self) -> int:
+        """
+        依次执行空闲时的调度（执行过程中新加入的调度也会执行）
+
+        Returns:
+            int: 执行的调度数量
+        """
+        count = 0
+        while self.idle:
+            func, args = self.idle.pop(0)
+            func(*args)
+            count += 1
+        return count
+
+    # ---- 尺寸和视图 ----
+
+    def winfo_width(self) -> int:
+        """模拟宽度查询"""
+        self.queries += 1
+        return self.width
+
+    def winfo_height(self) -> int:
+        """模拟高度查询"""
+        self.queries += 1
+        return self.height
+
+    def bind(self, sequence: str, func, add=None) -> None:
+        """模拟事件绑定（只记录<Configure>）"""
+        self.calls.append(('bind', sequence, add))
+        if sequence == "<Configure>":
+            self.handlers.append(func)
+
+    def configure_to(self, width: int, height: int) -> None:
+        """模拟画布尺寸变化"""
+        self.width = width
+        self.height = height
+        event = type("Event", (), {"width": width, "height": height})()
+        for handler in self.handlers:
+            handler(event)
+
+    def configure(self, **kwargs) -> None:
+        """模拟画布选项设置"""
+        self.calls.append(('configure', kwargs))
+        self.options.update(kwargs)
+
+    def cget(self, option: str) -> Any:
+        """模拟画布选项查询（未设置的选项为0）"""
+        return self.options.get(option, 0)
+
+    def xview_moveto(self, fraction: float) -> None:
+        """模拟水平滚动（设置了滚动区域时同时更新视口位置）"""
+        self.calls.append(('xview_moveto', fraction))
+        region = self.options.get('scrollregion')
+        if isinstance(region, (list, tuple)) and len(region) == 4:
+            self.view_x = region[0] + (region[2] - region[0]) * fraction
+
+    def canvasx(self, x: float) -> float:
+        """模拟窗口x坐标到画布x坐标的转换"""
+        return self.view_x + x
+
+    def canvasy(self, y: float) -> float:
+        """模拟窗口y坐标到画布y坐标的转换（不支持垂直滚动）"""
+        return float(y)
+
+
+class FakeImage:
+    """模拟PhotoImage类，记录写入的像素"""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.puts: List[Tuple[str, Any]] = []
+
+    def put(self, color, to=None) -> None:
+        """模拟写入像素"""
+        self.puts.append((color, to))
+
+
+class MockDuck:
+    """模拟鸭子类，记录位置、状态和每一次实际的提交"""
+
+    def __init__(self, x: float, y: float, size: float = 40, value: int = 0):
+        self.x = x
+        self.y = y
+        self.size = size
+        self.value = value
+        self.is_highlighted = False
+        self.is_comparing = False
+        self.is_sorted = False
+        self.moves = 0
+        self.commits = 0
+        self.highlight_history: List[bool] = []
+
+    def move_to(self, new_x: float, new_y: float) -> None:
+        """模拟移动方法"""
+        self.x = new_x
+        self.y = new_y
+        self.moves += 1
+        self.commits += 1
+
+    def highlight(self, highlight: bool = True) -> None:
+        """模拟高亮方法"""
+        self.is_highlighted = highlight
+        self.highlight_history.append(highlight)
+        self.commits += 1
+
+    def set_comparing(self, comparing: bool = True) -> None:
+        """模拟比较状态方法"""
+        self.is_comparing = comparing
+        self.commits += 1
+
+    def set_sorted(self, sorted: bool = True) -> None:
+        """模拟已排序状态方法"""
+        self.is_sorted = sorted
+        self.commits += 1
+
+    def raise_to_top(self) -> None:
+        """模拟提升层级方法"""
+
+
+def run_main_loop(engine, canvas: FakeCanvas, dt: Optional[float] = None) -> None:
+    """
+    模拟主线程的事件循环：交替回放动画队列（不启动引擎线程）和执行画布的空闲调度，
+    直到队列播放完毕且没有新的空闲调度
+
+    Args:
+        engine: 使用虚拟时钟的动画引擎
+        canvas: 模拟画布
+        dt: 每帧的时间步长，None表示使用引擎的帧间隔
+    """
+    while True:
+        engine.run_until_idle(dt)
+        if not canvas.run_idle() and engine.get_queue_length() == 0:
+            break
@@ -0,0 +1,132 @@
+"""
+测试动画对象池的程序（无需图形界面）
+
+主要功能:
+- test_pool_reuses_completed_animations: 测试完成的动画会被回收复用
+- test_unpooled_animation_not_recycled: 测试直接创建的动画不会进入对象池
+- test_single_ownership: 测试动画加入引擎后不能重复加入，被回收后不能再次加入
+- test_release_on_stop_and_error: 测试引擎停止和更新出错时当前动画也被回收
+- test_effects_use_pool: 测试弹跳、摇晃和庆祝动画也从对象池获取
+
+主要函数:
+- test_pool_reuses_completed_animations: 动画复用测试函数
+- test_unpooled_animation_not_recycled: 非池化动画测试函数
+- test_single_ownership: 单一所有权测试函数
+- test_release_on_stop_and_error: 异常路径回收测试函数
+- test_effects_use_pool: 效果动画池化测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation.animation_engine import Animation, AnimationEngine, AnimationType, VirtualClock
+from animation.animators import DuckAnimator, MotherDuckAnimator
+from tests.fakes import MockDuck
+
+
+def test_pool_reuses_completed_animations():
+    """测试完成的动画会被回收复用"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    engine.set_backlog_policy(None)
+    duck = MockDuck(0, 0)
+
+    for step in range(10):
+        engine.add_animation(engine.create_move_animation(duck, (step * 10, 0), (step * 10 + 10, 0), 0.1))
+        engine.run_until_idle(0.05)
+        assert duck.x == step * 10 + 10
+
+    pool = engine.animation_pool
+    assert pool.created_count == 1
+    assert pool.reused_count == 9
+    assert pool.get_free_count() == 1
+
+
+def test_unpooled_animation_not_recycled():
+    """测试直接创建的动画不会进入对象池"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    calls = []
+
+    animation = Animation(AnimationType.CUSTOM, 0.1)
+    animation.on_complete = lambda: calls.append("done")
+    engine.add_animation(animation)
+    engine.run_until_idle(0.05)
+
+    assert calls == ["done"]
+    assert engine.animation_pool.get_free_count() == 0
+    # 调用方持有的动画对象没有被重置
+    assert animation.is_completed
+
+
+
+def test_single_ownership():
+    """测试动画加入引擎后不能重复加入，被回收后不能再次加入"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    duck = MockDuck(0, 0)
+    animation = engine.create_move_animation(duck, (0, 0), (10, 0), 0.1)
+    engine.add_animation(animation)
+    try:
+        engine.add_animation(animation)
+        assert False, "重复加入应抛出ValueError"
+    except ValueError:
+        pass
+
+    engine.run_until_idle(0.05)
+    assert animation.in_pool
+    try:
+        engine.add_animation(animation)
+        assert False, "加入已回收的动画应抛出ValueError"
+    except ValueError:
+        pass
+
+    # 重复回收不会让同一个对象在池中出现两次
+    engine.animation_pool.release(animation)
+    assert engine.animation_pool.get_free_count() == 1
+
+
+def test_release_on_stop_and_error():
+    """测试引擎停止和更新出错时当前动画也被回收"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    duck = MockDuck(0, 0)
+    engine.add_animation(engine.create_move_animation(duck, (0, 0), (10, 0), 1.0))
+    engine.add_animation(engine.create_move_animation(duck, (10, 0), (20, 0), 1.0))
+    engine.step_frame(0.1)
+    assert engine.current_animation is not None
+    engine.stop()
+    assert engine.current_animation is None
+    assert engine.animation_pool.get_free_count() == 2
+
+    def fail(animation, progress):
+        raise RuntimeError("update failed")
+
+    engine.add_animation(engine.acquire_animation(AnimationType.CUSTOM, 1.0, update_func=fail))
+    engine.step_frame(0.1)
+    assert engine.current_animation is None
+    assert engine.animation_pool.get_free_count() == 2
+
+
+def test_effects_use_pool():
+    """测试弹跳、摇晃和庆祝动画也从对象池获取"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    duck = MockDuck(200, 300)
+    mother = MockDuck(400, 100, size=60)
+    animations = [DuckAnimator(duck, engine).bounce(20, 0.5),
+                  DuckAnimator(duck, engine).shake(5, 0.3),
+                  MotherDuckAnimator(mother, engine).celebrate(1.0)]
+    assert all(animation.pooled and animation.on_update is None for animation in animations)
+
+    for animation in animations:
+        engine.add_animation(animation)
+    engine.run_until_idle(0.05)
+    assert (duck.x, duck.y) == (200, 300)
+    assert (mother.x, mother.y) == (400, 100)
+    assert engine.animation_pool.get_free_count() == 3
+
+
+if __name__ == "__main__":
+    test_pool_reuses_completed_animations()
+    test_unpooled_animation_not_recycled()
+    test_single_ownership()
+    test_release_on_stop_and_error()
+    test_effects_use_pool()
+    print("所有测试完成！")
@@ -0,0 +1,129 @@
+"""
+测试动画积压合并策略的程序（无需图形界面）
+
+主要功能:
+- test_collapse_compare_animations: 测试积压时比较/高亮动画直接跳到结束状态
+- test_merge_consecutive_moves: 测试同一鸭子的连续移动被合并
+- test_lag_is_bounded: 测试压缩后显示滞后不超过最大滞后时间
+- test_merge_requires_plain_moves: 测试只合并按起止位置插值的移动动画
+- test_queue_cleared_before_pop: 测试检查队列后、取出动画前队列被清空时本帧不播放
+
+主要函数:
+- test_collapse_compare_animations: 比较动画合并测试函数
+- test_merge_consecutive_moves: 连续移动合并测试函数
+- test_lag_is_bounded: 滞后上限测试函数
+- test_merge_requires_plain_moves: 移动合并条件测试函数
+- test_queue_cleared_before_pop: 队列被清空测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation.animation_engine import AnimationEngine, AnimationType, BacklogPolicy, VirtualClock
+from tests.fakes import MockDuck
+
+
+def test_collapse_compare_animations():
+    """测试积压时比较/高亮动画直接跳到结束状态"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    duck = MockDuck(0, 0)
+    completed = []
+    engine.set_callbacks(on_animation_complete=lambda anim: completed.append(anim.type))
+
+    for _ in range(5):
+        engine.add_animation(engine.create_highlight_animation(duck, 0.5))
+    assert not duck.is_highlighted  # 高亮在播放时写入显示列表，不在创建时提交
+    assert engine.get_queue_length() == 5
+
+    engine.set_backlog_policy(BacklogPolicy(max_queue_depth=2, max_lag=100.0))
+    assert engine.get_queue_length() == 5  # 策略只在动画线程处理帧时执行
+    engine.step_frame(0.0)
+
+    # 高亮动画被跳过，完成回调照常触发，高亮状态被正确清除
+    assert engine.get_queue_length() == 0
+    assert completed == [AnimationType.HIGHLIGHT] * 5
+    assert not duck.is_highlighted
+
+
+def test_merge_consecutive_moves():
+    """测试同一鸭子的连续移动被合并"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    duck = MockDuck(0, 0)
+    started = []
+    engine.set_callbacks(on_animation_start=lambda anim: started.append(anim.type))
+
+    engine.add_animation(engine.create_move_animation(duck, (0, 0), (100, 0), 1.0))
+    engine.add_animation(engine.create_move_animation(duck, (100, 0), (200, 0), 1.0))
+    engine.add_animation(engine.create_move_animation(duck, (200, 0), (300, 0), 1.0))
+    engine.set_backlog_policy(BacklogPolicy(max_queue_depth=1, max_lag=100.0))
+
+    engine.run_until_idle()
+    assert started == [AnimationType.MOVE]
+    assert duck.x == 300
+
+
+def test_lag_is_bounded():
+    """测试压缩后显示滞后不超过最大滞后时间"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    engine.set_backlog_policy(BacklogPolicy(max_queue_depth=100, max_lag=2.0))
+
+    ducks = [MockDuck(i * 10, 0) for i in range(10)]
+    for duck in ducks:
+        engine.add_animation(engine.create_move_animation(duck, (duck.x, 0), (duck.x + 50, 0), 1.0))
+    assert engine.get_lag() == 10.0
+    engine.step_frame(0.0)
+    assert engine.get_lag() <= 2.0 + 1e-9
+
+    engine.run_until_idle()
+    assert all(duck.x == i * 10 + 50 for i, duck in enumerate(ducks))
+
+
+
+def test_merge_requires_plain_moves():
+    """测试只合并按起止位置插值的移动动画"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    duck = MockDuck(0, 0)
+    hops = []
+
+    engine.add_animation(engine.create_move_animation(duck, (0, 0), (100, 0), 1.0))
+    # 自定义更新函数的移动（例如沿弧线跳动）不能只改写结束位置
+    hop = engine.acquire_animation(AnimationType.MOVE, 1.0, update_func=lambda anim, progress: hops.append(progress),
+                                   target=duck)
+    hop.start_pos, hop.end_pos = (100, 0), (200, 0)
+    engine.add_animation(hop)
+    engine.set_backlog_policy(BacklogPolicy(max_queue_depth=1, max_lag=100.0))
+
+    engine.run_until_idle()
+    assert duck.x == 100
+    assert hops and hops[-1] == 1.0
+
+
+def test_queue_cleared_before_pop():
+    """测试检查队列后、取出动画前队列被清空时本帧不播放"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    engine.set_backlog_policy(None)
+    started = []
+    engine.set_callbacks(on_animation_start=lambda anim: started.append(anim.type))
+    engine.add_animation(engine.create_move_animation(MockDuck(0, 0), (0, 0), (100, 0), 1.0))
+
+    # 模拟其他线程（停止或重置）在检查队列之后、加锁取出之前清空队列
+    record_frame = engine.metrics.record_frame
+
+    def record_and_clear(*args):
+        record_frame(*args)
+        engine.clear_queue()
+
+    engine.metrics.record_frame = record_and_clear
+    assert not engine.step_frame(0.0)
+    assert engine.current_animation is None
+    assert started == []
+
+
+if __name__ == "__main__":
+    test_collapse_compare_animations()
+    test_merge_consecutive_moves()
+    test_lag_is_bounded()
+    test_merge_requires_plain_moves()
+    test_queue_cleared_before_pop()
+    print("所有测试完成！")
@@ -0,0 +1,74 @@
+"""
+测试小鸭子批量创建与分批绘制的程序（无需图形界面）
+
+主要功能:
+- test_compute_layout: 测试批量布局计算（NumPy与纯Python实现结果一致）
+- test_create_undrawn: 测试创建未绘制的小鸭子
+- test_materialize_in_chunks: 测试分批在空闲时绘制
+
+主要函数:
+- test_compute_layout: 布局计算测试函数
+- test_create_undrawn: 未绘制创建测试函数
+- test_materialize_in_chunks: 分批绘制测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.duck_model as duck_model
+from src.graphics import DetailLevel, DuckFactory
+from tests.fakes import FakeCanvas
+
+
+def test_compute_layout():
+    """测试批量布局计算（NumPy与纯Python实现结果一致）"""
+    values = [5, 1, 9, 3]
+    xs, sizes = duck_model.compute_layout(100, 70, values)
+    assert xs == [100, 170, 240, 310]
+    assert sizes[1] == 20 and sizes[2] == 50
+    assert abs(sizes[0] - 35) < 1e-9
+
+    saved = duck_model.np
+    duck_model.np = None
+    try:
+        assert duck_model.compute_layout(100, 70, values) == (xs, sizes)
+        assert duck_model.compute_layout(0, 10, [4, 4])[1] == [35.0, 35.0]
+    finally:
+        duck_model.np = saved
+    assert duck_model.compute_layout(0, 10, []) == ([], [])
+
+
+def test_create_undrawn():
+    """测试创建未绘制的小鸭子"""
+    canvas = FakeCanvas()
+    ducks = DuckFactory.create_baby_ducks(canvas, 100, 200, 10, list(range(300)),
+                                          detail=DetailLevel.BAR, draw=False)
+    assert len(ducks) == 300
+    assert canvas.created == 0
+    assert not any(duck.is_drawn() for duck in ducks)
+    assert [duck.value for duck in ducks] == list(range(300))
+
+
+def test_materialize_in_chunks():
+    """测试分批在空闲时绘制"""
+    canvas = FakeCanvas()
+    ducks = DuckFactory.create_baby_ducks(canvas, 100, 200, 10, list(range(250)),
+                                          detail=DetailLevel.BAR, draw=False)
+    done = []
+    DuckFactory.materialize(ducks, chunk_size=100, on_complete=lambda: done.append(True))
+
+    # 第一批立即绘制，其余在空闲时绘制
+    assert canvas.created == 100
+    assert not done
+    canvas.run_idle()
+    assert canvas.created == 250
+    assert all(duck.is_drawn() for duck in ducks)
+    assert done == [True]
+
+
+if __name__ == "__main__":
+    test_compute_layout()
+    test_create_undrawn()
+    test_materialize_in_chunks()
+    print("所有测试完成！")
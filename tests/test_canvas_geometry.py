@@ -0,0 +1,73 @@
+"""
+测试画布几何服务的程序（无需图形界面）
+
+主要功能:
+- test_size_cached_until_configure: 测试画布尺寸只在<Configure>事件时更新
+- test_clamp_and_fallback: 测试位置限制和默认尺寸
+- test_border_excluded: 测试尺寸不包括边框和焦点高亮框
+
+主要函数:
+- test_size_cached_until_configure: 尺寸缓存测试函数
+- test_clamp_and_fallback: 位置限制测试函数
+- test_border_excluded: 边框测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.canvas_geometry import CanvasGeometry, get_canvas_geometry
+from src.layout import LayoutEngine
+from tests.fakes import FakeCanvas
+
+
+def test_size_cached_until_configure():
+    """测试画布尺寸只在<Configure>事件时更新"""
+    canvas = FakeCanvas(800, 300)
+    geometry = get_canvas_geometry(canvas)
+    assert get_canvas_geometry(canvas) is geometry
+    assert geometry.get_size() == (800, 300)
+    queries = canvas.queries
+
+    for _ in range(100):
+        geometry.clamp(900, 0, 50)
+    assert canvas.queries == queries
+
+    assert geometry.get_bounds(50) == (50, 750, 50, 250)
+    canvas.configure_to(1200, 500)
+    assert geometry.get_bounds(50) == (50, 1150, 50, 450)
+    assert canvas.queries == queries
+
+
+def test_clamp_and_fallback():
+    """测试位置限制和默认尺寸"""
+    # 画布尚未显示时使用默认尺寸，显示后由<Configure>事件更新
+    canvas = FakeCanvas(1, 1)
+    geometry = CanvasGeometry(canvas)
+    assert geometry.get_size() == (CanvasGeometry.DEFAULT_WIDTH, CanvasGeometry.DEFAULT_HEIGHT)
+    canvas.configure_to(600, 200)
+    assert geometry.clamp(-10, 500, 20) == (20, 180)
+    assert geometry.clamp(300, 100, 20) == (300, 100)
+
+    assert get_canvas_geometry(None).get_size() == (1000, 400)
+
+
+def test_border_excluded():
+    """测试尺寸不包括边框和焦点高亮框"""
+    canvas = FakeCanvas(1004, 324)
+    canvas.configure(highlightthickness=2)
+    geometry = get_canvas_geometry(canvas)
+    assert geometry.get_size() == (1000, 320)
+    # 布局按可绘制区域计算，与无边框的同尺寸画布一致
+    assert LayoutEngine().compute(12, *geometry.get_size()).duck_y == 200
+
+    canvas.configure_to(1204, 524)
+    assert geometry.get_size() == (1200, 520)
+    assert geometry.get_bounds(50) == (50, 1150, 50, 470)
+
+
+if __name__ == "__main__":
+    test_size_cached_until_configure()
+    test_clamp_and_fallback()
+    test_border_excluded()
+    print("所有测试完成！")
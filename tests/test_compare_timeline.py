@@ -0,0 +1,117 @@
+"""
+测试融合比较动画的程序（无需图形界面）
+
+主要功能:
+- test_single_animation_per_compare: 测试一次比较只产生一个动画
+- test_timeline_phases: 测试时间线按阶段行走、高亮并在结束时恢复
+- test_point_uses_display_list: 测试指向动画的高亮写入显示列表，在帧末提交
+- test_mother_lane_follows_layout: 测试母鸭的比较站位在布局的行走线上，并按场景宽度限制
+
+主要函数:
+- test_single_animation_per_compare: 单动画测试函数
+- test_timeline_phases: 时间线阶段测试函数
+- test_point_uses_display_list: 指向动画测试函数
+- test_mother_lane_follows_layout: 母鸭行走线测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation.animation_engine import AnimationEngine, VirtualClock
+from animation.animators import ComparisonAnimator, MotherDuckAnimator
+from src.layout import LayoutEngine
+from tests.fakes import FakeCanvas, MockDuck
+
+
+def test_single_animation_per_compare():
+    """测试一次比较只产生一个动画"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    mother = MockDuck(500, 100, 60)
+    animations = ComparisonAnimator(engine).compare_ducks(mother, MockDuck(200, 250), MockDuck(300, 250))
+    assert len(animations) == 1
+    assert animations[0].collapsible
+
+
+def test_timeline_phases():
+    """测试时间线按阶段行走、高亮并在结束时恢复"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    mother = MockDuck(500, 100, 60)
+    animator = ComparisonAnimator(engine)
+    animator.lane_y = 100
+    duck1, duck2 = MockDuck(200, 250), MockDuck(300, 250)
+    engine.add_animation(animator.compare_timeline(mother, duck1, duck2, 1.0))
+
+    # 行走阶段结束后母鸭到达两只鸭子中间
+    engine.step_frame(0.0)
+    for _ in range(7):
+        engine.step_frame(0.05)
+    assert (mother.x, mother.y) == (250, 100)
+    assert not duck1.is_highlighted
+    # 高亮阶段
+    for _ in range(5):
+        engine.step_frame(0.05)
+    assert duck1.is_highlighted and duck2.is_highlighted and not mother.is_highlighted
+
+    engine.run_until_idle(0.05)
+    assert (mother.x, mother.y) == (250, 100)
+    assert not duck1.is_highlighted and not duck2.is_highlighted and not mother.is_highlighted
+    # 状态只在真正变化时提交
+    assert duck1.highlight_history == [True, False]
+    assert mother.highlight_history == [True, False]
+
+
+
+def test_point_uses_display_list():
+    """测试指向动画的高亮写入显示列表，在帧末提交"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    mother = MockDuck(500, 100, 60)
+    engine.add_animation(MotherDuckAnimator(mother, engine).point_to(250, 250, 1.0))
+
+    # 更新函数只写入显示列表，母鸭在帧末提交时才高亮
+    writes = []
+    set_state = engine.display_list.set_state
+
+    def record(target, **states):
+        writes.append((states.get('highlighted'), target.is_highlighted))
+        set_state(target, **states)
+
+    engine.display_list.set_state = record
+    for _ in range(7):
+        engine.step_frame(0.1)
+    assert writes and writes[0] == (True, False)
+    assert mother.is_highlighted
+
+    engine.run_until_idle(0.1)
+    assert not mother.is_highlighted
+    assert mother.highlight_history == [True, False]
+
+
+
+def test_mother_lane_follows_layout():
+    """测试母鸭的比较站位在布局的行走线上，并按场景宽度限制"""
+    canvas = FakeCanvas(800, 480)
+    engine = AnimationEngine(canvas=canvas, clock=VirtualClock())
+    animator = ComparisonAnimator(engine)
+    mother = MockDuck(400, 150, 60)
+    layout = LayoutEngine().compute(10, 800, 480)
+
+    # 未设置行走线时按画布的当前高度计算，与布局给出的位置一致
+    assert animator.get_position_between(mother, 200, 300) == (250, layout.mother_y)
+    canvas.configure_to(800, 640)
+    assert animator.get_position_between(mother, 200, 300) == (250, 640 * LayoutEngine.MOTHER_LANE_RATIO)
+    # 布局给出行走线后使用布局的位置
+    animator.lane_y = layout.mother_y
+    assert animator.get_position_between(mother, 200, 300)[1] == layout.mother_y
+
+    # 可滚动场景中远处的比较不会被拉回画布中央
+    engine.geometry.set_scene_size(3000)
+    assert animator.get_position_between(mother, 2400, 2470)[0] == 2435
+
+
+if __name__ == "__main__":
+    test_single_animation_per_compare()
+    test_timeline_phases()
+    test_point_uses_display_list()
+    test_mother_lane_follows_layout()
+    print("所有测试完成！")
@@ -0,0 +1,56 @@
+"""
+测试画布装饰层的程序（无需图形界面）
+
+主要功能:
+- test_render_once: 测试装饰层只在尺寸变化时重新绘制
+- test_decorations_survive_duck_reset: 测试删除和提升鸭子不影响装饰元素
+
+主要函数:
+- test_render_once: 只绘制一次测试函数
+- test_decorations_survive_duck_reset: 装饰保留测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.decorations import DecorationLayer
+from src.graphics import BabyDuck, Duck
+from tests.fakes import FakeCanvas
+
+
+def test_render_once():
+    """测试装饰层只在尺寸变化时重新绘制"""
+    canvas = FakeCanvas()
+    layer = DecorationLayer(canvas)
+    assert layer.render(1000, 320, 200)
+    count = layer.get_item_count()
+    assert count == len(canvas.items) == 15
+    assert [call[1] for call in canvas.calls if call[0] == 'tag_lower'] == [DecorationLayer.TAG]  # 整个装饰层只下沉一次
+    for data in canvas.items.values():
+        assert data['tags'] == (DecorationLayer.TAG,)
+        assert data['state'] == 'disabled'  # 不参与命中测试
+
+    created = canvas.created
+    assert not layer.render(1000, 320, 200)
+    assert canvas.created == created
+
+    assert layer.render(1200, 320, 200)
+    assert len(canvas.items) == count
+
+
+def test_decorations_survive_duck_reset():
+    """测试删除和提升鸭子不影响装饰元素"""
+    canvas = FakeCanvas()
+    layer = DecorationLayer(canvas)
+    layer.render(1000, 320, 200)
+    duck = BabyDuck(canvas, 100, 200, 30, 5)
+    duck.raise_to_top()
+    canvas.delete(Duck.DUCK_TAG)
+    assert len(canvas.items) == layer.get_item_count()
+
+
+if __name__ == "__main__":
+    test_render_once()
+    test_decorations_survive_duck_reset()
+    print("所有测试完成！")
@@ -0,0 +1,79 @@
+"""
+测试小鸭子细节级别的程序（无需图形界面）
+
+主要功能:
+- test_select_detail_level: 测试按元素数量和缩放比例选择细节级别
+- test_simplified_levels_item_count: 测试简化级别的画布元素数量
+- test_state_api_shared: 测试所有级别共用同一套状态接口
+- test_factory_large_n: 测试工厂为5000个元素自动选择点级别
+
+主要函数:
+- test_select_detail_level: 细节级别选择测试函数
+- test_simplified_levels_item_count: 元素数量测试函数
+- test_state_api_shared: 状态接口测试函数
+- test_factory_large_n: 大规模工厂测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.graphics import BabyDuck, DetailLevel, DuckFactory, select_detail_level
+from tests.fakes import FakeCanvas
+
+
+def test_select_detail_level():
+    """测试按元素数量和缩放比例选择细节级别"""
+    assert select_detail_level(12) == DetailLevel.FULL
+    assert select_detail_level(50) == DetailLevel.SILHOUETTE
+    assert select_detail_level(500) == DetailLevel.BAR
+    assert select_detail_level(5000) == DetailLevel.POINT
+    # 放大后每个元素可用的空间变大
+    assert select_detail_level(50, zoom=2.5) == DetailLevel.FULL
+    assert select_detail_level(5000, zoom=5.0) == DetailLevel.BAR
+
+
+def test_simplified_levels_item_count():
+    """测试简化级别的画布元素数量"""
+    expected = {DetailLevel.SILHOUETTE: 2, DetailLevel.BAR: 1, DetailLevel.POINT: 1}
+    for level, count in expected.items():
+        canvas = FakeCanvas()
+        duck = BabyDuck(canvas, 100, 200, 30, 5, detail=level)
+        assert len(duck.graphic_elements) == count
+        assert len(canvas.items) == count
+
+
+def test_state_api_shared():
+    """测试所有级别共用同一套状态接口"""
+    canvas = FakeCanvas()
+    duck = BabyDuck(canvas, 100, 200, 30, 5, detail=DetailLevel.BAR)
+    canvas.configs.clear()
+    duck.set_sorted(True)
+    assert (duck.tag + "_fill", {'fill': BabyDuck.SORTED_COLOR}) in canvas.configs
+
+    # 切换级别后重新绘制，状态保留
+    duck.set_detail_level(DetailLevel.SILHOUETTE)
+    assert len(canvas.items) == 2
+    assert duck.is_sorted
+    duck.set_detail_level(DetailLevel.SILHOUETTE)
+    assert len(canvas.items) == 2
+
+
+def test_factory_large_n():
+    """测试工厂为5000个元素自动选择点级别"""
+    canvas = FakeCanvas()
+    values = list(range(1, 5001))
+    ducks = DuckFactory.create_baby_ducks(canvas, 20, 300, 0.2, values)
+    assert all(duck.detail == DetailLevel.POINT for duck in ducks)
+    assert len(canvas.items) == 5000
+
+    small = DuckFactory.create_baby_ducks(FakeCanvas(), 100, 200, 70, list(range(12)))
+    assert all(duck.detail == DetailLevel.FULL for duck in small)
+
+
+if __name__ == "__main__":
+    test_select_detail_level()
+    test_simplified_levels_item_count()
+    test_state_api_shared()
+    test_factory_large_n()
+    print("所有测试完成！")
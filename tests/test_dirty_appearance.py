@@ -0,0 +1,86 @@
+"""
+测试小鸭子只提交实际变化的外观更新的程序（无需图形界面）
+
+主要功能:
+- test_unchanged_state_sends_nothing: 测试外观没有变化时不调用画布
+- test_only_changed_parts_sent: 测试只发送发生变化的部分
+- test_reset_is_single_update: 测试重置排序时每只鸭子最多更新一次外观
+- test_display_list_merges_states: 测试显示列表把一帧内的多个状态合并为一次更新
+
+主要函数:
+- test_unchanged_state_sends_nothing: 无变化测试函数
+- test_only_changed_parts_sent: 部分变化测试函数
+- test_reset_is_single_update: 重置测试函数
+- test_display_list_merges_states: 显示列表合并测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.bubble_sort import BubbleSort
+from animation.display_list import DisplayList
+from src.graphics import BabyDuck
+from tests.fakes import FakeCanvas
+
+
+def test_unchanged_state_sends_nothing():
+    """测试外观没有变化时不调用画布"""
+    canvas = FakeCanvas()
+    duck = BabyDuck(canvas, 100, 200, 30, 5)
+    duck.set_sorted(False)
+    duck.set_comparing(False)
+    duck.highlight(False)
+    assert canvas.configs == []
+
+    # 已排序时高亮不改变颜色和边框
+    duck.set_sorted(True)
+    canvas.configs.clear()
+    duck.highlight(True)
+    assert canvas.configs == []
+
+
+def test_only_changed_parts_sent():
+    """测试只发送发生变化的部分"""
+    canvas = FakeCanvas()
+    duck = BabyDuck(canvas, 100, 200, 30, 5)
+    # 高亮只改变颜色，边框宽度不变
+    duck.highlight(True)
+    assert canvas.configs == [(duck.tag + "_fill", {'fill': BabyDuck.HIGHLIGHT_COLOR})]
+
+
+def test_reset_is_single_update():
+    """测试重置排序时每只鸭子最多更新一次外观"""
+    canvas = FakeCanvas()
+    ducks = [BabyDuck(canvas, 100 + i * 70, 200, 30, value) for i, value in enumerate([3, 1, 2])]
+    sorter = BubbleSort(ducks)
+    ducks[0].set_state(highlighted=True, comparing=True, sorted=True)
+    canvas.configs.clear()
+
+    sorter.reset()
+    assert canvas.configs == [
+        (ducks[0].tag + "_fill", {'fill': BabyDuck.BODY_COLOR}),
+        (ducks[0].tag + "_body", {'width': 2}),
+    ]
+
+
+def test_display_list_merges_states():
+    """测试显示列表把一帧内的多个状态合并为一次更新"""
+    canvas = FakeCanvas()
+    duck = BabyDuck(canvas, 100, 200, 30, 5)
+    display_list = DisplayList()
+    display_list.set_state(duck, highlighted=True)
+    display_list.set_state(duck, comparing=True)
+    display_list.set_state(duck, comparing=False)
+
+    assert display_list.flush() == 1
+    assert duck.is_highlighted and not duck.is_comparing
+    assert canvas.configs == [(duck.tag + "_fill", {'fill': BabyDuck.HIGHLIGHT_COLOR})]
+
+
+if __name__ == "__main__":
+    test_unchanged_state_sends_nothing()
+    test_only_changed_parts_sent()
+    test_reset_is_single_update()
+    test_display_list_merges_states()
+    print("所有测试完成！")
@@ -0,0 +1,110 @@
+"""
+测试显示列表逐帧批量提交的程序（无需图形界面）
+
+主要功能:
+- test_last_write_wins: 测试同一帧内多次写入只提交最后一次
+- test_unchanged_state_is_skipped: 测试未变化的位置和状态不会提交
+- test_engine_flushes_once_per_frame: 测试引擎每帧只提交一次
+- test_state_animations_use_display_list: 测试高亮和比较动画的状态变化通过显示列表在帧末提交
+
+主要函数:
+- test_last_write_wins: 最后写入生效测试函数
+- test_unchanged_state_is_skipped: 跳过未变化状态测试函数
+- test_engine_flushes_once_per_frame: 引擎逐帧提交测试函数
+- test_state_animations_use_display_list: 状态动画提交测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation.animation_engine import Animation, AnimationEngine, AnimationType, VirtualClock
+from animation.display_list import DisplayList
+from tests.fakes import MockDuck
+
+
+def test_last_write_wins():
+    """测试同一帧内多次写入只提交最后一次"""
+    display_list = DisplayList()
+    duck = MockDuck(0, 0)
+
+    for x in range(10):
+        display_list.move(duck, x, 5)
+    assert display_list.get_position(duck) == (9, 5)
+    assert duck.commits == 0
+
+    assert display_list.flush() == 1
+    assert (duck.x, duck.y) == (9, 5)
+    assert duck.commits == 1
+    assert display_list.is_empty()
+
+
+def test_unchanged_state_is_skipped():
+    """测试未变化的位置和状态不会提交"""
+    display_list = DisplayList()
+    duck = MockDuck(10, 20)
+
+    display_list.move(duck, 10, 20)
+    display_list.set_state(duck, highlighted=False, comparing=True)
+    display_list.set_state(duck, comparing=False)
+
+    assert display_list.flush() == 0
+    assert duck.commits == 0
+
+
+def test_engine_flushes_once_per_frame():
+    """测试引擎每帧只提交一次"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    duck = MockDuck(0, 0)
+
+    # 一个动画在每帧内多次写入同一只鸭子
+    animation = Animation(AnimationType.CUSTOM, 1.0)
+
+    def update_progress(progress: float):
+        for step in range(5):
+            engine.display_list.move(duck, progress * 100 + step, 0)
+
+    animation.on_update = update_progress
+    engine.add_animation(animation)
+
+    frames = engine.run_until_idle(0.1)
+    # 第一帧进度为0，最后一次写入的位置(4, 0)与当前位置不同，因此每帧都会提交一次
+    assert duck.commits == frames
+    assert duck.x == 104
+
+
+def test_state_animations_use_display_list():
+    """测试高亮和比较动画的状态变化通过显示列表在帧末提交"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    engine.set_backlog_policy(None)
+    mother, duck1, duck2 = MockDuck(500, 100, 60), MockDuck(200, 250), MockDuck(300, 250)
+    engine.add_animation(engine.create_highlight_animation(duck1, 0.5))
+    engine.add_animation(engine.create_compare_animation(mother, duck1, duck2, 0.5))
+    # 创建和加入队列时不提交任何状态
+    assert duck1.commits == duck2.commits == mother.commits == 0
+
+    # 状态只在显示列表提交时写入
+    writes = []
+    flush = engine.display_list.flush
+
+    def record():
+        writes.append(duck1.commits)
+        return flush()
+
+    engine.display_list.flush = record
+    engine.step_frame(0.0)
+    assert writes[0] == 0 and duck1.is_highlighted and duck1.commits == 1
+    engine.run_until_idle(0.1)
+    assert duck1.highlight_history == [True, False]
+    assert not duck1.is_comparing and not duck2.is_comparing and not mother.is_highlighted
+    # 每次状态变化各提交一次：高亮开始、高亮结束、比较开始、比较结束
+    assert duck1.commits == 4 and duck2.commits == 2
+    assert mother.highlight_history == [True, False]
+
+
+if __name__ == "__main__":
+    test_last_write_wins()
+    test_unchanged_state_is_skipped()
+    test_engine_flushes_once_per_frame()
+    test_state_animations_use_display_list()
+    print("所有测试完成！")
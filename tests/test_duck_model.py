@@ -0,0 +1,68 @@
+"""
+测试鸭子模型与画布视图分离的程序（无需图形界面）
+
+主要功能:
+- test_model_has_no_dict: 测试模型和视图都没有实例字典
+- test_sort_pure_models: 测试冒泡排序直接在纯模型上运行
+- test_view_forwards_to_model: 测试视图的属性转发到绑定的模型
+
+主要函数:
+- test_model_has_no_dict: 无实例字典测试函数
+- test_sort_pure_models: 纯模型排序测试函数
+- test_view_forwards_to_model: 属性转发测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.bubble_sort import BubbleSort
+from src.duck_model import DuckModel, create_models
+from src.graphics import BabyDuck
+from tests.fakes import FakeCanvas
+
+
+def test_model_has_no_dict():
+    """测试模型和视图都没有实例字典"""
+    model = DuckModel(100, 200, 30, 5)
+    assert not hasattr(model, '__dict__')
+    duck = BabyDuck(FakeCanvas(), 100, 200, 30, 5)
+    assert not hasattr(duck, '__dict__')
+
+
+def test_sort_pure_models():
+    """测试冒泡排序直接在纯模型上运行"""
+    values = [5, 3, 8, 1, 9, 2]
+    models = create_models(100, 200, 70, values)
+    xs = [model.x for model in models]
+    sorter = BubbleSort(models)
+    while sorter.step():
+        pass
+
+    assert sorter.is_completed()
+    assert sorter.get_duck_values() == sorted(values)
+    assert [model.value for model in models] == sorted(values)
+    # 交换后每个位置上的模型位于该位置原来的坐标
+    assert [model.x for model in models] == xs
+
+
+def test_view_forwards_to_model():
+    """测试视图的属性转发到绑定的模型"""
+    canvas = FakeCanvas()
+    model = DuckModel(100, 200, 30, 5)
+    duck = BabyDuck(canvas, 0, 0, 0, 0, model=model)
+    assert (duck.x, duck.y, duck.size, duck.value) == (100, 200, 30, 5)
+
+    duck.move_to(150, 200)
+    assert model.x == 150
+    assert canvas.moves == [(duck.tag, 50, 0)]
+
+    duck.set_sorted(True)
+    assert model.is_sorted
+
+
+if __name__ == "__main__":
+    test_model_has_no_dict()
+    test_sort_pure_models()
+    test_view_forwards_to_model()
+    print("所有测试完成！")
@@ -0,0 +1,123 @@
+"""
+测试生成新数据时复用小鸭子画布元素和排序、动画对象的程序（无需图形界面）
+
+主要功能:
+- test_rebind_reuses_items: 测试小鸭子原地更新画布元素而不新建
+- test_rebind_vector_in_place: 测试完整矢量小鸭子的重新绑定和重新排列原地更新画布元素
+- test_rebind_size_mismatch: 测试数量不一致时不复用
+- test_integration_rebind: 测试排序动画集成复用原有的排序算法和动画引擎
+
+主要函数:
+- test_rebind_reuses_items: 元素复用测试函数
+- test_rebind_vector_in_place: 矢量元素复用测试函数
+- test_rebind_size_mismatch: 数量不一致测试函数
+- test_integration_rebind: 排序动画集成复用测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.bubble_sort import BubbleSort
+from animation.animation_engine import AnimationEngine, VirtualClock
+from animation.sort_animation_integration import SortAnimationIntegration
+from src.graphics import BabyDuck, DetailLevel, DuckFactory, MotherDuck
+from src.sprites import SpriteCache
+from tests.fakes import FakeCanvas, FakeImage
+
+
+def _make_canvas() -> FakeCanvas:
+    """创建带精灵图缓存的模拟画布"""
+    canvas = FakeCanvas()
+    canvas._duck_sprites = SpriteCache(image_factory=FakeImage)
+    return canvas
+
+
+def test_rebind_reuses_items():
+    """测试小鸭子原地更新画布元素而不新建"""
+    canvas = _make_canvas()
+    ducks = DuckFactory.create_baby_ducks(canvas, 100, 200, 70, [3, 1, 2], use_sprite=True)
+    ducks[1].set_state(comparing=True, sorted=True)
+    created = canvas.created
+
+    assert DuckFactory.rebind_baby_ducks(ducks, 100, 200, 70, [10, 30, 20])
+    assert canvas.created == created and canvas.deleted == 0
+    assert [duck.value for duck in ducks] == [10, 30, 20]
+    assert not ducks[1].is_sorted and not ducks[1].is_comparing
+    assert ducks[1].size == 50 and ducks[0].size == 20
+    sprite, label = ducks[1].graphic_elements
+    assert canvas.items[label]['text'] == "30"
+    assert canvas.items[sprite]['image'] is canvas._duck_sprites.get(50, BabyDuck.BODY_COLOR, 2)
+
+    # 柱形同样原地更新
+    bars = DuckFactory.create_baby_ducks(canvas, 100, 200, 10, [3, 1, 2], detail=DetailLevel.BAR)
+    created = canvas.created
+    DuckFactory.rebind_baby_ducks(bars, 100, 200, 10, [1, 2, 3])
+    assert canvas.created == created
+    assert canvas.items[bars[2].graphic_elements[0]]['coords'] == bars[2]._bar_coords()
+
+
+def test_rebind_vector_in_place():
+    """测试完整矢量小鸭子的重新绑定和重新排列原地更新画布元素"""
+    canvas = _make_canvas()
+    ducks = DuckFactory.create_baby_ducks(canvas, 100, 200, 70, [3, 1, 2])
+    ducks[0].set_state(comparing=True)
+    elements = [list(duck.graphic_elements) for duck in ducks]
+    created = canvas.created
+
+    assert DuckFactory.rebind_baby_ducks(ducks, 150, 220, 70, [10, 30, 20])
+    assert canvas.created == created and canvas.deleted == 0
+    assert [duck.graphic_elements for duck in ducks] == elements
+    # 每个部分都按新的位置和大小设置坐标，数值文字和颜色原地更新
+    for duck in ducks:
+        assert [canvas.items[element]['coords'] for element in duck.graphic_elements] == duck._vector_coords()
+    label = ducks[1].graphic_elements[-1]
+    assert canvas.items[label]['text'] == "30"
+    body = ducks[0].graphic_elements[1]
+    assert canvas.items[body]['fill'] == BabyDuck.BODY_COLOR
+
+    # 画布尺寸变化后重新排列（大小改变）同样不新建元素
+    ducks[2].place(400, 250, 30)
+    assert canvas.created == created and canvas.deleted == 0
+    assert [canvas.items[element]['coords'] for element in ducks[2].graphic_elements] == ducks[2]._vector_coords()
+
+
+def test_rebind_size_mismatch():
+    """测试数量不一致时不复用"""
+    canvas = _make_canvas()
+    ducks = DuckFactory.create_baby_ducks(canvas, 100, 200, 70, [3, 1, 2], use_sprite=True)
+    assert not DuckFactory.rebind_baby_ducks(ducks, 100, 200, 70, [1, 2])
+    assert [duck.value for duck in ducks] == [3, 1, 2]
+
+
+def test_integration_rebind():
+    """测试排序动画集成复用原有的排序算法和动画引擎"""
+    canvas = _make_canvas()
+    ducks = DuckFactory.create_baby_ducks(canvas, 100, 200, 70, [3, 1, 2], use_sprite=True)
+    mother = MotherDuck(canvas, 500, 100)
+    engine = AnimationEngine(canvas=canvas, clock=VirtualClock())
+    sorter = BubbleSort(ducks)
+    integration = SortAnimationIntegration(sorter, ducks, mother, engine)
+    # 直接执行排序的几步（不启动引擎线程），动画留在队列中
+    for _ in range(3):
+        sorter.step()
+    assert sorter.get_comparisons_count() > 0 and engine.get_queue_length() > 0
+
+    DuckFactory.rebind_baby_ducks(ducks, 100, 200, 70, [9, 8, 7])
+    integration.rebind(ducks)
+    assert integration.bubble_sort is sorter and integration.engine is engine
+    assert engine.animation_thread is None
+    assert engine.get_queue_length() == 0
+    assert sorter.get_comparisons_count() == 0 and not sorter.is_completed()
+    assert sorter.get_duck_values() == [9, 8, 7]
+    assert len(integration.duck_animators) == 3
+    # 回调保持不变
+    assert sorter.on_compare == integration._on_compare
+
+
+if __name__ == "__main__":
+    test_rebind_reuses_items()
+    test_rebind_vector_in_place()
+    test_rebind_size_mismatch()
+    test_integration_rebind()
+    print("所有测试完成！")
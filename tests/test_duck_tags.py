@@ -0,0 +1,89 @@
+"""
+测试鸭子按画布标签分组绘制的程序（无需图形界面）
+
+主要功能:
+- test_each_duck_has_unique_tag: 测试每只鸭子的图形元素都带有自己的唯一标签
+- test_move_is_single_call: 测试移动鸭子只需一次画布调用
+- test_appearance_uses_part_tags: 测试外观更新通过部位标签设置身体和头部
+- test_clear_deletes_by_tag: 测试清除鸭子时按标签一次删除
+
+主要函数:
+- test_each_duck_has_unique_tag: 唯一标签测试函数
+- test_move_is_single_call: 单次移动测试函数
+- test_appearance_uses_part_tags: 部位标签测试函数
+- test_clear_deletes_by_tag: 按标签删除测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.graphics import BabyDuck, MotherDuck
+from tests.fakes import FakeCanvas
+
+
+def test_each_duck_has_unique_tag():
+    """测试每只鸭子的图形元素都带有自己的唯一标签"""
+    canvas = FakeCanvas()
+    ducks = [BabyDuck(canvas, 100 + index * 80, 200, 40, index) for index in range(3)]
+    mother = MotherDuck(canvas, 100, 100)
+
+    tags = set()
+    for duck in ducks + [mother]:
+        assert duck.tag not in tags
+        tags.add(duck.tag)
+        for item in duck.graphic_elements:
+            assert duck.tag in canvas.items[item]['tags']
+            assert BabyDuck.DUCK_TAG in canvas.items[item]['tags']
+
+
+def test_move_is_single_call():
+    """测试移动鸭子只需一次画布调用"""
+    canvas = FakeCanvas()
+    duck = BabyDuck(canvas, 200, 200, 40, 5)
+    canvas.calls.clear()
+
+    duck.move_to(230, 190)
+    assert canvas.calls == [('move', duck.tag, 30, -10)]
+
+    # 位置不变时不调用画布
+    canvas.calls.clear()
+    duck.move_to(230, 190)
+    assert canvas.calls == []
+
+
+def test_appearance_uses_part_tags():
+    """测试外观更新通过部位标签设置身体和头部"""
+    canvas = FakeCanvas()
+    duck = BabyDuck(canvas, 200, 200, 40, 5)
+    fill_items = [item for item, data in canvas.items.items() if duck.tag + "_fill" in data['tags']]
+    body_items = [item for item, data in canvas.items.items() if duck.tag + "_body" in data['tags']]
+    # 身体和头部随状态变色，边框宽度只作用于身体
+    assert len(fill_items) == 2
+    assert len(body_items) == 1 and body_items[0] in fill_items
+
+    canvas.calls.clear()
+    duck.set_comparing(True)
+    assert canvas.calls == [
+        ('itemconfig', duck.tag + "_fill", {'fill': duck._get_body_color()}),
+        ('itemconfig', duck.tag + "_body", {'width': 3}),
+    ]
+
+
+def test_clear_deletes_by_tag():
+    """测试清除鸭子时按标签一次删除"""
+    canvas = FakeCanvas()
+    duck = BabyDuck(canvas, 200, 200, 40, 5)
+    canvas.calls.clear()
+
+    duck.clear()
+    assert canvas.calls == [('delete', duck.tag)]
+    assert duck.graphic_elements == []
+
+
+if __name__ == "__main__":
+    test_each_duck_has_unique_tag()
+    test_move_is_single_call()
+    test_appearance_uses_part_tags()
+    test_clear_deletes_by_tag()
+    print("所有测试完成！")
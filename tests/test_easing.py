@@ -0,0 +1,74 @@
+"""
+测试缓动与路径查找表的程序（无需图形界面）
+
+主要功能:
+- test_tables_match_curves: 测试查找表与原始曲线的误差足够小
+- test_tables_are_shared: 测试同一曲线的查找表在动画器之间共享
+- test_move_animation_easing: 测试移动动画使用指定的缓动曲线
+
+主要函数:
+- test_tables_match_curves: 查找表精度测试函数
+- test_tables_are_shared: 查找表共享测试函数
+- test_move_animation_easing: 移动动画缓动测试函数
+"""
+
+import sys
+import os
+import math
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation.animation_engine import AnimationEngine, VirtualClock
+from animation.easing import get_easing, get_easing_names, oscillation, hops
+from tests.fakes import MockDuck
+
+
+def test_tables_match_curves():
+    """测试查找表与原始曲线的误差足够小"""
+    wave = oscillation(1)
+    shake = oscillation(2)
+    jumps = hops(2)
+    for i in range(1001):
+        t = i / 1000
+        assert abs(wave(t) - math.sin(2 * math.pi * t)) < 1e-3
+        assert abs(shake(t) - math.sin(4 * math.pi * t)) < 1e-3
+        assert abs(jumps(t) - abs(math.sin(2 * math.pi * t))) < 1e-3
+
+    for name in get_easing_names():
+        curve = get_easing(name)
+        assert abs(curve(0.0)) < 1e-9
+        if name != 'arc':
+            assert abs(curve(1.0) - 1.0) < 1e-9
+    # 超出范围的进度会被截断
+    assert get_easing('linear')(1.5) == 1.0
+
+
+def test_tables_are_shared():
+    """测试同一曲线的查找表在动画器之间共享"""
+    assert oscillation(3) is oscillation(3)
+    assert get_easing('ease_out') is get_easing('ease_out')
+    assert get_easing(None) is get_easing('linear')
+    custom = lambda t: t
+    assert get_easing(custom) is custom
+
+
+def test_move_animation_easing():
+    """测试移动动画使用指定的缓动曲线"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    duck = MockDuck(0, 0)
+
+    animation = engine.create_move_animation(duck, (0, 0), (100, 0), 1.0, easing='ease_in')
+    engine.add_animation(animation)
+    engine.step_frame(0.0)
+    engine.step_frame(0.5)
+    # ease_in在进度一半时只走完四分之一的路程
+    assert abs(duck.x - 25) < 0.1
+
+    engine.run_until_idle(0.1)
+    assert duck.x == 100
+
+
+if __name__ == "__main__":
+    test_tables_match_curves()
+    test_tables_are_shared()
+    test_move_animation_easing()
+    print("所有测试完成！")
@@ -0,0 +1,73 @@
+"""
+测试数值文字共享字体缓存和原地更新的程序（无需图形界面）
+
+主要功能:
+- test_font_shared_by_size: 测试同字号的文字共用同一个字体对象
+- test_label_updates_in_place: 测试数值文字只发送变化的部分
+
+主要函数:
+- test_font_shared_by_size: 字体共享测试函数
+- test_label_updates_in_place: 文字原地更新测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.fonts import FontCache, label_font_size
+from src.graphics import BabyDuck
+from src.sprites import SpriteCache
+from tests.fakes import FakeCanvas, FakeImage
+
+
+def _make_canvas():
+    """创建带字体缓存和精灵图缓存的模拟画布，返回画布和创建字体的记录"""
+    canvas = FakeCanvas()
+    created = []
+    canvas._duck_fonts = FontCache(font_factory=lambda size: created.append(size) or ("font", size))
+    canvas._duck_sprites = SpriteCache(image_factory=FakeImage)
+    return canvas, created
+
+
+def test_font_shared_by_size():
+    """测试同字号的文字共用同一个字体对象"""
+    assert label_font_size(35) == 10
+    assert label_font_size(2) == 1  # 字号至少为1
+
+    canvas, created = _make_canvas()
+    ducks = [BabyDuck(canvas, 100 + i * 70, 200, size, i) for i, size in enumerate([35, 36, 49, 35])]
+    ducks += [BabyDuck(canvas, 100, 200, 35, 9, use_sprite=True)]
+    for _ in range(3):
+        ducks[0].draw()
+    # 35和36属于同一字号，49单独一个字号，重绘不再创建字体
+    assert created == [10, 14]
+    fonts = [canvas.items[canvas.find_withtag(duck.tag + "_label")[0]]['font'] for duck in ducks]
+    assert fonts[0] is fonts[1] is fonts[3] is fonts[4]
+
+
+def test_label_updates_in_place():
+    """测试数值文字只发送变化的部分"""
+    canvas, created = _make_canvas()
+    duck = BabyDuck(canvas, 100, 200, 35, 5, use_sprite=True)
+    canvas.configs.clear()
+
+    # 数值变化而字号不变：只更新文字
+    duck.rebind(170, 200, 36, 6)
+    labels = [kwargs for tag, kwargs in canvas.configs if tag == duck.tag + "_label"]
+    assert labels == [{'text': "6"}]
+
+    # 数值和字号都不变：不更新文字
+    canvas.configs.clear()
+    duck.place(240, 200, 35.5)
+    assert not [tag for tag, kwargs in canvas.configs if tag == duck.tag + "_label"]
+
+    # 字号变化：只更新字体
+    duck.place(240, 200, 49)
+    labels = [kwargs for tag, kwargs in canvas.configs if tag == duck.tag + "_label"]
+    assert labels == [{'font': ("font", 14)}]
+
+
+if __name__ == "__main__":
+    test_font_shared_by_size()
+    test_label_updates_in_place()
+    print("所有测试完成！")
@@ -0,0 +1,79 @@
+"""
+测试群体运动动画的程序（无需图形界面）
+
+主要功能:
+- test_jump_moves_all_ducks_and_returns: 测试跳跃动画驱动所有鸭子并回到原位
+- test_reveal_sorted_left_to_right: 测试已排序状态从左到右依次显示
+- test_complete_animation_is_batched: 测试引擎的完成动画使用群体运动按帧批量提交
+
+主要函数:
+- test_jump_moves_all_ducks_and_returns: 群体跳跃测试函数
+- test_reveal_sorted_left_to_right: 依次显示已排序测试函数
+- test_complete_animation_is_batched: 完成动画测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation.animation_engine import AnimationEngine, VirtualClock
+from animation.group_motion import GroupMotionAnimator
+from tests.fakes import MockDuck
+
+
+def test_jump_moves_all_ducks_and_returns():
+    """测试跳跃动画驱动所有鸭子并回到原位"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    ducks = [MockDuck(10 + i, 300) for i in range(500)]
+    engine.add_animation(GroupMotionAnimator(engine).jump(ducks, height=30, stagger=0.5, duration=1.0))
+
+    engine.step_frame(0.0)
+    engine.step_frame(0.25)
+    # 进度0.25时：第一只鸭子正好跳到最高点，最后一只还没有起跳
+    assert abs(ducks[0].y - 270) < 1e-6
+    assert ducks[-1].y == 300
+    assert min(duck.y for duck in ducks) >= 270
+
+    engine.run_until_idle(1 / 30)
+    assert all(duck.y == 300 and duck.moves > 0 for duck in ducks)
+
+
+def test_reveal_sorted_left_to_right():
+    """测试已排序状态从左到右依次显示"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    ducks = [MockDuck(100 * i, 300) for i in range(10)]
+    engine.add_animation(GroupMotionAnimator(engine).reveal_sorted(ducks, duration=1.0))
+
+    engine.step_frame(0.0)
+    engine.step_frame(0.45)
+    sorted_flags = [duck.is_sorted for duck in ducks]
+    assert sorted_flags == sorted(sorted_flags, reverse=True)
+    assert 0 < sum(sorted_flags) < len(ducks)
+    # 没有跳跃高度时不移动鸭子
+    assert all(duck.moves == 0 for duck in ducks)
+
+    engine.run_until_idle(0.1)
+    assert all(duck.is_sorted for duck in ducks)
+
+
+
+def test_complete_animation_is_batched():
+    """测试引擎的完成动画使用群体运动按帧批量提交"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    ducks = [MockDuck(10 + i, 300) for i in range(500)]
+    animation = engine.create_complete_animation(ducks, 1.0)
+    # 创建时不直接修改鸭子，状态在帧末通过显示列表提交
+    assert not any(duck.is_sorted for duck in ducks)
+    assert animation.params.reveal
+
+    engine.add_animation(animation)
+    engine.run_until_idle(0.1)
+    assert all(duck.is_sorted for duck in ducks)
+    assert all(duck.commits == 1 for duck in ducks)
+
+
+if __name__ == "__main__":
+    test_jump_moves_all_ducks_and_returns()
+    test_reveal_sorted_left_to_right()
+    test_complete_animation_is_batched()
+    print("所有测试完成！")
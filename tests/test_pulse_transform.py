@@ -0,0 +1,74 @@
+"""
+测试脉冲高亮使用缩放变换的程序（无需图形界面）
+
+主要功能:
+- test_pulse_creates_no_items: 测试脉冲过程中不创建也不删除画布元素
+- test_pulse_restores_after_move: 测试脉冲期间移动后仍能精确恢复
+
+主要函数:
+- test_pulse_creates_no_items: 无重绘测试函数
+- test_pulse_restores_after_move: 移动后恢复测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation.animation_engine import AnimationEngine, VirtualClock
+from animation.animators import HighlightAnimator
+from src.graphics import BabyDuck
+from tests.fakes import FakeCanvas
+
+
+def _run_pulse(duck, engine, moves=()):
+    """播放脉冲动画，并在指定帧移动鸭子"""
+    animation = HighlightAnimator(engine).pulse(duck, 0.5, 1.5)
+    engine.add_animation(animation)
+    frame = 0
+    while engine.step_frame(1 / 60):
+        frame += 1
+        for at_frame, x, y in moves:
+            if frame == at_frame:
+                engine.display_list.move(duck, x, y)
+
+
+def test_pulse_creates_no_items():
+    """测试脉冲过程中不创建也不删除画布元素"""
+    canvas = FakeCanvas()
+    duck = BabyDuck(canvas, 200, 200, 40, 5)
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    before = {item: list(data['coords']) for item, data in canvas.items.items()}
+    created = canvas.created
+
+    engine.add_animation(HighlightAnimator(engine).pulse(duck, 0.5, 1.5))
+    for _ in range(8):
+        engine.step_frame(1 / 60)
+    # 脉冲进行中鸭子被放大
+    body = duck.graphic_elements[1]
+    assert canvas.items[body]['coords'][2] - canvas.items[body]['coords'][0] > before[body][2] - before[body][0]
+    engine.run_until_idle(1 / 60)
+
+    assert canvas.created == created
+    assert canvas.deleted == 0
+    assert {item: data['coords'] for item, data in canvas.items.items()} == before
+
+
+def test_pulse_restores_after_move():
+    """测试脉冲期间移动后仍能精确恢复"""
+    canvas = FakeCanvas()
+    duck = BabyDuck(canvas, 200, 200, 40, 5)
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    before = {item: list(data['coords']) for item, data in canvas.items.items()}
+
+    _run_pulse(duck, engine, moves=[(10, 260, 180)])
+
+    assert (duck.x, duck.y) == (260, 180)
+    for item, coords in before.items():
+        expected = [value + (-20 if index % 2 else 60) for index, value in enumerate(coords)]
+        assert all(abs(a - b) < 1e-9 for a, b in zip(canvas.items[item]['coords'], expected))
+
+
+if __name__ == "__main__":
+    test_pulse_creates_no_items()
+    test_pulse_restores_after_move()
+    print("所有测试完成！")
@@ -0,0 +1,105 @@
+"""
+测试按鸭子数量和画布尺寸计算场景布局的程序（无需图形界面）
+
+主要功能:
+- test_default_layout: 测试默认画布尺寸下12只鸭子的布局
+- test_layout_scales_with_count: 测试鸭子数量增加时间距、大小和细节级别随之变化
+- test_apply_moves_existing_items: 测试重新布局只移动或原地更新已有元素
+- test_min_spacing_scrolls: 测试间距小于最小间距时场景比画布宽
+
+主要函数:
+- test_default_layout: 默认布局测试函数
+- test_layout_scales_with_count: 布局缩放测试函数
+- test_apply_moves_existing_items: 重新布局测试函数
+- test_min_spacing_scrolls: 可滚动布局测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.graphics import DetailLevel, DuckFactory
+from src.layout import LayoutEngine
+from src.sprites import SpriteCache
+from tests.fakes import FakeCanvas, FakeImage
+
+
+def test_default_layout():
+    """测试默认画布尺寸下12只鸭子的布局"""
+    layout = LayoutEngine().compute(12, 1000, 320)
+    assert layout.spacing == 70
+    assert layout.detail == DetailLevel.FULL
+    # 一排鸭子水平居中
+    assert abs(layout.slot_x(0) + layout.slot_x(11) - 1000) < 1e-9
+    assert layout.mother_position == (500, 100)
+    assert layout.duck_y == 200
+    assert layout.max_size <= 50 and layout.min_size < layout.max_size
+    assert layout == LayoutEngine().compute(12, 1000, 320)
+    assert layout != LayoutEngine().compute(12, 1200, 320)
+
+
+def test_layout_scales_with_count():
+    """测试鸭子数量增加时间距、大小和细节级别随之变化"""
+    engine = LayoutEngine()
+    small = engine.compute(12, 1000, 320)
+    medium = engine.compute(40, 1000, 320)
+    large = engine.compute(500, 1000, 320)
+    assert medium.spacing < small.spacing and medium.max_size < small.max_size
+    assert medium.detail == DetailLevel.SILHOUETTE
+    assert large.detail in (DetailLevel.BAR, DetailLevel.POINT)
+    # 所有槽位都在画布内
+    for layout in (small, medium, large):
+        assert layout.slot_x(0) >= 0 and layout.slot_x(layout.count - 1) <= layout.width
+    # 画布变矮时大小范围随之缩小
+    assert engine.compute(12, 1000, 200).max_size < small.max_size
+
+
+def test_apply_moves_existing_items():
+    """测试重新布局只移动或原地更新已有元素"""
+    canvas = FakeCanvas()
+    canvas._duck_sprites = SpriteCache(image_factory=FakeImage)
+    engine = LayoutEngine()
+    layout = engine.compute(12, 1000, 320)
+    ducks = DuckFactory.create_baby_ducks(canvas, layout.start_x, layout.duck_y, layout.spacing,
+                                          list(range(1, 13)), use_sprite=True,
+                                          detail=layout.detail, size_range=layout.size_range)
+    created = canvas.created
+
+    # 只变宽：大小不变，只移动
+    wider = engine.compute(12, 1200, 320)
+    engine.apply(wider, ducks)
+    assert canvas.created == created
+    assert len(canvas.moves) == 12 and canvas.count('coords') == 0
+    assert [duck.x for duck in ducks] == [wider.slot_x(i) for i in range(12)]
+
+    # 变矮：大小变化，原地更新坐标
+    shorter = engine.compute(12, 1200, 240)
+    engine.apply(shorter, ducks)
+    assert canvas.created == created
+    assert canvas.count('coords') > 0
+    assert abs(ducks[-1].size - shorter.max_size) < 1e-9
+    assert ducks[0].y == shorter.duck_y
+
+
+def test_min_spacing_scrolls():
+    """测试间距小于最小间距时场景比画布宽"""
+    engine = LayoutEngine(min_spacing=8)
+    assert not engine.compute(12, 1000, 320).scrolls
+    assert engine.compute(12, 1000, 320) == LayoutEngine().compute(12, 1000, 320)
+
+    layout = engine.compute(500, 1000, 320)
+    assert layout.scrolls and layout.spacing == 8
+    assert layout.scene_width == 8 * 499 + 2 * LayoutEngine.MIN_MARGIN
+    assert layout.slot_x(0) == LayoutEngine.MIN_MARGIN
+    assert layout.slot_x(499) == layout.scene_width - LayoutEngine.MIN_MARGIN
+    # 细节级别按场景中每只鸭子实际占有的宽度选择，母鸭在画布中央
+    assert layout.detail == DetailLevel.BAR
+    assert layout.mother_position == (500, 100)
+
+
+if __name__ == "__main__":
+    test_default_layout()
+    test_layout_scales_with_count()
+    test_apply_moves_existing_items()
+    test_min_spacing_scrolls()
+    print("所有测试完成！")
@@ -0,0 +1,150 @@
+"""
+测试排序流水线（有界前瞻缓冲区）的程序（无需图形界面）
+
+主要功能:
+- test_steps_sort_values: 测试排序事件按冒泡排序的顺序产生
+- test_back_pressure: 测试缓冲区满时生产者停止
+- test_bubble_sort_consumes_pipeline: 测试冒泡排序逐步消费流水线且统计准确
+- test_engine_consumes_without_after: 测试主线程通过空闲调度提前补充动画队列，不经过after往返
+- test_queued_swaps_do_not_teleport: 测试提前排队的交换在播放前不移动鸭子，停止时鸭子回到槽位
+
+主要函数:
+- test_steps_sort_values: 事件生成测试函数
+- test_back_pressure: 背压测试函数
+- test_bubble_sort_consumes_pipeline: 冒泡排序消费测试函数
+- test_engine_consumes_without_after: 提前补充队列测试函数
+- test_queued_swaps_do_not_teleport: 提前排队位置测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.bubble_sort import BubbleSort
+from algorithms.sort_pipeline import SortPipeline, StepKind, bubble_sort_steps
+from animation.animation_engine import AnimationEngine, VirtualClock
+from animation.sort_animation_integration import SortAnimationIntegration
+from src.duck_model import create_models
+from src.graphics import DuckFactory, MotherDuck
+from tests.fakes import FakeCanvas, run_main_loop
+
+
+def test_steps_sort_values():
+    """测试排序事件按冒泡排序的顺序产生"""
+    values = [4, 3, 1, 2]
+    steps = list(bubble_sort_steps(values))
+    assert values == [4, 3, 1, 2]  # 生产者只修改自己的副本
+    compares = [step for step in steps if step.kind == StepKind.COMPARE]
+    assert len(compares) == 6
+    assert [(step.index1, step.index2) for step in compares[:3]] == [(0, 1), (1, 2), (2, 3)]
+    assert sum(step.swap for step in compares) == 5  # 逆序对数量
+    assert [step.index1 for step in steps if step.kind == StepKind.PASS_END] == [3, 2, 1]
+
+
+def test_back_pressure():
+    """测试缓冲区满时生产者停止"""
+    pipeline = SortPipeline(bubble_sort_steps(list(range(50, 0, -1))), lookahead=8)
+    assert pipeline.get_buffered_count() == 0
+    pipeline.peek()
+    assert pipeline.get_buffered_count() == 8
+    assert pipeline.fill() == 0  # 已满，不再生产
+
+    taken = 0
+    while pipeline.take() is not None:
+        taken += 1
+        assert pipeline.get_buffered_count() <= 8
+        assert pipeline.produced_count - pipeline.consumed_count <= 8
+    assert taken == pipeline.produced_count == 50 * 49 // 2 + 49
+    assert pipeline.is_exhausted()
+
+
+def test_bubble_sort_consumes_pipeline():
+    """测试冒泡排序逐步消费流水线且统计准确"""
+    values = [5, 2, 9, 1, 7, 3]
+    sorter = BubbleSort(create_models(0, 0, 10, values), lookahead=4)
+    steps = 0
+    while True:
+        upcoming = sorter.peek_step()
+        if not sorter.step():
+            break
+        steps += 1
+        if upcoming.kind == StepKind.COMPARE:
+            assert sorter.get_current_comparison() == (upcoming.index1, upcoming.index2)
+        assert sorter.pipeline.get_buffered_count() <= 4
+    assert sorter.is_completed()
+    assert sorter.get_duck_values() == sorted(values)
+    assert [duck.value for duck in sorter.ducks] == sorted(values)
+    assert sorter.get_comparisons_count() == 15
+    assert sorter.get_swaps_count() == 8  # 逆序对数量
+    assert sorter.peek_step() is None
+
+    # 重置后从当前顺序重新生产
+    sorter.reset()
+    assert sorter.peek_step().index1 == 0
+    while sorter.step():
+        pass
+    assert sorter.get_swaps_count() == 0
+
+
+def test_engine_consumes_without_after():
+    """测试主线程通过空闲调度提前补充动画队列，不经过after往返"""
+    canvas = FakeCanvas()
+    ducks = DuckFactory.create_baby_ducks(canvas, 100, 200, 70, [4, 1, 3, 2])
+    mother = MotherDuck(canvas, 300, 100)
+    engine = AnimationEngine(canvas=canvas, clock=VirtualClock())
+    engine.set_backlog_policy(None)
+    integration = SortAnimationIntegration(BubbleSort(ducks), ducks, mother, engine)
+    integration.set_animation_speed(10.0)
+
+    # 第一步由测试执行（不启动引擎线程），之后由动画开始回调请求主线程补充
+    integration.bubble_sort.step()
+    assert not integration.is_playback_finished()
+    engine.step_frame(1 / 30)
+    assert len(canvas.idle) == 1  # 补充请求不重复调度
+    canvas.run_idle()
+    # 播放第一个动画时后续步骤已经排入队列
+    assert engine.get_queue_length() > 1
+    run_main_loop(engine, canvas, 1 / 30)
+    assert integration.is_sort_completed()
+    assert integration.is_playback_finished()  # 完成动画也已播放完毕
+    assert integration.bubble_sort.get_duck_values() == [1, 2, 3, 4]
+    assert [duck.x for duck in ducks] == [100, 170, 240, 310]
+    assert canvas.after_calls == []
+    assert engine.animation_thread is None
+
+
+def test_queued_swaps_do_not_teleport():
+    """测试提前排队的交换在播放前不移动鸭子，停止时鸭子回到槽位"""
+    canvas = FakeCanvas()
+    ducks = DuckFactory.create_baby_ducks(canvas, 100, 200, 70, [4, 3, 2, 1])
+    original = list(ducks)
+    mother = MotherDuck(canvas, 300, 100)
+    engine = AnimationEngine(canvas=canvas, clock=VirtualClock())
+    engine.set_backlog_policy(None)
+    integration = SortAnimationIntegration(BubbleSort(ducks), ducks, mother, engine)
+    integration.set_animation_speed(10.0)
+
+    integration.step_sort(restart_engine=False)
+    engine.step_frame(1 / 30)
+    canvas.run_idle()
+    sorter = integration.bubble_sort
+    assert sorter.get_swaps_count() > 1
+    # 排序已领先于播放，还没播放的交换不会让鸭子跳到新位置
+    assert [duck.x for duck in original] == [100, 170, 240, 310]
+
+    # 播放到下一个动画开始（请求了补充）时停止，停止前请求的补充失效
+    while not canvas.idle:
+        engine.step_frame(1 / 30)
+    integration.stop_animation()
+    canvas.run_idle()
+    assert engine.get_queue_length() == 0
+    assert [duck.x for duck in sorter.ducks] == [100, 170, 240, 310]
+
+
+if __name__ == "__main__":
+    test_steps_sort_values()
+    test_back_pressure()
+    test_bubble_sort_consumes_pipeline()
+    test_engine_consumes_without_after()
+    test_queued_swaps_do_not_teleport()
+    print("所有测试完成！")
@@ -0,0 +1,138 @@
+"""
+测试鸭子精灵图缓存的程序（无需图形界面）
+
+主要功能:
+- test_rasterize_layout: 测试栅格化结果以鸭子中心对称并包含各部分颜色
+- test_row_runs: 测试行程合并
+- test_cache_reuses_sprites: 测试相同档位和状态只栅格化一次
+- test_sprite_duck_items: 测试精灵图小鸭子只有两个画布元素且状态变化只切换图片
+- test_prewarm_sprites: 测试创建后提前分批生成各状态的精灵图，排序时不再栅格化
+- test_sprite_pulse: 测试精灵图小鸭子的脉冲换成放大的精灵图并在结束时恢复
+
+主要函数:
+- test_rasterize_layout: 栅格化测试函数
+- test_row_runs: 行程合并测试函数
+- test_cache_reuses_sprites: 缓存测试函数
+- test_sprite_duck_items: 精灵图小鸭子测试函数
+- test_prewarm_sprites: 精灵图预生成测试函数
+- test_sprite_pulse: 精灵图脉冲测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.sprites import (SpriteCache, rasterize_baby_duck, row_runs, size_bucket,
+                         BODY_OUTLINE, EYE_COLOR)
+from src.graphics import BabyDuck, DetailLevel, DuckFactory
+from animation.animation_engine import AnimationEngine, VirtualClock
+from animation.animators import HighlightAnimator
+from tests.fakes import FakeCanvas, FakeImage
+
+
+def test_rasterize_layout():
+    """测试栅格化结果以鸭子中心对称并包含各部分颜色"""
+    raster = rasterize_baby_duck(40, "#FFD700")
+    assert raster.width == raster.origin_x * 2
+    assert raster.height == raster.origin_y * 2
+    assert len(raster.rows) == raster.height
+    assert all(len(row) == raster.width for row in raster.rows)
+
+    # 四角透明，身体中心为身体颜色
+    assert raster.rows[0][0] is None and raster.rows[-1][-1] is None
+    assert raster.rows[raster.origin_y][raster.origin_x - 10] == "#FFD700"
+    colors = {color for row in raster.rows for color in row}
+    assert BODY_OUTLINE in colors and EYE_COLOR in colors
+
+    # 不同状态只改变颜色，不改变尺寸
+    sorted_raster = rasterize_baby_duck(40, "#32CD32", 4)
+    assert (sorted_raster.width, sorted_raster.height) == (raster.width, raster.height)
+
+
+def test_row_runs():
+    """测试行程合并"""
+    row = [None, "a", "a", "b", None, None, "b"]
+    assert row_runs(row) == [(1, 3, "a"), (3, 4, "b"), (6, 7, "b")]
+    assert row_runs([None, None]) == []
+
+
+def test_cache_reuses_sprites():
+    """测试相同档位和状态只栅格化一次"""
+    cache = SpriteCache(image_factory=FakeImage)
+    image = cache.get(30.2, "#FFD700")
+    assert cache.get(29.9, "#FFD700") is image  # 同一大小档位
+    assert size_bucket(30.2) == size_bucket(29.9) == 30
+    assert cache.get(30, "#00CED1", 3) is not image
+    assert len(cache) == 2
+
+    # 每次put写入一行中一段相同颜色的像素
+    assert image.puts
+    for color, (x1, y1, x2, y2) in image.puts:
+        assert y2 == y1 + 1 and x2 > x1
+
+
+def test_sprite_duck_items():
+    """测试精灵图小鸭子只有两个画布元素且状态变化只切换图片"""
+    canvas = FakeCanvas()
+    canvas._duck_sprites = SpriteCache(image_factory=FakeImage)
+    duck = BabyDuck(canvas, 200, 200, 40, 7, use_sprite=True)
+    assert len(duck.graphic_elements) == 2
+    kinds = sorted(data['kind'] for data in canvas.items.values())
+    assert kinds == ['image', 'text']
+
+    duck.set_comparing(True)
+    assert canvas.configs == [(duck.tag + "_sprite", {'image': canvas._duck_sprites.get(40, duck.COMPARING_COLOR, 3)})]
+
+
+
+def test_prewarm_sprites():
+    """测试创建后提前分批生成各状态的精灵图，排序时不再栅格化"""
+    canvas = FakeCanvas()
+    cache = canvas._duck_sprites = SpriteCache(image_factory=FakeImage)
+    ducks = DuckFactory.create_baby_ducks(canvas, 100, 300, 70, [5, 40, 80, 100], use_sprite=True,
+                                          detail=DetailLevel.FULL)
+    buckets = {size_bucket(duck.size) for duck in ducks}
+    assert len(cache) == len(buckets)  # 绘制时只生成了普通状态
+
+    pending = DuckFactory.prewarm_sprites(ducks, chunk_size=2)
+    assert pending == 3 * len(buckets)
+    assert len(cache) == len(buckets) + 2  # 第一批立即生成，其余在空闲时生成
+    canvas.run_idle()
+    assert len(cache) == 4 * len(buckets)
+    assert DuckFactory.prewarm_sprites(ducks) == 0
+
+    for duck in ducks:
+        duck.set_comparing(True)
+        duck.highlight(True)
+        duck.set_sorted(True)
+    assert len(cache) == 4 * len(buckets)
+
+
+def test_sprite_pulse():
+    """测试精灵图小鸭子的脉冲换成放大的精灵图并在结束时恢复"""
+    canvas = FakeCanvas()
+    cache = canvas._duck_sprites = SpriteCache(image_factory=FakeImage)
+    duck = BabyDuck(canvas, 200, 200, 40, 7, use_sprite=True)
+    sprite = canvas.find_withtag(duck.tag + "_sprite")[0]
+    original = canvas.items[sprite]['image']
+
+    engine = AnimationEngine(canvas=canvas, clock=VirtualClock())
+    engine.add_animation(HighlightAnimator(engine).pulse(duck, 1.0, 1.2))
+    rendered = len(cache)  # 创建脉冲动画时已生成所需的精灵图
+    images = set()
+    while engine.step_frame(0.05):
+        images.add(canvas.items[sprite]['image'])
+    assert cache.get(48, duck.BODY_COLOR) in images
+    assert len(cache) == rendered
+    assert canvas.items[sprite]['image'] is original
+    assert duck.pulse_scale == 1.0
+
+
+if __name__ == "__main__":
+    test_rasterize_layout()
+    test_row_runs()
+    test_cache_reuses_sprites()
+    test_sprite_duck_items()
+    test_prewarm_sprites()
+    test_sprite_pulse()
+    print("所有测试完成！")
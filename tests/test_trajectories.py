@@ -0,0 +1,96 @@
+"""
+测试交换轨迹生成和不重叠保证的程序（无需图形界面）
+
+该测试替代通过实际播放动画检查重叠的方式：轨迹在生成时已经解析检查，
+这里对各种距离和鸭子大小组合密集采样，确认保证成立。
+
+主要功能:
+- test_no_overlap_for_all_pairs: 测试所有距离和大小组合的轨迹都不会重叠
+- test_trajectories_are_cached: 测试轨迹按量化后的(距离, 大小1, 大小2)缓存
+- test_swap_lands_exactly: 测试交换动画精确落在对方的起点
+
+主要函数:
+- test_no_overlap_for_all_pairs: 不重叠测试函数
+- test_trajectories_are_cached: 轨迹缓存测试函数
+- test_swap_lands_exactly: 交换终点测试函数
+"""
+
+import sys
+import os
+import math
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation.animation_engine import AnimationEngine, VirtualClock
+from animation.animators import SwapAnimator
+from animation.trajectories import (TrajectoryCache, collision_radius, get_swap_trajectory,
+                                    KEYFRAME_COUNT, LIFTOFF_RATIO)
+from tests.fakes import MockDuck
+
+
+def test_no_overlap_for_all_pairs():
+    """测试所有距离和大小组合的轨迹都不会重叠"""
+    cache = TrajectoryCache()
+    for dx in (30, 60, 80, 120, -80, 400):
+        for size1 in (20, 35, 50):
+            for size2 in (20, 35, 50):
+                trajectory = cache.get(dx, size1, size2)
+                required = cache.get_required_distance(dx, size1, size2)
+                assert required == collision_radius(size1) + collision_radius(size2) + cache.clearance
+                # 起点距离足够时整条轨迹满足间距，不足时只在起飞和落地阶段不满足
+                assert trajectory.clearance_met == (abs(dx) >= trajectory.required_distance)
+                assert trajectory.airborne_min_distance >= required - 1e-9
+                assert trajectory.min_distance >= min(required, abs(dx)) - 1e-9
+                # 密集采样验证解析结果
+                liftoff = int(KEYFRAME_COUNT * LIFTOFF_RATIO) / (KEYFRAME_COUNT - 1)
+                for i in range(1001):
+                    progress = i / 1000
+                    x1, y1, x2, y2 = trajectory.offsets_at(progress)
+                    distance = math.hypot(dx + x2 - x1, y2 - y1)
+                    assert distance >= min(required, abs(dx)) - 1e-6
+                    if liftoff <= progress <= 1 - liftoff:
+                        assert distance >= required - 1e-6
+
+    # 起点距离足够时，整条轨迹上包围圆之间都保留间隙
+    trajectory = cache.get(120, 50, 50)
+    assert trajectory.clearance_met
+    assert trajectory.min_distance >= 2 * collision_radius(50) + cache.clearance - 1e-9
+
+
+def test_trajectories_are_cached():
+    """测试轨迹按量化后的(距离, 大小1, 大小2)缓存"""
+    cache = TrajectoryCache()
+    first = cache.get(80, 30, 40)
+    assert cache.get(80, 30, 40) is first
+    assert cache.get(80, 40, 30) is not first
+    assert len(cache) == 2
+
+    # 布局变化产生的微小差异落在同一个0.5像素档位上
+    resized = cache.get(80.1, 30.2, 40.4)
+    assert cache.get(79.9, 30.4, 40.1) is resized
+    assert len(cache) == 3
+    # 大小向上取整，间距按较大的包围圆保证
+    assert resized.required_distance >= cache.get_required_distance(80.1, 30.2, 40.4)
+    assert get_swap_trajectory(80, 30, 40) is get_swap_trajectory(80.0, 30, 40)
+
+
+def test_swap_lands_exactly():
+    """测试交换动画精确落在对方的起点"""
+    engine = AnimationEngine(canvas=None, clock=VirtualClock())
+    duck1, duck2 = MockDuck(100.0, 250.0, 30), MockDuck(183.3, 250.0, 45)
+    engine.add_animation(SwapAnimator(engine).swap_ducks(duck1, duck2, 0.5))
+
+    engine.step_frame(0.0)
+    engine.step_frame(0.25)
+    # 中点时两只鸭子都在起点上方
+    assert duck1.y < 250 and duck2.y < 250 and duck1.y < duck2.y
+
+    engine.run_until_idle(1 / 60)
+    assert (duck1.x, duck1.y) == (183.3, 250.0)
+    assert (duck2.x, duck2.y) == (100.0, 250.0)
+
+
+if __name__ == "__main__":
+    test_no_overlap_for_all_pairs()
+    test_trajectories_are_cached()
+    test_swap_lands_exactly()
+    print("所有测试完成！")
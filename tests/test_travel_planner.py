@@ -0,0 +1,69 @@
+"""
+测试母鸭行程规划的程序（无需图形界面）
+
+主要功能:
+- test_walk_time_scales_with_distance: 测试行走时间随距离缩放，零距离时跳过
+- test_swap_tail_prewalk: 测试交换尾段提前行走后下一次比较不再行走
+
+主要函数:
+- test_walk_time_scales_with_distance: 行走时间测试函数
+- test_swap_tail_prewalk: 交换尾段提前行走测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.bubble_sort import BubbleSort
+from animation.animation_engine import AnimationEngine, AnimationType, VirtualClock
+from animation.animators import MotherTravelPlanner
+from animation.sort_animation_integration import SortAnimationIntegration
+from tests.fakes import FakeCanvas, MockDuck
+
+
+def test_walk_time_scales_with_distance():
+    """测试行走时间随距离缩放，零距离时跳过"""
+    planner = MotherTravelPlanner(MockDuck(100, 100), full_walk_distance=300)
+    assert planner.plan_walk(100, 100, 0.6) == 0.0
+    assert abs(planner.plan_walk(250, 100, 0.6) - 0.3) < 1e-9
+    assert planner.get_planned_position() == (250, 100)
+    assert planner.plan_walk(1000, 100, 0.6) == 0.6
+    # 很短的距离也保留最短行走时间
+    assert abs(planner.plan_walk(1001, 100, 0.6) - 0.6 * planner.min_walk_ratio) < 1e-9
+    planner.reset()
+    assert planner.get_planned_position() == (100, 100)
+
+
+def test_swap_tail_prewalk():
+    """测试交换尾段提前行走后下一次比较不再行走"""
+    ducks = [MockDuck(150 + 100 * i, 250, value=value) for i, value in enumerate([5, 1, 2, 3])]
+    mother = MockDuck(600, 100, size=60)
+    engine = AnimationEngine(canvas=FakeCanvas(), clock=VirtualClock())
+    engine.set_backlog_policy(None)
+    integration = SortAnimationIntegration(BubbleSort(ducks), ducks, mother, engine)
+    # 由测试逐步驱动排序，队列为空时不自动消费下一步
+    integration.use_pipeline = False
+
+    walk_ends = []
+    for _ in range(3):
+        # 直接执行排序的一步（不启动引擎线程），由虚拟时钟逐帧回放
+        integration.bubble_sort.step()
+        queued = list(engine.animation_queue)
+        compare = [anim for anim in queued if anim.type == AnimationType.COMPARE][0]
+        walk_ends.append(compare.params[10])
+        swap = [anim for anim in queued if anim.type == AnimationType.SWAP][0]
+        assert swap.params[-1] is not None or len(walk_ends) == 3
+        engine.run_until_idle(1 / 30)
+        # 交换结束时母鸭已经站在下一次比较的位置
+        assert (mother.x, mother.y) == integration.travel_planner.get_planned_position()
+
+    # 第一次比较需要从远处走过来，之后的比较都已在交换尾段走到位
+    assert walk_ends[0] > 0
+    assert walk_ends[1:] == [0.0, 0.0]
+    assert integration.bubble_sort.get_duck_values() == [1, 2, 3, 5]
+
+
+if __name__ == "__main__":
+    test_walk_time_scales_with_distance()
+    test_swap_tail_prewalk()
+    print("所有测试完成！")
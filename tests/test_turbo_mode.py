@@ -0,0 +1,127 @@
+"""
+测试快速播放模式的程序（无需图形界面）
+
+主要功能:
+- test_turbo_batches_steps: 测试快速播放预先算好各帧的批量步骤，每帧只提交最终位置
+- test_turbo_completes_with_exact_statistics: 测试快速播放排序完成后统计准确
+- test_turbo_switch_off_resumes_animation: 测试关闭快速播放后恢复正常的排序动画
+
+主要函数:
+- test_turbo_batches_steps: 批量应用测试函数
+- test_turbo_completes_with_exact_statistics: 统计准确性测试函数
+- test_turbo_switch_off_resumes_animation: 关闭快速播放测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from itertools import islice
+
+from algorithms.bubble_sort import BubbleSort
+from algorithms.sort_pipeline import StepKind, bubble_sort_steps
+from animation.animation_engine import AnimationEngine, VirtualClock
+from animation.sort_animation_integration import SortAnimationIntegration
+from src.graphics import DuckFactory, MotherDuck
+from tests.fakes import FakeCanvas, run_main_loop
+
+
+def _make_integration(values):
+    """创建使用虚拟时钟的排序动画集成，返回集成对象、小鸭子和画布"""
+    canvas = FakeCanvas()
+    ducks = DuckFactory.create_baby_ducks(canvas, 100, 200, 20, values)
+    mother = MotherDuck(canvas, 300, 100)
+    engine = AnimationEngine(canvas=canvas, clock=VirtualClock())
+    engine.set_backlog_policy(None)
+    integration = SortAnimationIntegration(BubbleSort(ducks), ducks, mother, engine)
+    integration.set_animation_speed(10.0)
+    return integration, ducks, canvas
+
+
+def _compares(values, count):
+    """返回冒泡排序前count步中的比较步骤"""
+    return [step for step in islice(bubble_sort_steps(values), count) if step.kind == StepKind.COMPARE]
+
+
+def test_turbo_batches_steps():
+    """测试快速播放预先算好各帧的批量步骤，每帧只提交最终位置"""
+    values = list(range(30, 0, -1))
+    integration, ducks, canvas = _make_integration(values)
+    engine = integration.engine
+    original = list(ducks)
+    slots = [(duck.x, duck.y) for duck in ducks]
+    integration.set_turbo(True, steps_per_frame=50)
+    frames = SortAnimationIntegration.TURBO_FRAMES_PER_ANIMATION
+
+    integration.step_sort(restart_engine=False)
+    assert engine.get_queue_length() == 1  # 只有一个快速播放动画，没有过渡动画
+
+    # 排序步骤在主线程中已经执行，统计立即准确
+    sorter = integration.bubble_sort
+    compares = _compares(values, frames * 50)
+    assert sorter.get_comparisons_count() == len(compares)
+    assert sorter.get_swaps_count() == sum(step.swap for step in compares)
+    # 还没有播放时鸭子留在原位（列表顺序已经改变）
+    assert [(duck.x, duck.y) for duck in original] == slots
+
+    # 每帧只提交一批：一帧内被交换多次的鸭子只移动一次（每只鸭子和母鸭最多一次画布移动）
+    while engine.get_queue_length() or engine.current_animation is not None:
+        canvas.moves.clear()
+        engine.step_frame()
+        assert len(canvas.moves) <= len(ducks) + 1
+
+    # 每只鸭子都直接停在列表位置对应的坐标上
+    assert [(duck.x, duck.y) for duck in sorter.ducks] == slots
+    assert [duck.value for duck in sorter.ducks] == sorter.get_duck_values()
+    # 只有最后比较的一对鸭子处于比较状态
+    comparing = [index for index, duck in enumerate(sorter.ducks) if duck.is_comparing]
+    assert comparing == [compares[-1].index1, compares[-1].index2]
+
+
+def test_turbo_completes_with_exact_statistics():
+    """测试快速播放排序完成后统计准确"""
+    values = [7, 3, 9, 1, 8, 2, 6, 4, 10, 5]
+    integration, ducks, canvas = _make_integration(values)
+    slots = [duck.x for duck in ducks]
+    integration.set_turbo(True, steps_per_frame=8)
+
+    integration.step_sort(restart_engine=False)
+    run_main_loop(integration.engine, canvas, 1 / 30)
+
+    stats = integration.get_sort_statistics()
+    inversions = sum(1 for i in range(len(values)) for j in range(i + 1, len(values)) if values[i] > values[j])
+    assert stats['completed']
+    assert stats['comparisons'] == len(values) * (len(values) - 1) // 2
+    assert stats['swaps'] == inversions
+    sorted_ducks = integration.bubble_sort.ducks
+    assert [duck.value for duck in sorted_ducks] == sorted(values)
+    assert [duck.x for duck in sorted_ducks] == slots
+    assert all(duck.is_sorted and not duck.is_comparing for duck in sorted_ducks)
+
+
+def test_turbo_switch_off_resumes_animation():
+    """测试关闭快速播放后恢复正常的排序动画"""
+    values = [5, 1, 4, 2, 3, 6]
+    integration, ducks, canvas = _make_integration(values)
+    slots = [duck.x for duck in ducks]
+    integration.set_turbo(True, steps_per_frame=3)
+
+    integration.step_sort(restart_engine=False)
+    frames = SortAnimationIntegration.TURBO_FRAMES_PER_ANIMATION
+    assert integration.bubble_sort.get_comparisons_count() == len(_compares(values, frames * 3))
+
+    integration.set_turbo(False)
+    run_main_loop(integration.engine, canvas, 1 / 30)
+    sorter = integration.bubble_sort
+    assert sorter.is_completed()
+    assert sorter.get_comparisons_count() == 15
+    assert sorter.get_swaps_count() == 6
+    assert [duck.x for duck in sorter.ducks] == slots
+    assert not any(duck.is_comparing for duck in sorter.ducks)
+
+
+if __name__ == "__main__":
+    test_turbo_batches_steps()
+    test_turbo_completes_with_exact_statistics()
+    test_turbo_switch_off_resumes_animation()
+    print("所有测试完成！")
@@ -0,0 +1,116 @@
+"""
+测试虚拟时钟与逐帧回放的程序（无需图形界面）
+
+主要功能:
+- test_virtual_clock_advance: 测试虚拟时钟只在显式推进时流逝
+- test_step_frame_progress: 测试逐帧推进时动画进度是确定的
+- test_run_until_idle: 测试一次性回放整个动画队列并触发回调
+- test_frame_metrics: 测试逐帧推进时性能统计的帧时间和掉帧数
+
+主要函数:
+- test_virtual_clock_advance: 虚拟时钟测试函数
+- test_step_frame_progress: 逐帧推进测试函数
+- test_run_until_idle: 完整回放测试函数
+- test_frame_metrics: 性能统计测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation.animation_engine import AnimationEngine, VirtualClock, AnimationState
+from tests.fakes import MockDuck
+
+
+def test_virtual_clock_advance():
+    """测试虚拟时钟只在显式推进时流逝"""
+    clock = VirtualClock()
+    assert clock.time() == 0.0
+
+    clock.advance(0.5)
+    clock.sleep(0.25)
+    assert clock.time() == 0.75
+
+    # 时间不会倒流
+    clock.advance(-1.0)
+    assert clock.time() == 0.75
+
+
+def test_step_frame_progress():
+    """测试逐帧推进时动画进度是确定的"""
+    clock = VirtualClock()
+    engine = AnimationEngine(canvas=None, clock=clock, frame_interval=0.1)
+    duck = MockDuck(0, 0)
+
+    engine.add_animation(engine.create_move_animation(duck, (0, 0), (100, 0), 1.0))
+
+    # 第一帧开始动画，进度为0
+    engine.step_frame(0.0)
+    assert duck.x == 0
+
+    # 每帧推进0.25秒
+    engine.step_frame(0.25)
+    assert abs(duck.x - 25) < 1e-9
+    engine.step_frame(0.25)
+    assert abs(duck.x - 50) < 1e-9
+
+    # 推进到结束
+    has_more = engine.step_frame(0.5)
+    assert duck.x == 100
+    assert not has_more
+
+
+def test_run_until_idle():
+    """测试一次性回放整个动画队列并触发回调"""
+    clock = VirtualClock()
+    engine = AnimationEngine(canvas=None, clock=clock)
+    duck = MockDuck(0, 0)
+
+    completed = []
+    queue_empty = []
+    engine.set_callbacks(
+        on_animation_complete=lambda anim: completed.append(anim.type),
+        on_queue_empty=lambda: queue_empty.append(True)
+    )
+
+    for target_x in (100, 200, 300):
+        engine.add_animation(engine.create_move_animation(duck, (duck.x, 0), (target_x, 0), 2.0))
+
+    frames = engine.run_until_idle()
+
+    # 三个2秒的动画按60帧每秒推进，约需360帧，与真实时间无关
+    assert 300 < frames < 400
+    assert duck.x == 300
+    assert len(completed) == 3
+    assert queue_empty
+    assert engine.state == AnimationState.IDLE
+
+
+def test_frame_metrics():
+    """测试逐帧推进时性能统计的帧时间和掉帧数"""
+    clock = VirtualClock()
+    engine = AnimationEngine(canvas=None, clock=clock, frame_interval=0.02)
+    duck = MockDuck(0, 0)
+    engine.add_animation(engine.create_move_animation(duck, (0, 0), (100, 0), 1.0))
+
+    for _ in range(10):
+        engine.step_frame(0.02)
+    # 一帧耗时0.1秒，相当于掉了4帧
+    engine.step_frame(0.1)
+
+    metrics = engine.get_metrics()
+    assert metrics['frames'] == 10
+    assert metrics['dropped_frames'] == 4
+    assert abs(metrics['max_frame_ms'] - 100) < 1e-6
+    assert metrics['callbacks']['update:move']['count'] == 11
+
+    engine.reset_metrics()
+    assert engine.get_metrics()['frames'] == 0
+
+
+if __name__ == "__main__":
+    test_virtual_clock_advance()
+    test_step_frame_progress()
+    test_run_until_idle()
+    test_frame_metrics()
+    print("所有测试完成！")
@@ -0,0 +1,177 @@
+"""
+测试可滚动虚拟场景的程序（无需图形界面）
+
+主要功能:
+- test_item_count_bounded: 测试画布元素数量只取决于视口宽度
+- test_scroll_recycles_items: 测试滚动时复用离开视口的元素
+- test_follow_scrolls_to_target: 测试视口跟随比较位置
+- test_detached_duck_has_no_canvas_calls: 测试没有画布元素的小鸭子移动时不调用画布
+- test_sprite_items_refit: 测试精灵图小鸭子接管元素后原地更新图片和数值
+- test_scrollbar_keeps_pinned_items: 测试滚动条滚动时装饰层和母鸭固定在视口中
+- test_metrics_overlay_stays_in_view: 测试场景滚动后性能浮层仍在视口角落
+
+主要函数:
+- test_item_count_bounded: 元素数量测试函数
+- test_scroll_recycles_items: 元素复用测试函数
+- test_follow_scrolls_to_target: 视口跟随测试函数
+- test_detached_duck_has_no_canvas_calls: 无元素移动测试函数
+- test_sprite_items_refit: 精灵图元素更新测试函数
+- test_scrollbar_keeps_pinned_items: 固定元素测试函数
+- test_metrics_overlay_stays_in_view: 性能浮层位置测试函数
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation.engine_metrics import EngineMetrics, MetricsOverlay
+from src.graphics import BabyDuck, DetailLevel, MotherDuck
+from src.duck_model import create_models
+from src.sprites import SpriteCache
+from src.virtual_scene import VirtualScene
+from tests.fakes import FakeCanvas, FakeImage
+
+
+def _make_scene(count: int = 5000, spacing: float = 20, detail=DetailLevel.BAR):
+    """创建未绘制的小鸭子和虚拟场景"""
+    canvas = FakeCanvas()
+    ducks = [BabyDuck(canvas, model.x, model.y, model.size, model.value, detail=detail,
+                      footprint=spacing, model=model, draw=False)
+             for model in create_models(50, 300, spacing, list(range(count)))]
+    return canvas, ducks, VirtualScene(canvas, ducks, 50, spacing, margin=100)
+
+
+def test_item_count_bounded():
+    """测试画布元素数量只取决于视口宽度"""
+    canvas, ducks, scene = _make_scene()
+    assert canvas.created == 0
+    scene.update()
+    first, last = scene.get_visible_range()
+    assert first == 0
+    # 视口1000像素加两侧各100像素，间距20像素
+    assert last - first <= (1000 + 200) // 20 + 2
+    assert scene.get_drawn_count() == last - first
+    assert len(canvas.items) == last - first
+
+
+def test_scroll_recycles_items():
+    """测试滚动时复用离开视口的元素"""
+    canvas, ducks, scene = _make_scene()
+    scene.scroll_to(20000)
+    created = canvas.created
+    count = len(canvas.items)
+
+    scene.scroll_to(50000)
+    assert canvas.created == created  # 全部复用，没有新建元素
+    assert len(canvas.items) == count
+    first, last = scene.get_visible_range()
+    for duck in ducks[first:last]:
+        assert duck.is_drawn()
+        item = duck.graphic_elements[0]
+        assert canvas.items[item]['coords'] == duck._bar_coords()
+    assert not ducks[0].is_drawn()
+
+
+def test_follow_scrolls_to_target():
+    """测试视口跟随比较位置"""
+    canvas, ducks, scene = _make_scene()
+    scene.follow(500)
+    assert scene.scroll_x == 0  # 已在视口中部
+    scene.follow(ducks[3000].x)
+    left, right = scene.get_viewport()
+    assert left < ducks[3000].x < right
+    assert ducks[3000].is_drawn()
+
+
+def test_detached_duck_has_no_canvas_calls():
+    """测试没有画布元素的小鸭子移动时不调用画布"""
+    canvas, ducks, scene = _make_scene()
+    duck = ducks[4000]
+    calls = canvas.calls
+    duck.move_to(duck.x + 20, duck.y)
+    duck.set_comparing(True)
+    assert canvas.calls == calls
+    # 场景比画布宽时，移动不会被限制在画布宽度内
+    assert duck.x > 1000
+
+
+def test_sprite_items_refit():
+    """测试精灵图小鸭子接管元素后原地更新图片和数值"""
+    canvas = FakeCanvas()
+    canvas._duck_sprites = SpriteCache(image_factory=FakeImage)
+    donor = BabyDuck(canvas, 100, 200, 20, 3, use_sprite=True)
+    duck = BabyDuck(canvas, 900, 200, 44, 77, use_sprite=True, draw=False)
+    created = canvas.created
+
+    duck.take_items(donor)
+    assert canvas.created == created
+    assert not donor.is_drawn() and duck.is_drawn()
+    sprite, label = duck.graphic_elements
+    assert canvas.items[sprite]['coords'] == [900, 200]
+    assert canvas.items[sprite]['image'] is canvas._duck_sprites.get(44, BabyDuck.BODY_COLOR, 2)
+    assert canvas.items[label]['text'] == "77"
+
+
+def test_scrollbar_keeps_pinned_items():
+    """测试滚动条滚动时装饰层和母鸭固定在视口中"""
+    canvas, ducks, scene = _make_scene()
+    decoration = canvas.create_line(0, 20, 1000, 20, tags=("decoration",))
+    mother = MotherDuck(canvas, 500, 100)
+    scene.pin("decoration")
+    scene.pin_duck(mother)
+    assert ('configure', {'scrollregion': (0, 0, int(scene.scene_width), 600)}) in canvas.calls
+
+    scene.xview('moveto', 0.5)
+    assert scene.scroll_x == scene.scene_width * 0.5
+    assert ('xview_moveto', 0.5) in canvas.calls
+    assert canvas.items[decoration]['coords'] == [scene.scroll_x, 20, scene.scroll_x + 1000, 20]
+    assert mother.x == scene.scroll_x + 500
+
+    scene.xview('scroll', 1, 'pages')
+    assert canvas.items[decoration]['coords'][0] == scene.scroll_x
+    assert mother.x == scene.scroll_x + 500
+
+    # 跟随比较位置时母鸭正走向目标，不随视口移动
+    scene.follow(ducks[100].x)
+    assert canvas.items[decoration]['coords'][0] == scene.scroll_x
+    assert mother.x != scene.scroll_x + 500
+    left, right = scene.get_viewport()
+    assert left < ducks[100].x < right
+
+
+
+def test_metrics_overlay_stays_in_view():
+    """测试场景滚动后性能浮层仍在视口角落"""
+    canvas, ducks, scene = _make_scene()
+    overlay = MetricsOverlay(canvas, EngineMetrics())
+    overlay.show()
+    item = overlay._text_item
+    assert canvas.items[item]['coords'] == [10, 10]
+
+    # 固定在视口中的浮层随滚动移动
+    scene.pin(MetricsOverlay.TAG)
+    scene.scroll_to(3000)
+    assert canvas.canvasx(0) == 3000
+    assert canvas.items[item]['coords'] == [3010, 10]
+
+    # 没有固定时每次刷新按视口重新放置
+    overlay.hide()
+    canvas, ducks, scene = _make_scene()
+    overlay = MetricsOverlay(canvas, EngineMetrics())
+    overlay.show()
+    scene.scroll_to(5000)
+    assert canvas.items[overlay._text_item]['coords'] == [10, 10]
+    delay, refresh, args = canvas.after_calls[-1]
+    refresh(*args)
+    assert canvas.items[overlay._text_item]['coords'] == [5010, 10]
+
+
+if __name__ == "__main__":
+    test_item_count_bounded()
+    test_scroll_recycles_items()
+    test_follow_scrolls_to_target()
+    test_detached_duck_has_no_canvas_calls()
+    test_sprite_items_refit()
+    test_scrollbar_keeps_pinned_items()
+    test_metrics_overlay_stays_in_view()
+    print("所有测试完成！")